@@ -72,12 +72,22 @@ do_build ()
 
     cp  $TOP_DIR/ramdisk/secure_init.sh root_fs_overlay/usr/bin/
     chmod +x root_fs_overlay/usr/bin/secure_init.sh
-    cp  $TOP_DIR/ramdisk/device_driver_sr.sh root_fs_overlay/usr/bin/
-    chmod +x root_fs_overlay/usr/bin/device_driver_sr.sh
+    cp  $TOP_DIR/ramdisk/sysfs_snapshot.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/sysfs_snapshot.py
+    cp  $TOP_DIR/ramdisk/acpi_disassemble.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/acpi_disassemble.py
+    cp  $TOP_DIR/ramdisk/results_writer.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/results_writer.py
+    cp  $TOP_DIR/ramdisk/linux_phase.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/linux_phase.py
+    cp  $TOP_DIR/ramdisk/kmsg_capture.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/kmsg_capture.py
+    cp  $TOP_DIR/ramdisk/fwts_shards.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/fwts_shards.py
     cp  $TOP_DIR/ramdisk/linux_init.sh root_fs_overlay/usr/bin/
     chmod +x root_fs_overlay/usr/bin/linux_init.sh
-    cp  $TOP_DIR/ramdisk/linux_dump.sh root_fs_overlay/usr/bin/
-    chmod +x root_fs_overlay/usr/bin/linux_dump.sh
+    cp  $TOP_DIR/ramdisk/linux_dump.py root_fs_overlay/usr/bin/
+    chmod +x root_fs_overlay/usr/bin/linux_dump.py
     cp  $TOP_DIR/ramdisk/ethtool-test.py root_fs_overlay/usr/bin/
     chmod +x root_fs_overlay/usr/bin/ethtool-test.py
     cp  $TOP_DIR/ramdisk/read_write_check_blk_devices.py root_fs_overlay/usr/bin/
@@ -157,6 +157,7 @@ copy_recipes()
     cp $TOP_DIR/../../common/linux_scripts/runtime_device_mapping_conflict_checker.py $TOP_DIR/meta-woden/recipes-acs/install-files/files
     cp $TOP_DIR/../../common/linux_scripts/ethtool-test.py $TOP_DIR/meta-woden/recipes-acs/install-files/files
     cp $TOP_DIR/../../common/linux_scripts/read_write_check_blk_devices.py $TOP_DIR/meta-woden/recipes-acs/install-files/files
+    cp $TOP_DIR/../../common/linux_scripts/kmsg_capture.py $TOP_DIR/meta-woden/recipes-acs/install-files/files
 
     cp -r $TOP_DIR/../../common/log_parser $TOP_DIR/meta-woden/recipes-acs/install-files/files/
     popd
@@ -184,8 +184,7 @@ if [ $ADDITIONAL_CMD_OPTION != "noacs" ]; then
           echo "Running Linux BSA tests"
           insmod /lib/modules/*/kernel/bsa_acs/bsa_acs.ko
           echo "$DT_VERSION" > /mnt/acs_results_template/acs_results/linux_acs/bsa_acs_app/BSALinuxResults.log
-          bsa --skip-dp-nic-ms >> /mnt/acs_results_template/acs_results/linux_acs/bsa_acs_app/BSALinuxResults.log
-          dmesg | sed -n 'H; /PE_INFO/h; ${g;p;}' > /mnt/acs_results_template/acs_results/linux_acs/bsa_acs_app/BsaResultsKernel.log
+          python3 /usr/bin/kmsg_capture.py --output /mnt/acs_results_template/acs_results/linux_acs/bsa_acs_app/BsaResultsKernel.log -- bsa --skip-dp-nic-ms >> /mnt/acs_results_template/acs_results/linux_acs/bsa_acs_app/BSALinuxResults.log
           sync
           sleep 5
           echo "Linux BSA test execution - Completed"
@@ -274,7 +273,7 @@ if [ $ADDITIONAL_CMD_OPTION != "noacs" ]; then
         # update resolv.conf with 8.8.8.8 DNS server
         echo "nameserver 8.8.8.8" >> /etc/resolv.conf
         # run ethtool-test.py, dump ethernet information, run self-tests if supported, and ping
-        python3 /bin/ethtool-test.py /mnt/acs_tests/config/system_config.txt | tee ethtool-test.log
+        python3 /bin/ethtool-test.py --jobs 4 /mnt/acs_tests/config/system_config.txt | tee ethtool-test.log
         # remove color characters from log and save
         awk '{gsub(/\x1B\[[0-9;]*[JKmsu]/, "")}1' ethtool-test.log > /mnt/acs_results_template/acs_results/linux_tools/ethtool-test.log
         sync
@@ -347,36 +346,12 @@ if [ $ADDITIONAL_CMD_OPTION != "noacs" ]; then
         before_update_log="/mnt/acs_results_template/fw/CapsuleApp_ESRT_table_info_before_update.log"
         after_update_log="/mnt/acs_results_template/fw/CapsuleApp_ESRT_table_info_after_update.log"
 
-        i=0
-        for val in $(python3 "$extract_script_path" "$fw_class_pattern" "$before_update_log" | tr '\n' ' '); do
-          eval "fw_class_$i='$val'"
-          i=$((i+1))
-        done
-
-        i=0
-        for val in $(python3 "$extract_script_path" "$fw_guid" "$before_update_log" | tr '\n' ' '); do
-          eval "fw_guid_$i='$val'"
-          i=$((i+1))
-        done
-
-        i=0
-        for val in $(python3 "$extract_script_path" "$fw_pattern" "$before_update_log" | tr '\n' ' '); do
-          eval "prev_fw_$i='$val'"
-          i=$((i+1))
-        done
-        entry_count=$i
-
-        i=0
-        for val in $(python3 "$extract_script_path" "$fw_pattern" "$after_update_log" | tr '\n' ' '); do
-          eval "cur_fw_$i='$val'"
-          i=$((i+1))
-        done
-
-        i=0
-        for val in $(python3 "$extract_script_path" "$fw_status_pattern" "$after_update_log" | tr '\n' ' '); do
-          eval "status_fw_$i='$val'"
-          i=$((i+1))
-        done
+        # one pass over each log, setting fw_class_<i>, prev_fw_<i> and prev_fw_count
+        eval "$(python3 "$extract_script_path" --pattern fw_class="$fw_class_pattern" \
+                  --pattern prev_fw="$fw_pattern" "$before_update_log")"
+        eval "$(python3 "$extract_script_path" --pattern cur_fw="$fw_pattern" \
+                  --pattern status_fw="$fw_status_pattern" "$after_update_log")"
+        entry_count=${prev_fw_count:-0}
 
         echo "Testing ESRT FW version update" > /mnt/acs_results_template/fw/capsule_test_results.log
         overall_result="PASSED"
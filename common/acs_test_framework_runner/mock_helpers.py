@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import io
 import re
+import struct
+import tarfile
+import uuid
+import zlib
 from pathlib import Path
 from subprocess import CalledProcessError, CompletedProcess
 from typing import Any
@@ -187,6 +192,46 @@ def run_router(
     return _mock_run
 
 
+def block_io_router(
+    real: Any,
+    op: str,
+    faults: dict[str, dict[int, Any]] | None = None,
+    call_log_path: str | None = None,
+):
+    """
+    Wrap BlockDevice.read/write: log each call and inject per-device faults.
+
+    faults format (call numbers count per device, starting at 1):
+      "sda1": {2: {"raise": "mocked readback failure"}, 3: {"return_hex": "58..."}}
+    """
+    faults = faults or {}
+    if op not in {"read", "write"}:
+        raise TypeError("'op' must be 'read' or 'write'")
+    if call_log_path is not None and not isinstance(call_log_path, str):
+        raise TypeError("'call_log_path' must be a string")
+
+    call_counts: dict[str, int] = {}
+
+    def _mock_io(device, offset, payload):
+        name = Path(device.path).name
+        length = payload if op == "read" else len(payload)
+        if call_log_path is not None:
+            log_path = Path(call_log_path)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with log_path.open("a", encoding="utf-8") as handle:
+                handle.write(f"block {op} /dev/{name} offset={offset} length={length}\n")
+
+        call_counts[name] = call_counts.get(name, 0) + 1
+        fault = faults.get(name, {}).get(call_counts[name])
+        if fault is None:
+            return real(device, offset, payload)
+        if "raise" in fault:
+            raise OSError(5, str(fault["raise"]))
+        return bytes.fromhex(fault["return_hex"])
+
+    return _mock_io
+
+
 def path_read_text_router(
     responses: dict[str, str] | None = None,
     default_text: str = "",
@@ -399,6 +444,24 @@ def route_gateway(route_line: str | None) -> str | None:
     return match.group(1) if match else None
 
 
+def build_proc_net_route(route_lines: list[str]) -> str:
+    """Render /proc/net/route for the IPv4 default routes among route_lines."""
+    lines = [
+        "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT"
+    ]
+    for route_line in route_lines:
+        dev = re.search(r"\bdev\s+(\S+)", route_line)
+        if not route_line.startswith("default") or dev is None:
+            continue
+        gateway = route_gateway(route_line) or "0.0.0.0"
+        gateway_hex = "".join(f"{int(octet):02X}" for octet in reversed(gateway.split(".")))
+        flags = "0003" if gateway != "0.0.0.0" else "0001"
+        lines.append(
+            f"{dev.group(1)}\t00000000\t{gateway_hex}\t{flags}\t0\t0\t0\t00000000\t0\t0\t0"
+        )
+    return "\n".join(lines) + "\n"
+
+
 def build_run_result_from_outcome(
     outcome: Any,
     *,
@@ -481,6 +544,84 @@ def build_sgdisk_partition_output(partition: dict[str, Any]) -> str:
     )
 
 
+def build_disk_image(table: str, partitions: list[dict[str, Any]], sector: int = 512) -> bytes:
+    """Build the partition-table sectors of a scenario disk (MBR, GPT or blank raw)."""
+    if table == "raw":
+        return bytes(sector)
+
+    mbr = bytearray(sector)
+    mbr[510:512] = b"\x55\xaa"
+    starts = [
+        int(partition.get("start", 2048 * index))
+        for index, partition in enumerate(partitions, start=1)
+    ]
+    lengths = [int(partition.get("sectors", 2048)) for partition in partitions]
+
+    if table == "mbr":
+        for slot, partition in enumerate(partitions[:4]):
+            offset = 446 + 16 * slot
+            mbr[offset] = 0x80 if partition.get("boot") else 0
+            mbr[offset + 4] = int(str(partition.get("id", "83")).lower().replace("0x", ""), 16)
+            struct.pack_into("<II", mbr, offset + 8, starts[slot], lengths[slot])
+        return bytes(mbr)
+
+    last_lba = max([start + length for start, length in zip(starts, lengths)] + [4096]) + 33
+    mbr[446 + 4] = 0xEE
+    struct.pack_into("<II", mbr, 446 + 8, 1, min(last_lba, 0xFFFFFFFF))
+
+    entries = bytearray(128 * 128)
+    for index, partition in enumerate(partitions):
+        guid = str(partition.get("guid", "0FC63DAF-8483-4772-8E79-3D69D8477DE4"))
+        if "attribute_flags" in partition:
+            attributes = int(str(partition["attribute_flags"]), 16)
+        else:
+            attributes = 1 if scenario_truthy(partition.get("platform_required")) else 0
+        struct.pack_into(
+            "<16s16sQQQ",
+            entries,
+            index * 128,
+            uuid.UUID(guid).bytes_le,
+            uuid.UUID(int=index + 1).bytes_le,
+            starts[index],
+            starts[index] + lengths[index] - 1,
+            attributes,
+        )
+
+    header = bytearray(92)
+    struct.pack_into(
+        "<8sIIIIQQQQ16sQIII",
+        header,
+        0,
+        b"EFI PART",
+        0x00010000,
+        92,
+        0,
+        0,
+        1,
+        last_lba,
+        34,
+        last_lba - 33,
+        uuid.UUID(int=0xD15C).bytes_le,
+        2,
+        128,
+        128,
+        zlib.crc32(entries),
+    )
+    struct.pack_into("<I", header, 16, zlib.crc32(header))
+    return bytes(mbr) + bytes(header).ljust(sector, b"\0") + bytes(entries)
+
+
+def build_tarball(members: dict[str, bytes]) -> bytes:
+    """Build an uncompressed tarball holding the given member name -> data."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
 def build_efi_var_bytes(attrs: int, payload: bytes = b"") -> bytes:
     """Build raw efivarfs contents: 4-byte LE attrs followed by payload bytes."""
     if attrs < 0:
@@ -635,6 +776,9 @@ def passthrough_router(
         raise:
           type: OSError
           args: ["mocked open failure"]
+
+    A rule may answer with "returns": [first, second, ...] instead of
+    "return"; each hit takes the next value and the last one repeats.
     """
     rules = rules or []
     if not isinstance(rules, list):
@@ -696,6 +840,7 @@ def passthrough_router(
         )
 
     router_label = label.strip() if isinstance(label, str) else None
+    sequence_state: dict[str, int] = {}
 
     def _wrapped(*args, **kwargs):
         for rule_info in normalized_rules:
@@ -708,6 +853,9 @@ def passthrough_router(
                 raise _build_exception(rule["raise"])
             if "return" in rule:
                 return rule["return"]
+            if "returns" in rule:
+                # sticky sequence: one value per hit, then the last one
+                return _pick_routed_value(rule["returns"], sequence_state, rule_info["name"])
             if rule.get("call_real", True):
                 return real(*args, **kwargs)
             return None
@@ -1,28 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
-from subprocess import CalledProcessError
 from typing import Any
 from typing import Mapping
 
 try:  # Support package imports and direct harness module loading.
     from .mock_loader import ConfigError
     from .mock_loader import _resolve_runner_module_from_stack
-    from .mock_loader import stateful_run_router
+    from .mock_helpers import block_io_router
     from .mock_helpers import build_char16_payload
     from .mock_helpers import build_df_output
+    from .mock_helpers import build_disk_image
     from .mock_helpers import build_efi_var_bytes
     from .mock_helpers import build_ethtool_ip_address_output
     from .mock_helpers import build_ethtool_ip_link_line
     from .mock_helpers import build_ethtool_ip_link_show_line
     from .mock_helpers import build_fdisk_output
     from .mock_helpers import build_os_indications_var
+    from .mock_helpers import build_proc_net_route
     from .mock_helpers import build_run_result_from_outcome
     from .mock_helpers import build_sgdisk_partition_output
+    from .mock_helpers import build_tarball
     from .mock_helpers import check_output_router
     from .mock_helpers import default_device_path
     from .mock_helpers import noop
+    from .mock_helpers import normalize_ip_entries
     from .mock_helpers import normalize_ethtool_tool_path
     from .mock_helpers import passthrough_router
     from .mock_helpers import route_gateway
@@ -32,20 +36,24 @@ try:  # Support package imports and direct harness module loading.
 except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
     from mock_loader import ConfigError
     from mock_loader import _resolve_runner_module_from_stack
-    from mock_loader import stateful_run_router
+    from mock_helpers import block_io_router
     from mock_helpers import build_char16_payload
     from mock_helpers import build_df_output
+    from mock_helpers import build_disk_image
     from mock_helpers import build_efi_var_bytes
     from mock_helpers import build_ethtool_ip_address_output
     from mock_helpers import build_ethtool_ip_link_line
     from mock_helpers import build_ethtool_ip_link_show_line
     from mock_helpers import build_fdisk_output
     from mock_helpers import build_os_indications_var
+    from mock_helpers import build_proc_net_route
     from mock_helpers import build_run_result_from_outcome
     from mock_helpers import build_sgdisk_partition_output
+    from mock_helpers import build_tarball
     from mock_helpers import check_output_router
     from mock_helpers import default_device_path
     from mock_helpers import noop
+    from mock_helpers import normalize_ip_entries
     from mock_helpers import normalize_ethtool_tool_path
     from mock_helpers import passthrough_router
     from mock_helpers import route_gateway
@@ -81,7 +89,12 @@ def build_ethtool_scenario_case(
     read_text_rules: list[dict[str, Any]] = []
     resolve_rules: list[dict[str, Any]] = []
     default_route_lines: list[str] = []
+    # The system DHCP client configures these interfaces only after the
+    # given number of address/route lookups.
+    late_route_lines: list[str] = []
+    late_lookups = 0
     route_get_output = scenario.get("route_get")
+    physical_index = 0
 
     for index, iface in enumerate(interfaces, start=1):
         name = iface["name"]
@@ -102,11 +115,27 @@ def build_ethtool_scenario_case(
             "stdout": "",
             "stderr": "",
         }
-        run_responses[f"ip address show dev {name}"] = {
+        address_response = {
             "returncode": 0,
             "stdout": build_ethtool_ip_address_output(index, iface),
             "stderr": "",
         }
+        configured_after = int(iface.get("configured_after", 0))
+        if configured_after > 0:
+            unconfigured = {
+                key: value for key, value in iface.items()
+                if key not in ("ipv4", "ipv6", "addresses")
+            }
+            late_lookups = max(late_lookups, configured_after)
+            run_responses[f"ip address show dev {name}"] = [
+                {
+                    "returncode": 0,
+                    "stdout": build_ethtool_ip_address_output(index, unconfigured),
+                    "stderr": "",
+                }
+            ] * configured_after + [address_response]
+        else:
+            run_responses[f"ip address show dev {name}"] = address_response
 
         if tool_paths.get("dhclient") is not None:
             run_responses[f"dhclient -r {name}"] = {
@@ -185,11 +214,40 @@ def build_ethtool_scenario_case(
         default_route = routes.get("default") or iface.get("default_route")
         if default_route:
             default_route_lines.append(str(default_route))
+            if configured_after > 0:
+                late_route_lines.append(str(default_route))
+        iface_route_get = routes.get("route_get") or iface.get("route_get")
         if route_get_output is None:
-            route_get_output = routes.get("route_get") or iface.get("route_get")
+            route_get_output = iface_route_get
+        if iface_route_get:
+            # ethtool-test.py --jobs pins the lookup to the interface under test.
+            run_responses[f"ip route get 8.8.8.8 oif {name}"] = {
+                "returncode": 0,
+                "stdout": str(iface_route_get).rstrip("\n") + "\n",
+                "stderr": "",
+            }
 
         connectivity = iface.get("connectivity") or {}
         gateway = route_gateway(str(default_route)) if default_route else None
+        ipv4_entries = normalize_ip_entries(
+            iface.get("ipv4") or (iface.get("addresses") or {}).get("ipv4"),
+            default_dynamic=False,
+        )
+        if kind == "physical" and gateway and ipv4_entries:
+            # Policy-routing table set up per interface by ethtool-test.py --jobs.
+            table = 1000 + physical_index
+            source = str(ipv4_entries[0]["address"]).split("/")[0]
+            for command in (
+                f"ip route replace default via {gateway} dev {name} table {table}",
+                f"ip rule add from {source} lookup {table} priority {table}",
+                f"ip rule add oif {name} lookup {table} priority {table}",
+                f"ip rule del from {source} lookup {table} priority {table}",
+                f"ip rule del oif {name} lookup {table} priority {table}",
+                f"ip route flush table {table}",
+            ):
+                run_responses[command] = {"returncode": 0, "stdout": "", "stderr": ""}
+        if kind == "physical":
+            physical_index += 1
         if gateway and "gateway_ping" in connectivity:
             run_responses[
                 f"ping -c 3 -W 10 -I {name} {gateway}"
@@ -215,13 +273,17 @@ def build_ethtool_scenario_case(
             run_responses[f"ping -6 -c 3 -I {name} ipv6.google.com"] = ipv6_result
             run_responses[f"ping6 -c 3 -I {name} ipv6.google.com"] = ipv6_result
         if "wget" in connectivity:
-            run_responses[
-                "wget --spider --timeout=10 https://www.arm.com"
-            ] = build_run_result_from_outcome(
+            wget_result = build_run_result_from_outcome(
                 connectivity["wget"],
                 success_stdout="",
                 failure_stderr="network unreachable\n",
             )
+            run_responses["wget --spider --timeout=10 https://www.arm.com"] = wget_result
+            if ipv4_entries:
+                source = str(ipv4_entries[0]["address"]).split("/")[0]
+                run_responses[
+                    f"wget --bind-address={source} --spider --timeout=10 https://www.arm.com"
+                ] = wget_result
         if "curl" in connectivity:
             run_responses[
                 f"curl -Is --connect-timeout 20 --interface {name} https://www.arm.com"
@@ -231,18 +293,17 @@ def build_ethtool_scenario_case(
                 failure_stderr="connect failed\n",
             )
 
+    early_route_lines = [line for line in default_route_lines if line not in late_route_lines]
     if default_route_lines:
         routes_stdout = "\n".join(default_route_lines) + "\n"
-        run_responses["ip route show default"] = {
-            "returncode": 0,
-            "stdout": routes_stdout,
-            "stderr": "",
-        }
-        run_responses["ip -o route show table all default"] = {
-            "returncode": 0,
-            "stdout": routes_stdout,
-            "stderr": "",
-        }
+        routes_response: Any = {"returncode": 0, "stdout": routes_stdout, "stderr": ""}
+        if late_lookups:
+            early_stdout = "".join(f"{line}\n" for line in early_route_lines)
+            routes_response = [
+                {"returncode": 0, "stdout": early_stdout, "stderr": ""}
+            ] * late_lookups + [routes_response]
+        run_responses["ip route show default"] = routes_response
+        run_responses["ip -o route show table all default"] = routes_response
 
     if route_get_output:
         route_text = str(route_get_output)
@@ -254,6 +315,23 @@ def build_ethtool_scenario_case(
             "stderr": "",
         }
 
+    # The script invokes tools by their which() path; answer those spellings too.
+    for command, response in list(run_responses.items()):
+        tool, _, rest = command.partition(" ")
+        tool_path = tool_paths.get(tool)
+        if tool_path and tool_path != tool:
+            run_responses.setdefault(f"{tool_path} {rest}", response)
+
+    # Default routes in the main table, read by ethtool-test.py without running ip.
+    proc_net_route = build_proc_net_route(default_route_lines)
+    read_text_rules.append(
+        {
+            "when": {"args": {0: {"contains": "/proc/net/route"}}},
+            "returns": [build_proc_net_route(early_route_lines)] * late_lookups
+            + [proc_net_route],
+        }
+    )
+
     required = scenario.get("required_compliant_interfaces")
     if required is None:
         required = sum(
@@ -271,6 +349,8 @@ def build_ethtool_scenario_case(
         "mocks": {
             "signal.signal": {"value": noop},
             "time.sleep": {"value": noop},
+            # No rtnetlink: readiness waits fall back to (mocked) sysfs/procfs polling.
+            "socket.AF_NETLINK": {"value": None},
             "shutil.which": {
                 "factory": which_router,
                 "kwargs": {"responses": tool_paths, "default": None},
@@ -404,163 +484,128 @@ def _add_blk_write_check_run_responses(
     )
 
 
-def _build_blk_write_check_stateful_rules(
+def _blk_scenario_bytes(value: Any, default: bytes, field_name: str) -> bytes:
+    if value is None:
+        return default
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        try:
+            return bytes.fromhex(value)
+        except ValueError as exc:
+            raise ConfigError(f"{field_name} must be bytes or hex string") from exc
+    raise ConfigError(f"{field_name} must be bytes or hex string")
+
+
+def _add_blk_device_io(
     device: str,
     cfg: dict[str, Any],
-) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    bin_files: dict[str, dict[str, str]],
+    faults: dict[str, dict[str, dict[int, Any]]],
+    block_read: Any = None,
+) -> None:
+    """Write dev/<device> for the in-process block I/O and queue its faults.
+
+    block_read is the outcome of the 1 MiB read done during the disk scan, or
+    None when the scenario calls perform_write_check directly.
+    """
+    read_faults: dict[int, Any] = {}
+    write_faults: dict[int, Any] = {}
+    reads = 0
+    if block_read is not None:
+        reads = 1
+        if build_run_result_from_outcome(block_read)["returncode"] != 0:
+            read_faults[1] = {"raise": "mocked block read failure"}
+
+    image_path = f"dev/{device}"
+    image = bytearray.fromhex(bin_files.get(image_path, {}).get("hex", ""))
     write_flow = cfg.get("write_flow")
-    if write_flow is None:
-        return {}, []
-    if not isinstance(write_flow, dict):
-        raise ConfigError("blk_write_check.write_flow must be a mapping when provided")
-
-    initial_bytes = cfg.get("initial_device_bytes")
-    if initial_bytes is None:
-        initial_text = str(cfg.get("initial_device_text", "B" * 512))
-        initial_bytes = initial_text.encode("utf-8")
-    elif isinstance(initial_bytes, str):
-        try:
-            initial_bytes = bytes.fromhex(initial_bytes)
-        except ValueError as exc:
+    if write_flow is not None:
+        if not isinstance(write_flow, dict):
+            raise ConfigError("blk_write_check.write_flow must be a mapping when provided")
+
+        initial_bytes = _blk_scenario_bytes(
+            cfg.get("initial_device_bytes"),
+            str(cfg.get("initial_device_text", "B" * 512)).encode("utf-8"),
+            "blk_write_check.initial_device_bytes",
+        )
+        mismatch_bytes = _blk_scenario_bytes(
+            write_flow.get("mismatch_bytes"),
+            b"X" * max(len(initial_bytes), 512),
+            "blk_write_check.write_flow.mismatch_bytes",
+        )
+        used_blocks = int(cfg.get("used_blocks", 0))
+        offset = used_blocks * 512
+        # Cover every block the write check may sample in the free space.
+        image_size = max(offset + 512, (used_blocks + int(cfg.get("available_blocks", 0))) * 512)
+        image.extend(bytes(max(0, image_size - len(image))))
+        image[offset:offset + len(initial_bytes)] = initial_bytes
+
+        # Read calls: [block read], backup, read-back, restore verification.
+        # Write calls: test pattern, restore.
+        backup_mode = str(write_flow.get("backup", "success")).lower()
+        if backup_mode == "error":
+            read_faults[reads + 1] = {
+                "raise": write_flow.get("backup_error", "mocked backup failure")
+            }
+        elif backup_mode not in {"success", "pass", "ok", "skip", "none"}:
             raise ConfigError(
-                "blk_write_check.initial_device_bytes must be bytes or hex string"
-            ) from exc
-    elif not isinstance(initial_bytes, bytes):
-        raise ConfigError("blk_write_check.initial_device_bytes must be bytes or hex string")
+                "blk_write_check.write_flow.backup must be success, error, skip, or none"
+            )
 
-    mismatch_bytes = write_flow.get("mismatch_bytes")
-    if mismatch_bytes is None:
-        mismatch_bytes = b"X" * max(len(initial_bytes), 512)
-    elif isinstance(mismatch_bytes, str):
-        try:
-            mismatch_bytes = bytes.fromhex(mismatch_bytes)
-        except ValueError as exc:
+        write_mode = str(write_flow.get("write", "success")).lower()
+        if write_mode == "error":
+            write_faults[1] = {"raise": write_flow.get("write_error", "mocked write failure")}
+        elif write_mode not in {"success", "pass", "ok", "skip", "none"}:
             raise ConfigError(
-                "blk_write_check.write_flow.mismatch_bytes must be bytes or hex string"
-            ) from exc
-    elif not isinstance(mismatch_bytes, bytes):
-        raise ConfigError("blk_write_check.write_flow.mismatch_bytes must be bytes or hex string")
+                "blk_write_check.write_flow.write must be success, error, skip, or none"
+            )
 
-    used_blocks = int(cfg.get("used_blocks", 0))
-    backup_name = f"{device}_backup.bin"
-    device_state_key = f"{device}:device_bytes"
-    mismatch_state_key = f"{device}:mismatch_bytes"
-    state = {
-        device_state_key: initial_bytes,
-        mismatch_state_key: mismatch_bytes,
-    }
-    rules: list[dict[str, Any]] = []
+        readback_mode = str(write_flow.get("readback", "match")).lower()
+        if readback_mode == "mismatch":
+            read_faults[reads + 2] = {"return_hex": mismatch_bytes[:512].hex()}
+        elif readback_mode == "error":
+            read_faults[reads + 2] = {
+                "raise": write_flow.get("readback_error", "mocked readback failure")
+            }
+        elif readback_mode != "match":
+            raise ConfigError(
+                "blk_write_check.write_flow.readback must be match, mismatch, or error"
+            )
 
-    backup_command = (
-        f"dd if=/dev/{device} of={backup_name} bs=512 count=1 skip={used_blocks}"
-    )
-    backup_mode = str(write_flow.get("backup", "success")).lower()
-    if backup_mode in {"success", "pass", "ok"}:
-        rules.append({
-            "command": backup_command,
-            "write_file": {
-                "path": backup_name,
-                "content": {"from_state": device_state_key},
-            },
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif backup_mode == "error":
-        error_text = str(write_flow.get("backup_error", "mocked backup failure"))
-        rules.append({
-            "command": backup_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, backup_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    elif backup_mode not in {"skip", "none"}:
-        raise ConfigError(
-            "blk_write_check.write_flow.backup must be success, error, skip, or none"
-        )
+        restore_mode = str(write_flow.get("restore", "success")).lower()
+        if restore_mode == "error":
+            write_faults[2] = {
+                "raise": write_flow.get("restore_error", "mocked restore failure")
+            }
+        elif restore_mode not in {"success", "pass", "ok", "skip", "none"}:
+            raise ConfigError(
+                "blk_write_check.write_flow.restore must be success, error, skip, or none"
+            )
 
-    write_command = (
-        f"dd if=hello.txt of=/dev/{device} bs=512 count=1 seek={used_blocks}"
-    )
-    write_mode = str(write_flow.get("write", "success")).lower()
-    if write_mode in {"success", "pass", "ok"}:
-        written_content = (
-            {"from_state": mismatch_state_key}
-            if str(write_flow.get("readback", "match")).lower() == "mismatch"
-            else {"from_file": "hello.txt"}
-        )
-        rules.append({
-            "command": write_command,
-            "set_state": {device_state_key: written_content},
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif write_mode == "error":
-        error_text = str(write_flow.get("write_error", "mocked write failure"))
-        rules.append({
-            "command": write_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, write_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    elif write_mode not in {"skip", "none"}:
-        raise ConfigError(
-            "blk_write_check.write_flow.write must be success, error, skip, or none"
-        )
+    bin_files[image_path] = {"hex": bytes(image or bytes(512)).hex()}
+    if read_faults:
+        faults["read"][device] = read_faults
+    if write_faults:
+        faults["write"][device] = write_faults
 
-    read_command = (
-        f"dd if=/dev/{device} of=read_hello.txt bs=512 count=1 skip={used_blocks}"
-    )
-    readback_mode = str(write_flow.get("readback", "match")).lower()
-    if readback_mode in {"match", "mismatch"}:
-        rules.append({
-            "command": read_command,
-            "write_file": {
-                "path": "read_hello.txt",
-                "content": {"from_state": device_state_key},
-            },
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif readback_mode == "error":
-        error_text = str(write_flow.get("readback_error", "mocked readback failure"))
-        rules.append({
-            "command": read_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, read_command],
-                "kwargs": {"output": "", "stderr": error_text},
-            },
-        })
-    else:
-        raise ConfigError("blk_write_check.write_flow.readback must be match, mismatch, or error")
 
-    restore_command = (
-        f"dd if={backup_name} of=/dev/{device} bs=512 count=1 seek={used_blocks}"
-    )
-    restore_mode = str(write_flow.get("restore", "success")).lower()
-    if restore_mode in {"success", "pass", "ok"}:
-        rules.append({
-            "command": restore_command,
-            "set_state": {device_state_key: {"from_file": backup_name}},
-            "result": {"returncode": 0, "stdout": "", "stderr": ""},
-        })
-    elif restore_mode == "error":
-        error_text = str(write_flow.get("restore_error", "mocked restore failure"))
-        rules.append({
-            "command": restore_command,
-            "raise": {
-                "type": CalledProcessError,
-                "args": [1, restore_command],
-                "kwargs": {"output": "", "stderr": error_text},
+def _blk_io_mocks(
+    faults: dict[str, dict[str, dict[int, Any]]],
+    call_log_path: str,
+) -> dict[str, Any]:
+    return {
+        f"{{module}}.BlockDevice.{op}": {
+            "factory": block_io_router,
+            "inject_original_as": "real",
+            "kwargs": {
+                "op": op,
+                "faults": faults[op],
+                "call_log_path": call_log_path,
             },
-        })
-    elif restore_mode not in {"skip", "none"}:
-        raise ConfigError(
-            "blk_write_check.write_flow.restore must be success, error, skip, or none"
-        )
-
-    return state, rules
+        }
+        for op in ("read", "write")
+    }
 
 
 BLK_DEVICE_BANNER = "*" * 128
@@ -870,8 +915,12 @@ def build_blk_devices_scenario_case(
     call_log_path = str(work_dir / "blk_commands.log")
     disk_listing_lines: list[str] = []
     run_responses: dict[str, Any] = {}
-    stateful_state: dict[str, Any] = {}
-    stateful_rules: list[dict[str, Any]] = []
+    io_faults: dict[str, dict[str, dict[int, Any]]] = {"read": {}, "write": {}}
+    # With sysfs: true the script reads a generated /sys/block tree and disk
+    # images; otherwise both paths are absent and it falls back to the tools.
+    use_sysfs = scenario_truthy(scenario.get("sysfs"), default=False)
+    text_files: dict[str, str] = {}
+    bin_files: dict[str, dict[str, str]] = {}
 
     for disk_index, disk in enumerate(disks, start=1):
         if not isinstance(disk, dict):
@@ -881,6 +930,18 @@ def build_blk_devices_scenario_case(
 
         disk_name = str(disk["name"])
         disk_listing_lines.append(f"{disk_name} disk")
+        if use_sysfs:
+            text_files[f"sys/block/{disk_name}/dev"] = f"8:{16 * (disk_index - 1)}\n"
+            text_files[f"sys/block/{disk_name}/queue/logical_block_size"] = "512\n"
+            bin_files[f"dev/{disk_name}"] = {
+                "hex": build_disk_image(
+                    str(disk.get("table", "raw")).lower(),
+                    list(disk.get("partitions") or []),
+                ).hex()
+            }
+            for part_index, partition in enumerate(disk.get("partitions") or [], start=1):
+                part_name = str(partition.get("name", f"{disk_name}{part_index}"))
+                text_files[f"sys/block/{disk_name}/{part_name}/partition"] = f"{part_index}\n"
 
         disk_kind = str(disk.get("kind", "disk")).lower()
         if disk_name.startswith("mtdblock") or disk_kind in {"mtd", "mtdblock"}:
@@ -927,21 +988,19 @@ def build_blk_devices_scenario_case(
             run_responses[f"lsblk -rn -o NAME,TYPE /dev/{disk_name}"] = _completed_process_spec(
                 stdout=""
             )
-            run_responses[f"dd if=/dev/{disk_name} of=/dev/null bs=1M count=1"] = (
-                build_run_result_from_outcome(disk.get("block_read", "pass"))
-            )
             disk_write_cfg = disk.get("write_check") or disk
             _add_blk_write_check_run_responses(
                 run_responses,
                 disk_name,
                 disk_write_cfg,
             )
-            state, rules = _build_blk_write_check_stateful_rules(
+            _add_blk_device_io(
                 disk_name,
                 disk_write_cfg,
+                bin_files,
+                io_faults,
+                disk.get("block_read", "pass"),
             )
-            stateful_state.update(state)
-            stateful_rules.extend(rules)
             continue
 
         partition_labels: list[str] = []
@@ -991,21 +1050,19 @@ def build_blk_devices_scenario_case(
                 if partition_id in PRECIOUS_MBR_IDS:
                     continue
 
-                run_responses[
-                    f"dd if=/dev/{partition_name} of=/dev/null bs=1M count=1"
-                ] = build_run_result_from_outcome(partition.get("block_read", "pass"))
                 partition_write_cfg = partition.get("write_check") or partition
                 _add_blk_write_check_run_responses(
                     run_responses,
                     partition_name,
                     partition_write_cfg,
                 )
-                state, rules = _build_blk_write_check_stateful_rules(
+                _add_blk_device_io(
                     partition_name,
                     partition_write_cfg,
+                    bin_files,
+                    io_faults,
+                    partition.get("block_read", "pass"),
                 )
-                stateful_state.update(state)
-                stateful_rules.extend(rules)
 
             continue
 
@@ -1046,54 +1103,44 @@ def build_blk_devices_scenario_case(
             if partition_guid in PRECIOUS_GPT_GUIDS or required:
                 continue
 
-            run_responses[
-                f"dd if=/dev/{partition_name} of=/dev/null bs=1M count=1"
-            ] = build_run_result_from_outcome(partition.get("block_read", "pass"))
             partition_write_cfg = partition.get("write_check") or partition
             _add_blk_write_check_run_responses(
                 run_responses,
                 partition_name,
                 partition_write_cfg,
             )
-            state, rules = _build_blk_write_check_stateful_rules(
+            _add_blk_device_io(
                 partition_name,
                 partition_write_cfg,
+                bin_files,
+                io_faults,
+                partition.get("block_read", "pass"),
             )
-            stateful_state.update(state)
-            stateful_rules.extend(rules)
 
     run_responses["lsblk -e 7 -d -n -o NAME,TYPE"] = _completed_process_spec(
         stdout=_join_stdout_lines(disk_listing_lines)
     )
 
-    run_mock_spec: dict[str, Any] = {
-        "factory": run_router,
-        "kwargs": {
-            "responses": run_responses,
-            "default_returncode": 1,
-            "use_contains": False,
-            "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-            "call_log_path": call_log_path,
-        },
-    }
-    if stateful_rules:
-        run_mock_spec = {
-            "factory": stateful_run_router,
-            "kwargs": {
-                "state": stateful_state,
-                "rules": stateful_rules,
-                "responses": run_responses,
-                "default_returncode": 1,
-                "use_contains": False,
-                "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-                "call_log_path": call_log_path,
-            },
-        }
-
     return {
+        "patch_constants": {
+            "SYS_BLOCK": str(work_dir / ("sys/block" if use_sysfs else "no-sysfs")),
+            "DEV_DIR": str(work_dir / "dev"),
+        },
+        "text_files": text_files,
+        "bin_files": bin_files,
         "mocks": {
             "{module}.input_with_timeout": {"return_value": prompt_response},
-            "subprocess.run": run_mock_spec,
+            "subprocess.run": {
+                "factory": run_router,
+                "kwargs": {
+                    "responses": run_responses,
+                    "default_returncode": 1,
+                    "use_contains": False,
+                    "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
+                    "call_log_path": call_log_path,
+                },
+            },
+            **_blk_io_mocks(io_faults, call_log_path),
         },
     }
 
@@ -1117,34 +1164,23 @@ def build_blk_write_check_scenario_case(
     call_log_path = str(work_dir / "blk_commands.log")
     run_responses: dict[str, Any] = {}
     _add_blk_write_check_run_responses(run_responses, device, scenario)
-    state, rules = _build_blk_write_check_stateful_rules(device, scenario)
-    if not rules:
-        return {
-            "args": [device, partition_id, precious_parts],
-            "mocks": {
-                "{module}.input_with_timeout": {"return_value": prompt_result},
-                "subprocess.run": {
-                    "factory": run_router,
-                    "kwargs": {
-                        "responses": run_responses,
-                        "default_returncode": 1,
-                        "use_contains": False,
-                        "unmatched_stderr_template": "UNMOCKED COMMAND: {cmd}\n",
-                        "call_log_path": call_log_path,
-                    },
-                },
-            },
-        }
+    bin_files: dict[str, dict[str, str]] = {}
+    io_faults: dict[str, dict[str, dict[int, Any]]] = {"read": {}, "write": {}}
+    _add_blk_device_io(device, scenario, bin_files, io_faults)
+
+    args = [device, partition_id, precious_parts]
+    if "samples" in scenario:
+        args.append(int(scenario["samples"]))
 
     return {
-        "args": [device, partition_id, precious_parts],
+        "args": args,
+        "patch_constants": {"DEV_DIR": str(work_dir / "dev")},
+        "bin_files": bin_files,
         "mocks": {
             "{module}.input_with_timeout": {"return_value": prompt_result},
             "subprocess.run": {
-                "factory": stateful_run_router,
+                "factory": run_router,
                 "kwargs": {
-                    "state": state,
-                    "rules": rules,
                     "responses": run_responses,
                     "default_returncode": 1,
                     "use_contains": False,
@@ -1152,6 +1188,7 @@ def build_blk_write_check_scenario_case(
                     "call_log_path": call_log_path,
                 },
             },
+            **_blk_io_mocks(io_faults, call_log_path),
         },
     }
 
@@ -1330,12 +1367,65 @@ def build_verify_tpm_events(scenario: dict[str, Any]) -> list[dict[str, Any]]:
     return events
 
 
+def _verify_tpm_replay(
+    events: list[dict[str, Any]],
+    algos: list[str],
+    corrupt_pcr: Any,
+) -> tuple[list[dict[str, Any]], dict[str, list[str]]]:
+    """Attach tpm2_eventlog style digests to events and extend PCRs 0-7 with them."""
+    banks: dict[str, list[bytes]] = {}
+    for algo in algos:
+        try:
+            size = hashlib.new(algo).digest_size
+        except ValueError as exc:
+            raise ConfigError(f"verify_tpm.replay_algos has unknown algorithm {algo!r}") from exc
+        banks[algo] = [bytes(size)] * 8
+
+    replayed_events: list[dict[str, Any]] = []
+    for event in events:
+        entry = dict(event)
+        if entry.get("EventType") != "EV_NO_ACTION":
+            payload = json.dumps(event, sort_keys=True).encode()
+            digests = []
+            for algo, pcrs in banks.items():
+                digest = hashlib.new(algo, payload).digest()
+                digests.append({"AlgorithmId": algo, "Digest": digest.hex()})
+                index = int(entry["PCRIndex"])
+                if 0 <= index < len(pcrs):
+                    pcrs[index] = hashlib.new(algo, pcrs[index] + digest).digest()
+            entry["Digests"] = digests
+        replayed_events.append(entry)
+
+    values = {algo: [pcr.hex() for pcr in pcrs] for algo, pcrs in banks.items()}
+    if corrupt_pcr is not None:
+        index = _parse_int_like(corrupt_pcr, "verify_tpm.replay_corrupt_pcr")
+        if not 0 <= index < 8:
+            raise ConfigError("verify_tpm.replay_corrupt_pcr must be between 0 and 7")
+        for bank in values.values():
+            bank[index] = "ff" * (len(bank[index]) // 2)
+    return replayed_events, values
+
+
 def build_verify_tpm_scenario_case(
     scenario: dict[str, Any],
     work_dir: Path,
 ) -> dict[str, Any]:
     """Build runtime files and args for verify_tpm_measurements.py scenarios."""
-    pcr_banks = _normalize_verify_tpm_banks(scenario.get("pcrs"), "verify_tpm.pcrs")
+    replay = scenario_truthy(scenario.get("replay"), default=False)
+    events = build_verify_tpm_events(scenario)
+    pcrs = scenario.get("pcrs")
+    if replay:
+        replay_algos = _ensure_string_list(
+            scenario.get("replay_algos", ["sha256"]),
+            "verify_tpm.replay_algos",
+        )
+        events, replayed = _verify_tpm_replay(
+            events,
+            replay_algos,
+            scenario.get("replay_corrupt_pcr"),
+        )
+        pcrs = {**(pcrs or {}), **replayed}
+    pcr_banks = _normalize_verify_tpm_banks(pcrs, "verify_tpm.pcrs")
     event_pcrs = _normalize_verify_tpm_banks(
         scenario.get("event_pcrs", pcr_banks),
         "verify_tpm.event_pcrs",
@@ -1351,7 +1441,7 @@ def build_verify_tpm_scenario_case(
     else:
         event_doc = {
             "pcrs": event_pcrs,
-            "events": build_verify_tpm_events(scenario),
+            "events": events,
         }
         event_contents = json.dumps(event_doc, indent=2) + "\n"
 
@@ -1359,8 +1449,12 @@ def build_verify_tpm_scenario_case(
     pcr_path = work_dir / "pcr.yaml"
     event_path = work_dir / "event.yaml"
 
+    args = [str(pcr_path), str(event_path)]
+    if replay:
+        args.insert(0, "--replay")
+
     generated: dict[str, Any] = {
-        "args": [str(pcr_path), str(event_path)],
+        "args": args,
         "text_files": {
             "pcr.yaml": pcr_contents,
             "event.yaml": event_contents,
@@ -1399,32 +1493,50 @@ def build_verify_tpm_scenario_case(
             },
         }
 
+    yaml_rules: list[dict[str, Any]] = []
     event_log_yaml_error = scenario.get("event_log_yaml_error")
     if event_log_yaml_error is not None:
         if not isinstance(event_log_yaml_error, str) or not event_log_yaml_error.strip():
             raise ConfigError(
                 "verify_tpm.event_log_yaml_error must be a non-empty string"
             )
-        mocks["yaml.safe_load"] = {
+        yaml_rules.append(
+            {
+                "label": "event-log-yaml-error",
+                "required": True,
+                "when": {
+                    "args": {
+                        0: {"contains": str(event_path)},
+                    }
+                },
+                "raise": {
+                    "type": "py:yaml.YAMLError",
+                    "args": [event_log_yaml_error],
+                },
+            }
+        )
+
+    if scenario_truthy(scenario.get("expect_single_parse"), default=False):
+        for label, path in (("pcr-log", pcr_path), ("event-log", event_path)):
+            yaml_rules.append(
+                {
+                    "label": f"{label}-parsed-once",
+                    "exact_calls": 1,
+                    "when": {
+                        "args": {
+                            0: {"contains": str(path)},
+                        }
+                    },
+                }
+            )
+
+    if yaml_rules:
+        mocks["yaml.load"] = {
             "factory": "mock_helpers.passthrough_router",
             "inject_original_as": "real",
             "kwargs": {
                 "label": "verify-tpm-yaml-router",
-                "rules": [
-                    {
-                        "label": "event-log-yaml-error",
-                        "required": True,
-                        "when": {
-                            "args": {
-                                0: {"contains": str(event_path)},
-                            }
-                        },
-                        "raise": {
-                            "type": "py:yaml.YAMLError",
-                            "args": [event_log_yaml_error],
-                        },
-                    }
-                ],
+                "rules": yaml_rules,
             },
         }
 
@@ -1591,6 +1703,11 @@ def build_capsule_vars_scenario_case(
         scenario.get("efivarfs_present"),
         default=True,
     )
+    # With tarball: <name> the variables are packed into that tarball (as
+    # efivars/<var>) instead of being written to the efivarfs directory.
+    tarball_raw = scenario.get("tarball")
+    if tarball_raw is not None and (not isinstance(tarball_raw, str) or not tarball_raw.strip()):
+        raise ConfigError("capsule_vars.tarball must be a non-empty string")
 
     generated: dict[str, Any] = {
         "patch_constants": {
@@ -1599,13 +1716,18 @@ def build_capsule_vars_scenario_case(
         }
     }
 
-    if not efivarfs_present:
+    if not efivarfs_present and tarball_raw is None:
         return generated
 
-    generated["dir_structure"] = [{"path": str(efivar_path.relative_to(work_dir))}]
     bin_files: dict[str, dict[str, str]] = {}
+    tar_members: dict[str, bytes] = {}
+    if tarball_raw is None:
+        generated["dir_structure"] = [{"path": str(efivar_path.relative_to(work_dir))}]
 
     def add_var(filename: str, payload: bytes) -> None:
+        if tarball_raw is not None:
+            tar_members[f"efivars/{filename}"] = payload
+            return
         rel_path = str((efivar_path.relative_to(work_dir) / filename).as_posix())
         bin_files[rel_path] = {"hex": payload.hex()}
 
@@ -1651,6 +1773,12 @@ def build_capsule_vars_scenario_case(
         )
         add_var(f"{name}-{CAPSULE_REPORT_GUID}", payload)
 
+    if tarball_raw is not None:
+        tar_path = _resolve_case_relative_path(work_dir, tarball_raw)
+        bin_files[str(tar_path.relative_to(work_dir))] = {
+            "hex": build_tarball(tar_members).hex()
+        }
+
     if bin_files:
         generated["bin_files"] = bin_files
 
@@ -1740,6 +1868,7 @@ def build_runtime_device_mapping_scenario_case(
     generated: dict[str, Any] = {
         "patch_constants": {
             "DTS_PATH": dts_path,
+            "DTB_PATH": work_dir / "fdt",
             "MEMMAP_PATH": memmap_path,
             "OUT_LOG_PATH": log_path,
         }
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Disassemble extracted ACPI tables in parallel, reusing cached output."""
+
+import argparse
+import concurrent.futures
+import glob
+import hashlib
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+
+INDEX_NAME = "acpi_tables.json"
+
+# Put in front of a DSL reused from the cache: its own header still carries
+# the date and iasl version of the run that produced it.
+CACHED_NOTE = """/*
+ * Not disassembled in this run: reused from the disassembly cache
+ * ({}), which holds the iasl output for a table with the
+ * same SHA-256. The header below is from that earlier run.
+ */
+"""
+
+# Signature, Length, Revision, Checksum, OEMID, OEM Table ID, OEM Revision,
+# Creator ID, Creator Revision
+ACPI_HEADER = struct.Struct("<4sIBB6s8sI4sI")
+
+
+def _text(raw):
+    return raw.rstrip(b"\0 ").decode("ascii", "replace")
+
+
+def read_table(path):
+    """Return the index entry for one extracted table, without its DSL fields."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    entry = {
+        "file": os.path.basename(path),
+        "size": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+    if len(data) < ACPI_HEADER.size:
+        entry["error"] = "shorter than an ACPI table header"
+        return entry
+
+    (signature, length, revision, checksum, oem_id, oem_table_id, oem_revision,
+     creator_id, creator_revision) = ACPI_HEADER.unpack_from(data)
+    entry.update({
+        "signature": _text(signature),
+        "length": length,
+        "revision": revision,
+        "checksum": f"0x{checksum:02x}",
+        # the bytes of a valid table, checksum included, sum to zero
+        "checksum_valid": sum(data[:length]) % 256 == 0 and length <= len(data),
+        "oem_id": _text(oem_id),
+        "oem_table_id": _text(oem_table_id),
+        "oem_revision": f"0x{oem_revision:08x}",
+        "creator_id": _text(creator_id),
+        "creator_revision": f"0x{creator_revision:08x}",
+    })
+    return entry
+
+
+def cache_name(entry):
+    # signature/OEM revision keep the cache readable, the digest keeps it exact
+    return "{}-{}-{}.dsl".format(entry.get("signature", "UNKN"),
+                                 entry.get("oem_revision", "0x00000000"),
+                                 entry["sha256"][:16])
+
+
+def disassemble(path, iasl, cache_dir):
+    """Disassemble one table next to itself, or copy its DSL from the cache."""
+    entry = read_table(path)
+    directory = os.path.dirname(path)
+    dsl = os.path.splitext(os.path.basename(path))[0] + ".dsl"
+    dsl_path = os.path.join(directory, dsl)
+    cached = os.path.join(cache_dir, cache_name(entry)) if cache_dir else None
+
+    if cached and os.path.isfile(cached):
+        with open(cached, "rb") as src, open(dsl_path, "wb") as dst:
+            dst.write(CACHED_NOTE.format(os.path.basename(cached)).encode())
+            shutil.copyfileobj(src, dst)
+        entry.update({"dsl": dsl, "cached": True, "cache_file": cached, "exit_code": 0})
+        return entry, f"{entry['file']}: disassembly reused from cache {cached}\n"
+
+    try:
+        result = subprocess.run([iasl, "-d", os.path.basename(path)], cwd=directory,
+                                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+    except OSError as e:
+        entry.update({"dsl": None, "cached": False, "exit_code": None, "error": str(e)})
+        return entry, f"{entry['file']}: {e}\n"
+
+    output = result.stdout.decode("utf-8", "replace")
+    entry.update({"cached": False, "exit_code": result.returncode})
+    if result.returncode == 0 and os.path.isfile(dsl_path):
+        entry["dsl"] = dsl
+        if cached:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                # copy-then-rename so a concurrent run never reads half a file
+                shutil.copyfile(dsl_path, cached + ".tmp")
+                os.replace(cached + ".tmp", cached)
+            except OSError as e:
+                output += f"WARNING: could not cache {dsl}: {e}\n"
+    else:
+        entry["dsl"] = None
+    return entry, output
+
+
+def disassemble_tables(tables, iasl="iasl", cache_dir=None, jobs=None):
+    """Disassemble tables concurrently and return (index entries, iasl output) in order."""
+    jobs = jobs or os.cpu_count() or 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(lambda path: disassemble(path, iasl, cache_dir), tables))
+    return [entry for entry, _ in results], "".join(output for _, output in results)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Disassemble extracted ACPI tables in parallel")
+    parser.add_argument("directory", nargs="?", default=".",
+                        help="Directory holding the acpixtract *.dat files")
+    parser.add_argument("--iasl", default="iasl", help="iasl binary (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Tables disassembled at the same time (default: CPU count)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse disassembly of unchanged tables from this directory")
+    parser.add_argument("--index", default=None,
+                        help=f"Table index JSON (default: <directory>/{INDEX_NAME})")
+    return parser.parse_args(argv)
+
+
+def main(directory=".", iasl="iasl", jobs=None, cache_dir=None, index=None):
+    tables = sorted(glob.glob(os.path.join(directory, "*.dat")))
+    if not tables:
+        print(f"No ACPI tables (*.dat) found in {directory}")
+
+    entries, output = disassemble_tables(tables, iasl, cache_dir, jobs)
+    sys.stdout.write(output)
+
+    index = index or os.path.join(directory, INDEX_NAME)
+    with open(index, "w") as f:
+        json.dump({"tables": entries}, f, indent=2)
+
+    failed = [entry["file"] for entry in entries if entry.get("dsl") is None]
+    cached = sum(1 for entry in entries if entry.get("cached"))
+    print(f"Disassembled {len(entries) - len(failed) - cached} of {len(entries)} ACPI tables, "
+          f"reused {cached} from cache")
+    if failed:
+        print(f"ERROR: Disassembly failed for {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.directory, args.iasl, args.jobs, args.cache_dir, args.index))
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scaling benchmark for runtime_device_mapping_conflict_checker.py.
+
+Synthetic device trees (nested simple-bus hierarchies with "ranges" and
+many reg entries) and fragmented UEFI memory maps are generated in memory,
+then each checker stage is timed at increasing sizes:
+
+    parse_memmap, parse_dts_tree, parse_fdt (same tree compiled to a DTB),
+    extract_dts_mmio_ranges, find_conflicts (sort-and-sweep) and the
+    legacy nested overlap loop.
+
+The nested loop is only timed up to --naive-limit pairs, and its conflict
+count is cross-checked against the sweep result. The ranges extracted from
+the DTB must match the ones extracted from the DTS text.
+
+Usage:
+    runtime_device_mapping_bench.py [--sizes 100 1000 10000] [--output bench.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import re
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+CHECKER_PATH = Path(__file__).resolve().parent.parent / "runtime_device_mapping_conflict_checker.py"
+
+# Synthetic SoC layout: every bus maps a 256 MiB child window into the
+# physical address space above 4 GiB, devices get 64 KiB slots.
+BUS_WINDOW = 0x1000_0000
+DEVICE_SLOT = 0x1_0000
+PHYS_BASE = 0x1_0000_0000
+
+
+def load_checker(path: Path = CHECKER_PATH) -> Any:
+    """Import the checker by path (linux_scripts is not a package)."""
+    spec = importlib.util.spec_from_file_location("runtime_device_mapping_conflict_checker", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cells64(value: int) -> str:
+    return f"0x{value >> 32:x} 0x{value & 0xFFFFFFFF:x}"
+
+
+def generate_dts(reg_count: int, depth: int = 3, fanout: int = 4, regs_per_node: int = 2) -> str:
+    """Return DTS text with reg_count reg entries under nested buses.
+
+    Each bus maps its child address space onto a slice of its parent's
+    window through "ranges", so every reg goes through depth translation
+    steps, as on large server SoCs. Top-level buses are added until
+    reg_count entries have been emitted.
+    """
+    lines = ["/dts-v1/;", "/ {", "  #address-cells = <2>;", "  #size-cells = <2>;"]
+    leaf_window = BUS_WINDOW // fanout ** (depth - 1)
+    devices_per_leaf = max(1, leaf_window // (DEVICE_SLOT * regs_per_node))
+    emitted = 0
+    bus_index = 0
+
+    def emit_bus(level: int, indent: str, parent_base: int, window: int) -> None:
+        nonlocal emitted, bus_index
+        bus_index += 1
+        lines.append(f"{indent}bus{level}_{bus_index}@{parent_base:x} {{")
+        lines.append(f'{indent}  compatible = "simple-bus";')
+        lines.append(f"{indent}  #address-cells = <2>;")
+        lines.append(f"{indent}  #size-cells = <2>;")
+        lines.append(f"{indent}  ranges = <{_cells64(0)} {_cells64(parent_base)} {_cells64(window)}>;")
+        if level + 1 < depth:
+            child_window = window // fanout
+            for b in range(fanout):
+                if emitted >= reg_count:
+                    break
+                emit_bus(level + 1, indent + "  ", b * child_window, child_window)
+        else:
+            for d in range(devices_per_leaf):
+                if emitted >= reg_count:
+                    break
+                base = d * DEVICE_SLOT * regs_per_node
+                regs = min(regs_per_node, reg_count - emitted)
+                cells = " ".join(f"{_cells64(base + r * DEVICE_SLOT)} {_cells64(0x1000)}" for r in range(regs))
+                lines.append(f"{indent}  dev@{base:x} {{")
+                lines.append(f'{indent}    compatible = "vendor,bench-dev";')
+                lines.append(f"{indent}    reg = <{cells}>;")
+                lines.append(f"{indent}  }};")
+                emitted += regs
+        lines.append(f"{indent}}};")
+
+    top = 0
+    while emitted < reg_count:
+        emit_bus(0, "  ", PHYS_BASE + top * BUS_WINDOW, BUS_WINDOW)
+        top += 1
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def encode_prop(checker: Any, value: str) -> bytes:
+    """Encode a DTS property value the way dtc stores it in a DTB."""
+    value = value.strip()
+    if not value:
+        return b""
+    if value.startswith("<"):
+        cells = checker.extract_cells_from_angle_list(value)
+        return struct.pack(f">{len(cells)}I", *cells)
+    if value.startswith('"'):
+        out = b""
+        for quoted in re.findall(r'"([^"]*)"', value):
+            for part in quoted.split("\\0"):
+                out += part.encode("utf-8") + b"\0"
+        return out
+    return value.encode("utf-8") + b"\0"
+
+
+def dts_to_dtb(checker: Any, dts_text: str) -> bytes:
+    """Compile DTS text to a version 17 DTB (cells and string lists only)."""
+    root = checker.parse_dts_tree(dts_text)
+    structure = bytearray()
+    strings = bytearray()
+    string_offsets: Dict[str, int] = {}
+
+    def emit(node: Any) -> None:
+        name = b"" if node.parent is None else node.name.encode("ascii")
+        structure.extend(struct.pack(">I", checker.FDT_BEGIN_NODE) + name + b"\0")
+        structure.extend(b"\0" * (-len(structure) % 4))
+        for key, value in node.props.items():
+            if key not in string_offsets:
+                string_offsets[key] = len(strings)
+                strings.extend(key.encode("ascii") + b"\0")
+            data = encode_prop(checker, value)
+            structure.extend(struct.pack(">III", checker.FDT_PROP, len(data), string_offsets[key]) + data)
+            structure.extend(b"\0" * (-len(structure) % 4))
+        for child in node.children:
+            emit(child)
+        structure.extend(struct.pack(">I", checker.FDT_END_NODE))
+
+    emit(root)
+    structure.extend(struct.pack(">I", checker.FDT_END))
+
+    off_rsvmap = 40
+    off_struct = off_rsvmap + 16  # a single terminating reservation entry
+    off_strings = off_struct + len(structure)
+    totalsize = off_strings + len(strings)
+    header = struct.pack(
+        ">10I", checker.FDT_MAGIC, totalsize, off_struct, off_strings, off_rsvmap,
+        17, 16, 0, len(strings), len(structure),
+    )
+    return header + b"\0" * 16 + bytes(structure) + bytes(strings)
+
+
+def generate_memmap(seg_count: int, span_end: int, conflict_ratio: float = 0.01, seed: int = 0) -> str:
+    """Return a UEFI memmap with seg_count fragmented runtime segments.
+
+    Most segments sit below PHYS_BASE (normal DRAM); conflict_ratio of them
+    are placed at random inside the synthetic MMIO space to create overlaps.
+    """
+    rnd = random.Random(seed)
+    types = ["RT_Data", "RT_Code", "MMIO", "Conventional"]
+    out = []
+    cursor = 0x8000_0000
+    for _ in range(seg_count):
+        pages = rnd.randint(1, 16)
+        if rnd.random() < conflict_ratio:
+            start = rnd.randrange(PHYS_BASE, max(PHYS_BASE + 1, span_end)) & ~0xFFF
+        else:
+            start = cursor
+            cursor += (pages + rnd.randint(0, 4)) * 0x1000
+        end = start + pages * 0x1000 - 1
+        out.append(f"{rnd.choice(types):<10} 0x{start:x}-0x{end:x} {pages} 0x800000000000000f")
+    return "\n".join(out) + "\n"
+
+
+def naive_conflicts(checker: Any, mem_segs: List[Any], dts_regs: List[Any]) -> int:
+    """Count overlaps with the original nested loop."""
+    count = 0
+    for s in mem_segs:
+        for r in dts_regs:
+            if checker.overlaps(s.start, s.end, r.base, r.end):
+                count += 1
+    return count
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Return (best wall seconds over repeat runs, last result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_size(checker: Any, size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    dts_text = generate_dts(size, depth=args.depth)
+    dtb = dts_to_dtb(checker, dts_text)
+    timings: Dict[str, float] = {}
+    timings["parse_dts_tree"], root = timed(lambda: checker.parse_dts_tree(dts_text), args.repeat)
+    timings["parse_fdt"], fdt_root = timed(lambda: checker.parse_fdt(dtb), args.repeat)
+    timings["extract_dts_mmio_ranges"], dts_regs = timed(lambda: checker.extract_dts_mmio_ranges(root), args.repeat)
+    timings["extract_fdt_mmio_ranges"], fdt_regs = timed(lambda: checker.extract_dts_mmio_ranges(fdt_root), args.repeat)
+
+    span_end = max((r.end for r in dts_regs), default=PHYS_BASE)
+    memmap_text = generate_memmap(size, span_end, args.conflict_ratio, seed=size)
+    timings["parse_memmap"], mem_segs = timed(lambda: checker.parse_memmap(memmap_text), args.repeat)
+    timings["find_conflicts"], conflicts = timed(lambda: checker.find_conflicts(mem_segs, dts_regs), args.repeat)
+
+    entry: Dict[str, Any] = {
+        "size": size,
+        "dts_bytes": len(dts_text),
+        "dtb_bytes": len(dtb),
+        "memmap_segments": len(mem_segs),
+        "dts_ranges": len(dts_regs),
+        "conflicts": len(conflicts),
+        "timings_s": timings,
+    }
+    if fdt_regs != dts_regs:
+        entry["error"] = "ranges extracted from the DTB differ from the DTS text"
+    if len(mem_segs) * len(dts_regs) <= args.naive_limit:
+        timings["naive_overlap_loop"], naive = timed(lambda: naive_conflicts(checker, mem_segs, dts_regs), 1)
+        if naive != len(conflicts):
+            entry["error"] = f"sweep found {len(conflicts)} conflicts, nested loop found {naive}"
+    return entry
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the runtime device mapping checker.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="reg entries / memmap segments per run (default: 100 1000 5000)")
+    parser.add_argument("--depth", type=int, default=3, help="bus nesting depth (default: 3)")
+    parser.add_argument("--conflict-ratio", type=float, default=0.01,
+                        help="fraction of memmap segments placed in MMIO space (default: 0.01)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, best is kept (default: 3)")
+    parser.add_argument("--naive-limit", type=int, default=25_000_000,
+                        help="max segment x range pairs for the nested-loop baseline (default: 25000000)")
+    parser.add_argument("--checker", type=Path, default=CHECKER_PATH, help="checker script to benchmark")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.depth < 1 or args.repeat < 1:
+        print("ERROR: --depth and --repeat must be at least 1", file=sys.stderr)
+        return 1
+
+    checker = load_checker(args.checker)
+    results = [run_size(checker, size, args) for size in args.sizes]
+
+    stages = ["parse_memmap", "parse_dts_tree", "parse_fdt", "extract_dts_mmio_ranges",
+              "extract_fdt_mmio_ranges", "find_conflicts", "naive_overlap_loop"]
+    print(f"{'size':>8} {'ranges':>8} {'confl':>6} " + " ".join(f"{s[:14]:>14}" for s in stages))
+    for entry in results:
+        cols = [f"{entry['timings_s'][s]:14.4f}" if s in entry["timings_s"] else f"{'-':>14}" for s in stages]
+        print(f"{entry['size']:>8} {entry['dts_ranges']:>8} {entry['conflicts']:>6} " + " ".join(cols))
+        if "error" in entry:
+            print(f"ERROR: size {entry['size']}: {entry['error']}", file=sys.stderr)
+
+    if args.output:
+        report = {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "checker": str(args.checker),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    return 1 if any("error" in entry for entry in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
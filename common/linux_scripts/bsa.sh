@@ -18,12 +18,8 @@
 
 LOG_DIR="/mnt/acs_results_template/acs_results"
 
-# Parse config file
-automation_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation`"
-if [ "$automation_enabled" == "True" ]; then
-    bsa_command="`python3 /mnt/acs_tests/parser/Parser.py -bsa`"
-    bsa_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_bsa_run`"
-fi
+# Parse config file in one run, cached against the ini's mtime
+eval "`python3 /mnt/acs_tests/parser/Parser.py --export-shell --cache /mnt/acs_tests/config/acs_run_config.cache`"
 
   # Linux BSA Execution
 echo "Running Linux BSA tests"
@@ -35,13 +31,11 @@ else
     insmod /lib/modules/bsa_acs.ko
     echo "SystemReady band ACS v3.1.1" > ${LOG_DIR}/linux/BsaResultsApp.log
     if [ "$automation_enabled" == "False" ]; then
-      /bin/bsa --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/BsaResultsApp.log
+      python3 /usr/bin/kmsg_capture.py --output ${LOG_DIR}/linux/BsaResultsKernel.log -- /bin/bsa --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/BsaResultsApp.log
     else
-      $bsa_command --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/BsaResultsApp.log
+      python3 /usr/bin/kmsg_capture.py --output ${LOG_DIR}/linux/BsaResultsKernel.log -- $bsa_command --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/BsaResultsApp.log
     fi
-    dmesg | sed -n 'H; /PE_INFO/h; ${g;p;}' > ${LOG_DIR}/linux/BsaResultsKernel.log
-    sync /mnt
-    sleep 5
+    python3 /usr/bin/results_writer.py sync ${LOG_DIR}/linux/BsaResultsApp.log ${LOG_DIR}/linux/BsaResultsKernel.log --settle "${settle_seconds:-0}"
     echo "Linux BSA test Execution - Completed"
   else
     echo "Error: BSA kernel Driver is not found. Linux BSA tests cannot be run."
@@ -38,13 +38,21 @@ Each variable must have specific EFI variable attributes as per the specificatio
 
 This module is typically run after a capsule update operation to validate that
 the firmware correctly implemented capsule on-disk update reporting.
+
+efivarfs is read once into an EfiVarSnapshot: only the GUID namespaces of
+interest are read, with one open per variable. With --efivars-tarball the same
+snapshot is loaded from a tarball of efivars captured on another board, so the
+check can be run offline.
 """
 
+import argparse
 import os
 import re
 import struct
+import tarfile
 import uuid
 import sys
+from types import MappingProxyType
 
 # Attribute bits (UEFI Specification 8.2 - GetVariable and SetVariable)
 # These define the access and persistence characteristics of EFI variables
@@ -72,6 +80,18 @@ EFI_OS_INDICATIONS_FILE_CAPSULE_DELIVERY_SUPPORTED = 0x0000000000000004
 # Path to EFI variables in sysfs (requires efivarfs to be mounted)
 EFIVAR_PATH = "/sys/firmware/efi/efivars"
 
+# Variables kept in the snapshot per GUID: the whole Capsule Report namespace
+# (for CapsuleNNNN) and only OsIndicationsSupported from the global namespace.
+# The listed names are still read directly if efivarfs cannot be listed.
+SNAPSHOT_NAMESPACES = {
+    CapsuleReportGuid: ("CapsuleMax", "CapsuleLast"),
+    GlobalVariableGuid: ("OsIndicationsSupported",),
+}
+SNAPSHOT_WHOLE_NAMESPACES = {CapsuleReportGuid}
+
+# efivarfs file names are <name>-<36 character GUID>
+EFIVAR_FILE_RE = re.compile(r"^(?P<name>.+)-(?P<guid>[0-9A-Fa-f]{8}(?:-[0-9A-Fa-f]{4}){3}-[0-9A-Fa-f]{12})$")
+
 # Log file path for test results
 LOG_FILE = "/mnt/acs_results_template/fw/capsule_test_results.log"
 
@@ -131,9 +151,112 @@ def result_status(ok: bool, test_level: str = "RECOMMENDED"):
         return "PASSED"
     return "FAILED" if test_level == "MANDATORY" else "WARNING"
 
+def parse_efivar_data(data):
+    """
+    Split efivarfs file contents into (attributes, value).
+
+    The EFI variable format in efivarfs is: [4 bytes of attributes][variable data]
+    Attributes are stored as a 32-bit little-endian integer. Returns None if
+    the data is too short to hold the attributes.
+    """
+    if data is None or len(data) < 4:
+        return None
+    # Extract 4-byte little-endian attributes field
+    attrs = struct.unpack("<I", data[:4])[0]
+    return attrs, data[4:]
+
+def snapshot_wants(name, guid):
+    """Return True if the variable belongs in the snapshot."""
+    if guid in SNAPSHOT_WHOLE_NAMESPACES:
+        return True
+    return name in SNAPSHOT_NAMESPACES.get(guid, ())
+
+class EfiVarSnapshot:
+    """
+    Immutable view of the EFI variables of interest: (name, guid) -> (attrs, value).
+
+    Variables that exist but could not be read map to None. enumerated is False
+    when the variable store could not be listed and only the names in
+    SNAPSHOT_NAMESPACES were read.
+    """
+
+    def __init__(self, variables, enumerated=True):
+        self.variables = MappingProxyType(dict(variables))
+        self.enumerated = enumerated
+
+    @classmethod
+    def from_efivarfs(cls, path=EFIVAR_PATH):
+        """Read the variables of interest from a mounted efivarfs."""
+        try:
+            entries = os.listdir(path)
+            enumerated = True
+        except OSError:
+            entries = [f"{name}-{guid}" for guid, names in SNAPSHOT_NAMESPACES.items() for name in names]
+            enumerated = False
+
+        variables = {}
+        for entry in entries:
+            match = EFIVAR_FILE_RE.match(entry)
+            if not match:
+                continue
+            name, guid = match.group("name"), match.group("guid").lower()
+            if not snapshot_wants(name, guid):
+                continue
+            try:
+                with open(os.path.join(path, entry), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            except OSError:
+                data = None
+            variables[(name, guid)] = parse_efivar_data(data)
+        return cls(variables, enumerated)
+
+    @classmethod
+    def from_tarball(cls, tar_path):
+        """
+        Read the variables of interest from a tarball of an efivarfs directory.
+
+        Member directories are ignored, so both "efivars/<var>" and "<var>"
+        layouts work. Raises OSError or tarfile.TarError if it cannot be read.
+        """
+        variables = {}
+        with tarfile.open(tar_path, "r:*") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                match = EFIVAR_FILE_RE.match(os.path.basename(member.name))
+                if not match:
+                    continue
+                name, guid = match.group("name"), match.group("guid").lower()
+                if snapshot_wants(name, guid):
+                    variables[(name, guid)] = parse_efivar_data(tar.extractfile(member).read())
+        return cls(variables)
+
+    def get(self, name, guid):
+        """Return (attributes, value), or (None, None) if missing or unreadable."""
+        entry = self.variables.get((name, guid.lower()))
+        return entry if entry is not None else (None, None)
+
+    def names(self, guid):
+        """Return the sorted variable names present in a GUID namespace."""
+        guid = guid.lower()
+        return sorted(name for name, var_guid in self.variables if var_guid == guid)
+
+# Snapshot used by read_efi_var(); main() replaces it with a tarball snapshot
+# when one is given, otherwise efivarfs is read on first use.
+_efivar_snapshot = None
+
+def efivar_snapshot():
+    """Return the current EFI variable snapshot, reading efivarfs if needed."""
+    global _efivar_snapshot
+    if _efivar_snapshot is None:
+        _efivar_snapshot = EfiVarSnapshot.from_efivarfs(EFIVAR_PATH)
+    return _efivar_snapshot
+
 def read_efi_var(var_name, guid=CapsuleReportGuid):
     """
-    Read an EFI variable from efivarfs and extract its attributes and value.
+    Look up an EFI variable in the snapshot.
 
     Args:
         var_name (str): The name of the variable to read (without GUID suffix)
@@ -143,24 +266,8 @@ def read_efi_var(var_name, guid=CapsuleReportGuid):
         tuple: (attributes, value) where attributes is an int (4-byte little-endian)
                and value is bytes containing the variable data. Returns (None, None)
                if the variable doesn't exist or cannot be read.
-
-    The EFI variable format in efivarfs is: [4 bytes of attributes][variable data]
-    Attributes are stored as a 32-bit little-endian integer.
     """
-    path = f"{EFIVAR_PATH}/{var_name}-{guid}"
-    if not os.path.exists(path):
-        return None, None
-    try:
-        with open(path, "rb") as f:
-            data = f.read()
-    except OSError:
-        return None, None
-    if len(data) < 4:
-        return None, None
-    # Extract 4-byte little-endian attributes field
-    attrs = struct.unpack("<I", data[:4])[0]
-    value = data[4:]
-    return attrs, value
+    return efivar_snapshot().get(var_name, guid)
 
 def decode_char16_11_no_nul(value):
     """
@@ -393,8 +500,8 @@ def check_capsule_nnnn(test_level: str):
     individual capsule payloads processed during on-disk update operations. Multiple
     capsule entries can exist for a single update operation.
 
-    The check iterates through all variables in the Capsule Report GUID namespace,
-    filters for those matching the CapsuleNNNN pattern, and validates each one.
+    The check iterates through all snapshot variables in the Capsule Report GUID
+    namespace, filters for those matching the CapsuleNNNN pattern, and validates each one.
     If no CapsuleNNNN variables are found at all, the check fails so the overall
     result reflects the missing reporting variables.
 
@@ -402,24 +509,16 @@ def check_capsule_nnnn(test_level: str):
         bool: True if all found CapsuleNNNN variables are valid.
               False if none are found or if any CapsuleNNNN variables fail validation.
     """
-    suffix = "-" + CapsuleReportGuid
-
-    try:
-        entries = os.listdir(EFIVAR_PATH)
-    except OSError:
+    snapshot = efivar_snapshot()
+    if not snapshot.enumerated:
         log(f"RESULTS: CapsuleNNNN Variable Test: efivarfs not accessible - {result_status(False, test_level)}")
         return False
 
     any_failed = False
     found_any = False
 
-    # Iterate through all variables in efivarfs and filter for CapsuleNNNN entries
-    for name in sorted(entries):
-        if not name.endswith(suffix):
-            continue
-
-        # Extract variable name by removing the GUID suffix
-        var = name[:-len(suffix)]
+    # Iterate through the Capsule Report namespace and filter for CapsuleNNNN entries
+    for var in snapshot.names(CapsuleReportGuid):
         # Check if variable name matches the CapsuleNNNN pattern (Capsule + 4 hex digits)
         if not CAPSULE_NAME_RE.fullmatch(var):
             continue
@@ -446,7 +545,7 @@ def check_capsule_nnnn(test_level: str):
 
     return not any_failed
 
-def main():
+def main(efivars_tarball=None):
     """
     Main entry point for capsule on-disk update reporting variables validation.
 
@@ -457,12 +556,18 @@ def main():
     3. CapsuleNNNN - individual capsule entry variables
 
     Before any checks are run, this function verifies that efivarfs is mounted
-    at /sys/firmware/efi/efivars, which is required to read EFI variables.
+    at /sys/firmware/efi/efivars, which is required to read EFI variables, and
+    takes a snapshot of it. With efivars_tarball the snapshot is loaded from
+    that tarball instead.
+
+    Args:
+        efivars_tarball (str or None): Tarball of an efivarfs directory captured
+            on another board.
 
     Returns:
         int: Exit code for the script
             - 0 if all checks pass
-            - 1 if efivarfs is not available
+            - 1 if efivarfs (or the tarball) is not available
             - 2 if on-disk is not supported (checks skipped)
             - 3 if any of the capsule variable checks fail and on-disk is supported
     """
@@ -471,10 +576,21 @@ def main():
     log("Testing Capsule On-Disk Update Reporting Variables")
     log("================================================================================================")
 
-    if not os.path.isdir(EFIVAR_PATH):
+    global _efivar_snapshot
+    if efivars_tarball:
+        try:
+            _efivar_snapshot = EfiVarSnapshot.from_tarball(efivars_tarball)
+        except (OSError, tarfile.TarError) as e:
+            log(f"INFO: Unable to read efivars tarball {efivars_tarball}: {e} - WARNING")
+            log("RESULTS: Overall Capsule On-Disk Update Reporting Variables Result: WARNING")
+            return 1
+        log(f"INFO: Using efivars snapshot from {efivars_tarball}")
+    elif not os.path.isdir(EFIVAR_PATH):
         log(f"INFO: {EFIVAR_PATH} not present. Please ensure efivarfs is enabled and mounted - WARNING")
         log("RESULTS: Overall Capsule On-Disk Update Reporting Variables Result: WARNING")
         return 1
+    else:
+        _efivar_snapshot = EfiVarSnapshot.from_efivarfs(EFIVAR_PATH)
 
     on_disk_supported, os_indications_value = os_indications_supports_ondisk()
     if os_indications_value is None:
@@ -565,5 +681,16 @@ def main():
         log("RESULTS: Overall Capsule On-Disk Update Reporting Variables Result: WARNING")
     return exit_code
 
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Validate UEFI capsule on-disk update reporting variables."
+    )
+    parser.add_argument(
+        "--efivars-tarball",
+        help="Check a tarball of efivars captured on another board instead of the local efivarfs",
+    )
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(parse_args().efivars_tarball))
@@ -20,13 +20,19 @@ DHCP verification, IPv6 testing, and network connectivity checks via ping,
 wget, and curl.
 """
 
+import argparse
+import io
 import re
+import select
 import shutil
 import signal
+import socket
 import subprocess  # nosec B404
 import sys
+import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Dict
@@ -78,6 +84,26 @@ TEST_ORDER = [
     "Ping ipv6.google.com (IPv6)"
 ]
 
+# Readiness waits return as soon as the condition holds; timeouts are upper bounds
+LINK_UP_TIMEOUT = 20
+LINK_DOWN_TIMEOUT = 20
+SELF_TEST_LINK_TIMEOUT = 10
+# After the link is up, the system DHCP client's address and default route
+ADDRESS_ROUTE_TIMEOUT = 20
+DHCP_ROUTE_TIMEOUT = 10
+LINK_POLL_INTERVAL = 0.2
+
+# rtnetlink multicast groups that wake readiness waits (link, IPv4 address, IPv4 route)
+NETLINK_ROUTE = 0
+RTNL_GROUPS = 0x1 | 0x10 | 0x40
+RTNL_RECHECK_INTERVAL = 1.0
+
+PROC_NET_ROUTE = Path("/proc/net/route")
+RTF_UP = 0x1
+
+# Policy-routing tables/rule priorities used per interface in --jobs mode
+ISOLATION_TABLE_BASE = 1000
+
 # Parsing the summary
 results = {}
 
@@ -350,6 +376,14 @@ def is_virtual_iface(iface):
 
     return False
 
+def run_logged(cmd, **kwargs):
+    """Run cmd and print its output, so --jobs mode keeps it in the interface's log."""
+    r = subprocess.run(cmd, capture_output=True, text=True, check=False, **kwargs)
+    output = (r.stdout + r.stderr).strip()
+    if output:
+        print(output)
+    return r
+
 # To renew DHCP when doesn’t exist.
 def renew_dhcp(intrf, busybox_env):
     """Try to restore a default route for an interface using DHCP."""
@@ -358,24 +392,25 @@ def renew_dhcp(intrf, busybox_env):
     print_color(f"Default route via {intrf} is missing; attempting DHCP restore", "INFO")
     try:
         if busybox_env and shutil.which("udhcpc"):
-            subprocess.run([UDHCPC_CMD, "-n", "-q", "-i", intrf], timeout=30, check=False)
+            run_logged([UDHCPC_CMD, "-n", "-q", "-i", intrf], timeout=30)
         elif shutil.which("dhclient"):
-            subprocess.run([DHCLIENT_CMD, "-r", intrf], timeout=20, check=False)
-            subprocess.run([DHCLIENT_CMD, "-1", intrf], timeout=35, check=False)
+            run_logged([DHCLIENT_CMD, "-r", intrf], timeout=20)
+            run_logged([DHCLIENT_CMD, "-1", intrf], timeout=35)
         else:
             print_color("No DHCP client found (udhcpc/dhclient). Skipping restore.", "WARN")
     except subprocess.TimeoutExpired:
         print_color(f"DHCP action on {intrf} timed out", "WARN")
-    for _ in range(10):
-        if has_default_route(intrf):
-            print_color(f"Default route restored on {intrf}", "CHECK")
-            break
-        time.sleep(1)
+    if wait_until(lambda: intrf in default_route_devs(), DHCP_ROUTE_TIMEOUT) or \
+            has_default_route(intrf):
+        print_color(f"Default route restored on {intrf}", "CHECK")
     return True
 
 # To check if the default route already exist.
 def has_default_route(dev):
     """Return True if the given interface has a default route."""
+    if dev in default_route_devs():
+        return True
+    # Not in the main table; other tables are only visible through ip.
     r = subprocess.run([IP_CMD, "route", "show", "default"], capture_output=True,
                        text=True, check=False)
     if r.returncode == 0:
@@ -390,6 +425,18 @@ def has_default_route(dev):
                 return True
     return False
 
+def default_gateway(dev):
+    """Return the gateway of dev's own default route, or None."""
+    r = subprocess.run([IP_CMD, "-o", "route", "show", "table", "all", "default"],
+                       capture_output=True, text=True, check=False)
+    if r.returncode != 0:
+        return None
+    for line in r.stdout.splitlines():
+        m = re.search(r'\bvia\s+(\d{1,3}(?:\.\d{1,3}){3})', line)
+        if m and f" dev {dev} " in f" {line} ":
+            return m.group(1)
+    return None
+
 #Restoring the interfaces to their original states on exit
 def cleanup():
     """Restore Ethernet interfaces to their original up/down states."""
@@ -408,10 +455,600 @@ def handle_exit_signal(_signum, _frame):
 signal.signal(signal.SIGINT, handle_exit_signal)
 signal.signal(signal.SIGTERM, handle_exit_signal)
 
+def default_route_devs():
+    """Return interfaces with an IPv4 default route in the main table (/proc/net/route)."""
+    try:
+        lines = PROC_NET_ROUTE.read_text(encoding="utf-8").splitlines()[1:]
+    except OSError:
+        return set()
+    devs = set()
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 8 and fields[1] == "00000000" and fields[7] == "00000000" \
+                and int(fields[3], 16) & RTF_UP:
+            devs.add(fields[0])
+    return devs
+
+def open_rtnetlink():
+    """Return a non-blocking rtnetlink socket subscribed to RTNL_GROUPS, or None."""
+    family = getattr(socket, "AF_NETLINK", None)
+    if family is None:
+        return None
+    try:
+        sock = socket.socket(family, socket.SOCK_RAW, NETLINK_ROUTE)
+    except OSError:
+        return None
+    try:
+        sock.bind((0, RTNL_GROUPS))
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+def wait_until(predicate, timeout):
+    """Return True as soon as predicate() holds, False once timeout expires.
+
+    The predicate is re-evaluated whenever rtnetlink reports a link, address
+    or route change. Without rtnetlink it is polled every LINK_POLL_INTERVAL.
+    """
+    sock = open_rtnetlink()
+    if sock is None:
+        for _ in range(int(timeout / LINK_POLL_INTERVAL)):
+            if predicate():
+                return True
+            time.sleep(LINK_POLL_INTERVAL)
+        return predicate()
+
+    # Subscribed before the first check, so no change can slip in between.
+    with sock:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([sock], [], [],
+                                           min(remaining, RTNL_RECHECK_INTERVAL))
+            while readable:
+                try:
+                    sock.recv(65536)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    # ENOBUFS: events were dropped; the re-check covers them.
+                    continue
+    return True
+
+def read_net_attr(iface, attr, default=""):
+    """Read /sys/class/net/<iface>/<attr>, returning default if unreadable."""
+    try:
+        return Path(f"/sys/class/net/{iface}/{attr}").read_text(encoding="utf-8").strip()
+    except OSError:
+        return default
+
+def link_is_up(iface):
+    """Return True if the interface reports carrier or operstate up."""
+    return read_net_attr(iface, "carrier", "0") == "1" or \
+        read_net_attr(iface, "operstate", "down") == "up"
+
+def wait_for_link(iface, timeout=LINK_UP_TIMEOUT):
+    """Wait until the link is up; return False if timeout expires first."""
+    return wait_until(lambda: link_is_up(iface), timeout)
+
+def has_ipv4_address(iface):
+    """Return True if the interface has an IPv4 address outside 127.0.0.0/8."""
+    r = subprocess.run([IP_CMD, "address", "show", "dev", iface], capture_output=True,
+                       text=True, check=False)
+    return any(not ip.startswith("127.")
+               for ip in re.findall(r'inet (\d+\.\d+\.\d+\.\d+)/\d+', r.stdout))
+
+def wait_for_network(iface):
+    """Wait for link, then for an IPv4 address and a default route on the interface.
+
+    The system DHCP client is usually still configuring the interface when the
+    link comes up; checking before it finishes would make renew_dhcp() release
+    the lease it is obtaining. Returns False if either wait times out.
+    """
+    if not wait_for_link(iface):
+        return False
+    return wait_until(lambda: has_ipv4_address(iface) and iface in default_route_devs(),
+                      ADDRESS_ROUTE_TIMEOUT)
+
+def wait_for_links_down(ifaces, timeout=LINK_DOWN_TIMEOUT):
+    """Wait until none of the interfaces reports link up."""
+    return wait_until(lambda: not any(link_is_up(i) for i in ifaces), timeout)
+
+class RouteIsolation:
+    """Per-interface policy routing so concurrent checks leave via their own NIC.
+
+    A dedicated table holds the interface's default route, selected for
+    traffic sourced from its address or bound to it (ping -I, curl --interface).
+    """
+
+    def __init__(self, iface, table):
+        self.iface = iface
+        self.table = str(table)
+        self.source = None
+        self._undo = []
+
+    def _ip(self, *args):
+        r = subprocess.run([IP_CMD, *args], capture_output=True, text=True, check=False)
+        if r.returncode != 0:
+            print_color(f"ip {' '.join(args)} failed: {r.stderr.strip()}", "WARN")
+        return r.returncode == 0
+
+    def _rule(self, *selector):
+        rule = (*selector, "lookup", self.table, "priority", self.table)
+        if self._ip("rule", "add", *rule):
+            self._undo.append(("rule", "del", *rule))
+            return True
+        return False
+
+    def begin(self):
+        """Send traffic bound to the interface through its table before any route query.
+
+        The table is empty until setup(), so lookups fall through to the main
+        table as usual.
+        """
+        self._undo.append(("route", "flush", "table", self.table))
+        return self._rule("oif", self.iface)
+
+    def setup(self, gateway, source):
+        """Install the interface's default route and source rule; return False on failure."""
+        self.source = source
+        ok = self._ip("route", "replace", "default", "via", gateway, "dev", self.iface,
+                      "table", self.table)
+        ok = self._rule("from", source) and ok
+        if not ok:
+            print_color(f"Routing isolation for {self.iface} incomplete; results may "
+                        "reflect another interface's route", "WARN")
+        return ok
+
+    def teardown(self):
+        """Remove everything setup() installed."""
+        while self._undo:
+            self._ip(*self._undo.pop())
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout proxy sending each worker thread's prints to its own buffer."""
+
+    def __init__(self, real):
+        super().__init__()
+        self.real = real
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buf = io.StringIO()
+
+    def release(self):
+        buf = getattr(self._local, "buf", None)
+        self._local.buf = None
+        return buf.getvalue() if buf else ""
+
+    def write(self, text):
+        buf = getattr(self._local, "buf", None)
+        return (buf or self.real).write(text)
+
+    def flush(self):
+        self.real.flush()
+
+def validate_interface(intrf, have_ethtool, busybox_env, isolation=None):
+    """Run every check for one physical interface and record its results.
+
+    With isolation (a RouteIsolation), other interfaces may be up at the same
+    time, so route lookups and connectivity probes are pinned to intrf.
+    """
+    # Bring up the current interface
+    print_color(f"Bringing up ethernet interface: {intrf}", "INFO")
+    result_up = run_logged([IP_CMD, "link", "set", "dev", intrf, "up"])
+    if result_up.returncode != 0:
+        print_color(f"Unable to bring up ethernet interface {intrf} using ip", "WARN")
+        set_result(intrf, "Bring up", FAILED, "ip link set up failed")
+        # Skip everything else for this interface if unable to Bring up
+        remaining = [t for t in TEST_ORDER if t not in ("Detect interface", "Bring up")]
+        skip_many(intrf, remaining, "Interface could not be brought up")
+        print("\n****************************************************************\n")
+        return
+
+    set_result(intrf, "Bring up", PASSED)
+    wait_for_network(intrf)
+
+    # Check for ethtool availability
+    if have_ethtool:
+        set_result(intrf, "ethtool present", PASSED)
+        print_color(f"Running \"ethtool {intrf}\"", "INFO")
+        result_ethdump = subprocess.run([ETHTOOL_CMD, intrf], capture_output=True,
+                                        text=True, check=False)
+        print(result_ethdump.stdout)
+
+        result_test = subprocess.run([ETHTOOL_CMD, "-i", intrf], capture_output=True,
+                                     text=True, check=False)
+        print(result_test.stdout)
+        if "supports-test: yes" in result_test.stdout:
+            print_color(f"Ethernet interface {intrf} supports ethtool self test.", "CHECK")
+            set_result(intrf, "Self-test supported", PASSED)
+            print_color(f"Running ethtool -t {intrf}", "INFO")
+            try:
+                t = subprocess.run([ETHTOOL_CMD, "-t", intrf], capture_output=True,
+                                   text=True, timeout=60, check=False)
+                print_color(t.stdout, "DEBUG")
+                if t.returncode == 0:
+                    set_result(intrf, "ethtool self tests", PASSED)
+                else:
+                    output_lines = (t.stdout + "\n" + t.stderr).splitlines()
+                    first_line = next((ln for ln in output_lines if ln.strip()), "")
+                    set_result(intrf, "ethtool self tests", WARNING,
+                               first_line or f"returncode={t.returncode}")
+            except subprocess.TimeoutExpired:
+                print_color("ethtool -t timed out (60s)", "WARN")
+                set_result(intrf, "ethtool self tests", WARNING, "timeout")
+
+            run_logged([IP_CMD, "link", "set", "dev", intrf, "up"])
+            if wait_until(lambda: read_net_attr(intrf, "carrier", "0") == "1",
+                          SELF_TEST_LINK_TIMEOUT):
+                print_color(f"Link restored on {intrf}", "CHECK")
+
+        else:
+            print_color(f"Ethernet interface {intrf} does not support ethtool self test",
+                        "WARN")
+            set_result(intrf, "Self-test supported", SKIPPED, "supports-test: no")
+            set_result(intrf, "ethtool self tests", SKIPPED, "Self-test not supported")
+
+        if "Link detected: yes" in result_ethdump.stdout:
+            print_color(f"Link detected on {intrf}", "CHECK")
+            set_result(intrf, "Link detected", PASSED)
+        else:
+            print_color(f"Link not detected for {intrf}", "WARN")
+            set_result(intrf, "Link detected", FAILED, "No carrier")
+            # Skip everything else that needs a link
+            skip_many(intrf, [
+                "Gateway Address present",
+                "Ping gateway (IPv4)",
+                "Ping www.arm.com (IPv4)",
+                "IPv6 address present",
+                "Ping ipv6.google.com (IPv6)",
+                "wget and curl",
+            ], "Link not detected")
+            print("\n****************************************************************\n")
+            return
+    else:
+        set_result(intrf, "ethtool present", FAILED, "ethtool not found; using sysfs")
+        set_result(intrf, "Self-test supported", SKIPPED, "No ethtool")
+        set_result(intrf, "ethtool self tests", SKIPPED, "No ethtool")
+        print_color("ethtool not found; using sysfs for link detection", "WARN")
+        try:
+            carrier = Path(f"/sys/class/net/{intrf}/carrier").read_text(
+                    encoding="utf-8").strip()
+        except OSError:
+            carrier = "0"
+        if carrier != "1":
+            try:
+                oper = Path(f"/sys/class/net/{intrf}/operstate").read_text(
+                        encoding="utf-8").strip()
+            except OSError:
+                oper = "down"
+            if oper != "up":
+                print_color(f"Link not detected for {intrf} "
+                            f"(carrier={carrier}, operstate={oper})", "WARN")
+                set_result(intrf, "Link detected", FAILED,
+                           f"carrier={carrier}, operstate={oper}")
+                skip_many(intrf, [
+                    "Gateway Address present",
+                    "Ping gateway (IPv4)",
+                    "Ping www.arm.com (IPv4)",
+                    "IPv6 address present",
+                    "Ping ipv6.google.com (IPv6)",
+                    "wget and curl",
+                ], "Link not detected")
+                print("\n**************************************************************\n")
+                return
+        print_color(f"Link detected on {intrf} (sysfs)", "CHECK")
+        set_result(intrf, "Link detected", PASSED)
+
+    # Check IPv4 and IPv6 address configuration
+    command = [IP_CMD, "address", "show", "dev", intrf]
+    print_color(f"Running ip address show dev {intrf}", "INFO")
+    result_addr = subprocess.run(command, capture_output=True,
+                                 text=True, check=False)
+    print(result_addr.stdout)
+
+    has_dhcp = "dynamic" in result_addr.stdout
+    has_ipv6 = re.search(r'inet6 (?!fe80)', result_addr.stdout)
+
+    # Detect any IPv4 (dynamic or static)
+    ipv4_matches = re.findall(r'inet (\d+\.\d+\.\d+\.\d+)/\d+', result_addr.stdout)
+    ipv4_list = [ip for ip in ipv4_matches if not ip.startswith("127.")]
+    has_ipv4 = len(ipv4_list) > 0
+
+    # Default route to evaluate whenever we have any IPv4
+    if not has_default_route(intrf):
+        renew_dhcp(intrf, busybox_env)
+        command = [IP_CMD, "address", "show", "dev", intrf]
+        result_addr = subprocess.run(command, capture_output=True,
+                                     text=True, check=False)
+        print(result_addr.stdout)
+        has_dhcp = "dynamic" in result_addr.stdout
+        has_ipv6 = re.search(r'inet6 (?!fe80)', result_addr.stdout)
+        ipv4_matches = re.findall(r'inet (\d+\.\d+\.\d+\.\d+)/\d+', result_addr.stdout)
+        ipv4_list = [ip for ip in ipv4_matches if not ip.startswith("127.")]
+        has_ipv4 = len(ipv4_list) > 0
+
+    if isolation and has_ipv4:
+        # Pin this interface's lookups to its own gateway before deciding on
+        # it, whatever other interfaces' DHCP clients do to the main table.
+        own_gateway = default_gateway(intrf)
+        if own_gateway:
+            isolation.setup(own_gateway, ipv4_list[0])
+
+    if has_ipv4 and has_default_route(intrf):
+        set_result(intrf, "Gateway Address present", PASSED)
+    elif has_ipv4:
+        reason = "No default route" + (" after DHCP" if has_dhcp else " (static config)")
+        set_result(intrf, "Gateway Address present", FAILED, reason)
+    else:
+        set_result(intrf, "Gateway Address present", SKIPPED, "No IPv4 address")
+
+    # DHCP result
+    #if has_dhcp:
+    #    set_result(intrf, "IPv4 DHCP", PASSED)
+    #else:
+    #    print_color(f"{intrf} does not have a dynamic IPv4 address", "WARN")
+    #    set_result(intrf, "IPv4 DHCP", FAILED, "No dynamic IPv4 assigned")
+
+    # IPv4 address present (independent from DHCP)
+    if has_ipv4:
+        ip_type = "dynamic" if has_dhcp else "static"
+        set_result(intrf, "IPv4 address present", PASSED,
+                   f"{ip_type} {', '.join(ipv4_list)}")
+    else:
+        set_result(intrf, "IPv4 address present", FAILED, "No IPv4 address")
+
+
+
+    # Run ping6 if global IPv6 address is found
+    if has_ipv6:
+        set_result(intrf, "IPv6 address present", PASSED)
+        ipv6_addresses = re.findall(r'inet6 ([\da-f:]+)/\d+ scope global',
+                                    result_addr.stdout)
+        for ip6 in ipv6_addresses:
+            print_color(f"Found global IPv6 address on {intrf} → {ip6}", "CHECK")
+        ping6_bin = shutil.which("ping") or shutil.which("ping6")
+        if "ping6" in (ping6_bin or ""):
+            ping6_command = [PING6_CMD, "-c", "3", "-I", intrf, "ipv6.google.com"]
+            ping6_command_display = f"ping6 -c 3 -I {intrf} ipv6.google.com"
+        else:
+            ping6_command = [PING_CMD, "-6", "-c", "3", "-I", intrf, "ipv6.google.com"]
+            ping6_command_display = f"ping -6 -c 3 -I {intrf} ipv6.google.com"
+        print_color(f"Running {ping6_command_display}", "INFO")
+        result_ping6 = subprocess.run(ping6_command, capture_output=True,
+                                      text=True, check=False)
+        print(result_ping6.stdout)
+        if result_ping6.returncode != 0 or "100% packet loss" in result_ping6.stdout:
+            print_color(f"Failed to ping ipv6.google.com via {intrf}", "WARN")
+            set_result(intrf, "Ping ipv6.google.com (IPv6)", WARNING,
+                       "Packet loss or ping failed")
+        else:
+            print_color(f"Ping to ipv6.google.com via {intrf} is successful", "CHECK")
+            set_result(intrf, "Ping ipv6.google.com (IPv6)", PASSED)
+    else:
+        print_color(f"No IPv6 address found on {intrf}, skipping IPv6 test", "INFO")
+        set_result(intrf, "IPv6 address present", SKIPPED, "No global IPv6")
+        set_result(intrf, "Ping ipv6.google.com (IPv6)", SKIPPED, "No global IPv6")
+
+    # If no IPv4 DHCP, skip IPv4-dependent tests
+    if results[intrf]["IPv4 address present"]["status"] != PASSED or \
+       results[intrf]["Gateway Address present"]["status"] != PASSED:
+        skip_many(intrf, [
+            "Ping gateway (IPv4)",
+            "Ping www.arm.com (IPv4)",
+            "wget and curl",
+        ], "No IPv4 and/or default route")
+        print("\n****************************************************************\n")
+        return
+
+    # Determine default router/gateway and verify the route path
+    route_get = [IP_CMD, "route", "get", "8.8.8.8"]
+    if isolation:
+        # Other interfaces are up too; only consider routes leaving this one.
+        route_get += ["oif", intrf]
+    print_color(f"Running ip {' '.join(route_get[1:])}", "INFO")
+    r = subprocess.run(route_get, capture_output=True, text=True, check=False)
+    print(r.stdout)
+    if r.returncode != 0:
+        print_color(f"No default route available for {intrf} (route get failed), "
+                    "skipping further tests for this interface", "WARN")
+        skip_many(intrf, [
+            "Ping gateway (IPv4)",
+            "Ping www.arm.com (IPv4)",
+            "wget and curl",
+        ], "ip route get failed")
+        print("\n****************************************************************\n")
+        return
+
+    m = re.search(r'\bvia\s+(\d{1,3}(?:\.\d{1,3}){3}).*?\bdev\s+(\S+)', r.stdout)
+    if not m:
+        print_color("Unable to parse gateway/dev from route output, "
+                    f"skipping further tests for {intrf}", "WARN")
+        skip_many(intrf, [
+            "Ping gateway (IPv4)",
+            "Ping www.arm.com (IPv4)",
+            "wget and curl",
+        ], "Cannot parse gateway")
+        print("\n****************************************************************\n")
+        return
+
+    gw, dev_on_path = m.group(1), m.group(2)
+    if dev_on_path != intrf:
+        print_color(f"Default route to 8.8.8.8 is via {dev_on_path}, "
+                    f"not {intrf}; skipping further tests for {intrf}", "WARN")
+        skip_many(intrf, [
+            "Ping gateway (IPv4)",
+            "Ping www.arm.com (IPv4)",
+            "wget and curl",
+        ], f"Route uses {dev_on_path}")
+        print("\n****************************************************************\n")
+        return
+
+    ip_address = gw
+    print_color(f"Router/Gateway IP for {intrf} : {ip_address}", "CHECK")
+
+    set_result(intrf, "Gateway Address present", PASSED, f"gateway {gw}")
+
+    run_logged([IP_CMD, "link", "set", "dev", intrf, "up"])
+    wait_for_network(intrf)
+
+    # Run IPv4 ping test to the router/gateway
+    cmd = [PING_CMD, "-c", "3", "-W", "10", "-I", intrf, ip_address]
+    print_color(f"Running ping -c 3 -W 10 -I {intrf} {ip_address}", "INFO")
+    rping = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    print(rping.stdout)
+    if rping.returncode != 0 or "100% packet loss" in rping.stdout:
+        print_color(f"Failed to ping router/gateway[{ip_address}] for {intrf}", "WARN")
+        set_result(intrf, "Ping gateway (IPv4)", WARNING, "Packet loss or ping failed")
+    else:
+        print_color(f"Ping to router/gateway[{ip_address}] for {intrf} is successful",
+                    "CHECK")
+        set_result(intrf, "Ping gateway (IPv4)", PASSED)
+
+    # Ping www.arm.com to verify DNS resolution and external connectivity
+    cmd = [PING_CMD, "-c", "3", "-W", "10", "-I", intrf, "www.arm.com"]
+    print_color(f"Running ping -c 3 -W 10 -I {intrf} www.arm.com", "INFO")
+    rp2 = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    print(rp2.stdout)
+    if "bad address" in rp2.stderr:
+        print_color(f"Unable to resolve www.arm.com, DNS not configured correctly "
+                    f"for {intrf}", "WARN")
+    if rp2.returncode != 0 or "100% packet loss" in rp2.stdout:
+        print_color(f"Failed to ping www.arm.com via {intrf}", "WARN")
+        set_result(intrf, "Ping www.arm.com (IPv4)", WARNING, "Ping failed or DNS issue")
+    else:
+        print_color("Ping to www.arm.com is successful", "CHECK")
+        set_result(intrf, "Ping www.arm.com (IPv4)", PASSED)
+
+    # wget and curl connectivity check
+    wget_available = shutil.which("wget") is not None
+    curl_available = shutil.which("curl") is not None
+
+    parts = []
+    wget_ok = False
+    curl_ok = False
+
+    # wget check
+    if wget_available:
+        wget_command = [WGET_CMD, "--spider", "--timeout=10", "https://www.arm.com"]
+        if isolation and isolation.source and not is_busybox_tool("wget"):
+            # BusyBox wget cannot bind; it follows the main table instead.
+            wget_command.insert(1, f"--bind-address={isolation.source}")
+        print_color(f"Running wget {' '.join(wget_command[1:])}", "INFO")
+        rwget = subprocess.run(wget_command, capture_output=True,
+                               text=True, check=False)
+        if rwget.stdout.strip():
+            print_color(rwget.stdout.strip(), "DEBUG")
+        if rwget.stderr.strip():
+            print_color(rwget.stderr.strip(), "DEBUG")
+        if rwget.returncode == 0:
+            wget_ok = True
+            parts.append("wget ok")
+            print_color("wget successfully accessed https://www.arm.com", "CHECK")
+        else:
+            parts.append("wget failed")
+            print_color("wget failed to reach https://www.arm.com", "WARN")
+    else:
+        parts.append("wget not found")
+        print_color("Skipping wget check: 'wget' not found.", "WARN")
+
+    # curl check
+    if curl_available:
+        curl_command = [
+            CURL_CMD,
+            "-Is",
+            "--connect-timeout",
+            "20",
+            "--interface",
+            intrf,
+            "https://www.arm.com",
+        ]
+        print_color(f"Running curl -Is --connect-timeout 20 --interface {intrf} "
+                    "https://www.arm.com", "INFO")
+        rcurl = subprocess.run(curl_command, capture_output=True,
+                               text=True, check=False)
+        lines = rcurl.stdout.strip().splitlines() if rcurl.stdout else []
+        first_line = lines[0] if lines else ""
+        if rcurl.stderr.strip():
+            print_color(f"Curl Error: {rcurl.stderr.strip()}", "DEBUG")
+        if "HTTP/2 200" in first_line or "HTTP/1.1 200 OK" in first_line:
+            curl_ok = True
+            parts.append("curl ok")
+            print_color("curl successfully fetched https://www.arm.com", "CHECK")
+        else:
+            parts.append("curl failed")
+            print_color("curl failed to fetch https://www.arm.com", "WARN")
+    else:
+        parts.append("curl not found")
+        print_color("Skipping curl check: 'curl' not found.", "WARN")
+
+    # wget and curl status
+    if wget_ok and curl_ok:
+        combined_status = PASSED
+    elif wget_ok or curl_ok:
+        combined_status = WARNING
+    else:
+        combined_status = FAILED
+
+    set_result(intrf, "wget and curl", combined_status, ", ".join(parts))
+
+    print("\n****************************************************************\n")
+
+def run_isolated(index, intrf, have_ethtool, busybox_env, proxy):
+    """Worker for --jobs mode; returns (buffered output, exception or None)."""
+    proxy.capture()
+    isolation = RouteIsolation(intrf, ISOLATION_TABLE_BASE + index)
+    error = None
+    try:
+        isolation.begin()
+        validate_interface(intrf, have_ethtool, busybox_env, isolation)
+    except Exception as e:  # pylint: disable=broad-except
+        print_color(f"Error occurred while testing {intrf}: {e}", "ERROR")
+        error = e
+    finally:
+        isolation.teardown()
+    return proxy.release(), error
+
+def run_parallel(ifaces, jobs, have_ethtool, busybox_env):
+    """Validate interfaces concurrently, printing each log in interface order."""
+    real_stdout = sys.stdout
+    proxy = _ThreadOutput(real_stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(ifaces))) as pool:
+            futures = [pool.submit(run_isolated, index, intrf, have_ethtool, busybox_env, proxy)
+                       for index, intrf in enumerate(ifaces)]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = real_stdout
+    for output, _ in outcomes:
+        real_stdout.write(output)
+    real_stdout.flush()
+    for _, error in outcomes:
+        if error is not None:
+            raise error
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Ethernet interface validation checks.")
+    parser.add_argument("system_config", nargs="?",
+                        help="system_config.txt with total_number_of_network_controllers")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Validate up to N physical interfaces concurrently, each with its "
+                             "own policy-routing table (default: 1, one at a time)")
+    return parser.parse_args(argv)
+
 def main():
     """Run Ethernet validation checks."""
+    system_config_path = None
     try:
-        system_config_path = sys.argv[1] if len(sys.argv) > 1 else None
+        args = parse_args()
+        system_config_path = args.system_config
 
         have_ethtool = shutil.which("ethtool") is not None
         busybox_env = shutil.which("udhcpc") is not None
@@ -468,371 +1105,22 @@ def main():
                         "WARN")
 
         print("\n****************************************************************\n")
-        time.sleep(20)
-        previous_eth_intrf = ""
-
-        for intrf in physical_ifaces:
-            if previous_eth_intrf:
-                print_color(f"Bringing down ethernet interface: {previous_eth_intrf}", "INFO")
-                subprocess.run([IP_CMD, "link", "set", "dev", previous_eth_intrf, "down"],
-                               check=False)
-                time.sleep(20)
-            previous_eth_intrf = intrf
-
-            # Bring up the current interface
-            print_color(f"Bringing up ethernet interface: {intrf}", "INFO")
-            result_up = subprocess.run([IP_CMD, "link", "set", "dev", intrf, "up"], check=False)
-            if result_up.returncode != 0:
-                print_color(f"Unable to bring up ethernet interface {intrf} using ip", "WARN")
-                set_result(intrf, "Bring up", FAILED, "ip link set up failed")
-                # Skip everything else for this interface if unable to Bring up
-                remaining = [t for t in TEST_ORDER if t not in ("Detect interface", "Bring up")]
-                skip_many(intrf, remaining, "Interface could not be brought up")
-                print("\n****************************************************************\n")
-                continue
-
-            set_result(intrf, "Bring up", PASSED)
-            time.sleep(20)
-
-            # Check for ethtool availability
-            if have_ethtool:
-                set_result(intrf, "ethtool present", PASSED)
-                print_color(f"Running \"ethtool {intrf}\"", "INFO")
-                result_ethdump = subprocess.run([ETHTOOL_CMD, intrf], capture_output=True,
-                                                text=True, check=False)
-                print(result_ethdump.stdout)
-
-                result_test = subprocess.run([ETHTOOL_CMD, "-i", intrf], capture_output=True,
-                                             text=True, check=False)
-                print(result_test.stdout)
-                if "supports-test: yes" in result_test.stdout:
-                    print_color(f"Ethernet interface {intrf} supports ethtool self test.", "CHECK")
-                    set_result(intrf, "Self-test supported", PASSED)
-                    print_color(f"Running ethtool -t {intrf}", "INFO")
-                    try:
-                        t = subprocess.run([ETHTOOL_CMD, "-t", intrf], capture_output=True,
-                                           text=True, timeout=60, check=False)
-                        print_color(t.stdout, "DEBUG")
-                        if t.returncode == 0:
-                            set_result(intrf, "ethtool self tests", PASSED)
-                        else:
-                            output_lines = (t.stdout + "\n" + t.stderr).splitlines()
-                            first_line = next((ln for ln in output_lines if ln.strip()), "")
-                            set_result(intrf, "ethtool self tests", WARNING,
-                                       first_line or f"returncode={t.returncode}")
-                    except subprocess.TimeoutExpired:
-                        print_color("ethtool -t timed out (60s)", "WARN")
-                        set_result(intrf, "ethtool self tests", WARNING, "timeout")
-
-                    subprocess.run([IP_CMD, "link", "set", "dev", intrf, "up"], check=False)
-                    for _ in range(10):
-                        try:
-                            carrier = Path(f"/sys/class/net/{intrf}/carrier").read_text(
-                                    encoding="utf-8").strip()
-                        except OSError:
-                            carrier = "0"
-                        if carrier == "1":
-                            print_color(f"Link restored on {intrf}", "CHECK")
-                            break
-                        time.sleep(1)
-
-                else:
-                    print_color(f"Ethernet interface {intrf} does not support ethtool self test",
-                                "WARN")
-                    set_result(intrf, "Self-test supported", SKIPPED, "supports-test: no")
-                    set_result(intrf, "ethtool self tests", SKIPPED, "Self-test not supported")
-
-                if "Link detected: yes" in result_ethdump.stdout:
-                    print_color(f"Link detected on {intrf}", "CHECK")
-                    set_result(intrf, "Link detected", PASSED)
-                else:
-                    print_color(f"Link not detected for {intrf}", "WARN")
-                    set_result(intrf, "Link detected", FAILED, "No carrier")
-                    # Skip everything else that needs a link
-                    skip_many(intrf, [
-                        "Gateway Address present",
-                        "Ping gateway (IPv4)",
-                        "Ping www.arm.com (IPv4)",
-                        "IPv6 address present",
-                        "Ping ipv6.google.com (IPv6)",
-                        "wget and curl",
-                    ], "Link not detected")
-                    print("\n****************************************************************\n")
-                    continue
-            else:
-                set_result(intrf, "ethtool present", FAILED, "ethtool not found; using sysfs")
-                set_result(intrf, "Self-test supported", SKIPPED, "No ethtool")
-                set_result(intrf, "ethtool self tests", SKIPPED, "No ethtool")
-                print_color("ethtool not found; using sysfs for link detection", "WARN")
-                try:
-                    carrier = Path(f"/sys/class/net/{intrf}/carrier").read_text(
-                            encoding="utf-8").strip()
-                except OSError:
-                    carrier = "0"
-                if carrier != "1":
-                    try:
-                        oper = Path(f"/sys/class/net/{intrf}/operstate").read_text(
-                                encoding="utf-8").strip()
-                    except OSError:
-                        oper = "down"
-                    if oper != "up":
-                        print_color(f"Link not detected for {intrf} "
-                                    f"(carrier={carrier}, operstate={oper})", "WARN")
-                        set_result(intrf, "Link detected", FAILED,
-                                   f"carrier={carrier}, operstate={oper}")
-                        skip_many(intrf, [
-                            "Gateway Address present",
-                            "Ping gateway (IPv4)",
-                            "Ping www.arm.com (IPv4)",
-                            "IPv6 address present",
-                            "Ping ipv6.google.com (IPv6)",
-                            "wget and curl",
-                        ], "Link not detected")
-                        print("\n**************************************************************\n")
-                        continue
-                print_color(f"Link detected on {intrf} (sysfs)", "CHECK")
-                set_result(intrf, "Link detected", PASSED)
-
-            # Check IPv4 and IPv6 address configuration
-            command = [IP_CMD, "address", "show", "dev", intrf]
-            print_color(f"Running ip address show dev {intrf}", "INFO")
-            result_addr = subprocess.run(command, capture_output=True,
-                                         text=True, check=False)
-            print(result_addr.stdout)
-
-            has_dhcp = "dynamic" in result_addr.stdout
-            has_ipv6 = re.search(r'inet6 (?!fe80)', result_addr.stdout)
-
-            # Detect any IPv4 (dynamic or static)
-            ipv4_matches = re.findall(r'inet (\d+\.\d+\.\d+\.\d+)/\d+', result_addr.stdout)
-            ipv4_list = [ip for ip in ipv4_matches if not ip.startswith("127.")]
-            has_ipv4 = len(ipv4_list) > 0
-
-            # Default route to evaluate whenever we have any IPv4
-            if not has_default_route(intrf):
-                renew_dhcp(intrf, busybox_env)
-                command = [IP_CMD, "address", "show", "dev", intrf]
-                result_addr = subprocess.run(command, capture_output=True,
-                                             text=True, check=False)
-                print(result_addr.stdout)
-                has_dhcp = "dynamic" in result_addr.stdout
-                has_ipv6 = re.search(r'inet6 (?!fe80)', result_addr.stdout)
-                ipv4_matches = re.findall(r'inet (\d+\.\d+\.\d+\.\d+)/\d+', result_addr.stdout)
-                ipv4_list = [ip for ip in ipv4_matches if not ip.startswith("127.")]
-                has_ipv4 = len(ipv4_list) > 0
-
-            if has_ipv4 and has_default_route(intrf):
-                set_result(intrf, "Gateway Address present", PASSED)
-            elif has_ipv4:
-                reason = "No default route" + (" after DHCP" if has_dhcp else " (static config)")
-                set_result(intrf, "Gateway Address present", FAILED, reason)
-            else:
-                set_result(intrf, "Gateway Address present", SKIPPED, "No IPv4 address")
-
-            # DHCP result
-            #if has_dhcp:
-            #    set_result(intrf, "IPv4 DHCP", PASSED)
-            #else:
-            #    print_color(f"{intrf} does not have a dynamic IPv4 address", "WARN")
-            #    set_result(intrf, "IPv4 DHCP", FAILED, "No dynamic IPv4 assigned")
-
-            # IPv4 address present (independent from DHCP)
-            if has_ipv4:
-                ip_type = "dynamic" if has_dhcp else "static"
-                set_result(intrf, "IPv4 address present", PASSED,
-                           f"{ip_type} {', '.join(ipv4_list)}")
-            else:
-                set_result(intrf, "IPv4 address present", FAILED, "No IPv4 address")
-
-
-
-            # Run ping6 if global IPv6 address is found
-            if has_ipv6:
-                set_result(intrf, "IPv6 address present", PASSED)
-                ipv6_addresses = re.findall(r'inet6 ([\da-f:]+)/\d+ scope global',
-                                            result_addr.stdout)
-                for ip6 in ipv6_addresses:
-                    print_color(f"Found global IPv6 address on {intrf} → {ip6}", "CHECK")
-                ping6_bin = shutil.which("ping") or shutil.which("ping6")
-                if "ping6" in (ping6_bin or ""):
-                    ping6_command = [PING6_CMD, "-c", "3", "-I", intrf, "ipv6.google.com"]
-                    ping6_command_display = f"ping6 -c 3 -I {intrf} ipv6.google.com"
-                else:
-                    ping6_command = [PING_CMD, "-6", "-c", "3", "-I", intrf, "ipv6.google.com"]
-                    ping6_command_display = f"ping -6 -c 3 -I {intrf} ipv6.google.com"
-                print_color(f"Running {ping6_command_display}", "INFO")
-                result_ping6 = subprocess.run(ping6_command, capture_output=True,
-                                              text=True, check=False)
-                print(result_ping6.stdout)
-                if result_ping6.returncode != 0 or "100% packet loss" in result_ping6.stdout:
-                    print_color(f"Failed to ping ipv6.google.com via {intrf}", "WARN")
-                    set_result(intrf, "Ping ipv6.google.com (IPv6)", WARNING,
-                               "Packet loss or ping failed")
-                else:
-                    print_color(f"Ping to ipv6.google.com via {intrf} is successful", "CHECK")
-                    set_result(intrf, "Ping ipv6.google.com (IPv6)", PASSED)
-            else:
-                print_color(f"No IPv6 address found on {intrf}, skipping IPv6 test", "INFO")
-                set_result(intrf, "IPv6 address present", SKIPPED, "No global IPv6")
-                set_result(intrf, "Ping ipv6.google.com (IPv6)", SKIPPED, "No global IPv6")
-
-            # If no IPv4 DHCP, skip IPv4-dependent tests
-            if results[intrf]["IPv4 address present"]["status"] != PASSED or \
-               results[intrf]["Gateway Address present"]["status"] != PASSED:
-                skip_many(intrf, [
-                    "Ping gateway (IPv4)",
-                    "Ping www.arm.com (IPv4)",
-                    "wget and curl",
-                ], "No IPv4 and/or default route")
-                print("\n****************************************************************\n")
-                continue
-
-            # Determine default router/gateway and verify the route path
-            print_color("Running ip route get 8.8.8.8", "INFO")
-            r = subprocess.run([IP_CMD, "route", "get", "8.8.8.8"], capture_output=True,
-                               text=True, check=False)
-            print(r.stdout)
-            if r.returncode != 0:
-                print_color(f"No default route available for {intrf} (route get failed), "
-                            "skipping further tests for this interface", "WARN")
-                skip_many(intrf, [
-                    "Ping gateway (IPv4)",
-                    "Ping www.arm.com (IPv4)",
-                    "wget and curl",
-                ], "ip route get failed")
-                print("\n****************************************************************\n")
-                continue
-
-            m = re.search(r'\bvia\s+(\d{1,3}(?:\.\d{1,3}){3}).*?\bdev\s+(\S+)', r.stdout)
-            if not m:
-                print_color("Unable to parse gateway/dev from route output, "
-                            f"skipping further tests for {intrf}", "WARN")
-                skip_many(intrf, [
-                    "Ping gateway (IPv4)",
-                    "Ping www.arm.com (IPv4)",
-                    "wget and curl",
-                ], "Cannot parse gateway")
-                print("\n****************************************************************\n")
-                continue
-
-            gw, dev_on_path = m.group(1), m.group(2)
-            if dev_on_path != intrf:
-                print_color(f"Default route to 8.8.8.8 is via {dev_on_path}, "
-                            f"not {intrf}; skipping further tests for {intrf}", "WARN")
-                skip_many(intrf, [
-                    "Ping gateway (IPv4)",
-                    "Ping www.arm.com (IPv4)",
-                    "wget and curl",
-                ], f"Route uses {dev_on_path}")
-                print("\n****************************************************************\n")
-                continue
-
-            ip_address = gw
-            print_color(f"Router/Gateway IP for {intrf} : {ip_address}", "CHECK")
-
-            set_result(intrf, "Gateway Address present", PASSED, f"gateway {gw}")
-
-            subprocess.run([IP_CMD, "link", "set", "dev", intrf, "up"], check=False)
-            time.sleep(20)
-
-            # Run IPv4 ping test to the router/gateway
-            cmd = [PING_CMD, "-c", "3", "-W", "10", "-I", intrf, ip_address]
-            print_color(f"Running ping -c 3 -W 10 -I {intrf} {ip_address}", "INFO")
-            rping = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            print(rping.stdout)
-            if rping.returncode != 0 or "100% packet loss" in rping.stdout:
-                print_color(f"Failed to ping router/gateway[{ip_address}] for {intrf}", "WARN")
-                set_result(intrf, "Ping gateway (IPv4)", WARNING, "Packet loss or ping failed")
-            else:
-                print_color(f"Ping to router/gateway[{ip_address}] for {intrf} is successful",
-                            "CHECK")
-                set_result(intrf, "Ping gateway (IPv4)", PASSED)
-
-            # Ping www.arm.com to verify DNS resolution and external connectivity
-            cmd = [PING_CMD, "-c", "3", "-W", "10", "-I", intrf, "www.arm.com"]
-            print_color(f"Running ping -c 3 -W 10 -I {intrf} www.arm.com", "INFO")
-            rp2 = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            print(rp2.stdout)
-            if "bad address" in rp2.stderr:
-                print_color(f"Unable to resolve www.arm.com, DNS not configured correctly "
-                            f"for {intrf}", "WARN")
-            if rp2.returncode != 0 or "100% packet loss" in rp2.stdout:
-                print_color(f"Failed to ping www.arm.com via {intrf}", "WARN")
-                set_result(intrf, "Ping www.arm.com (IPv4)", WARNING, "Ping failed or DNS issue")
-            else:
-                print_color("Ping to www.arm.com is successful", "CHECK")
-                set_result(intrf, "Ping www.arm.com (IPv4)", PASSED)
-
-            # wget and curl connectivity check
-            wget_available = shutil.which("wget") is not None
-            curl_available = shutil.which("curl") is not None
-
-            parts = []
-            wget_ok = False
-            curl_ok = False
-
-            # wget check
-            if wget_available:
-                wget_command = [WGET_CMD, "--spider", "--timeout=10", "https://www.arm.com"]
-                print_color("Running wget --spider --timeout=10 https://www.arm.com", "INFO")
-                rwget = subprocess.run(wget_command, capture_output=True,
-                                       text=True, check=False)
-                if rwget.stdout.strip():
-                    print_color(rwget.stdout.strip(), "DEBUG")
-                if rwget.stderr.strip():
-                    print_color(rwget.stderr.strip(), "DEBUG")
-                if rwget.returncode == 0:
-                    wget_ok = True
-                    parts.append("wget ok")
-                    print_color("wget successfully accessed https://www.arm.com", "CHECK")
-                else:
-                    parts.append("wget failed")
-                    print_color("wget failed to reach https://www.arm.com", "WARN")
-            else:
-                parts.append("wget not found")
-                print_color("Skipping wget check: 'wget' not found.", "WARN")
-
-            # curl check
-            if curl_available:
-                curl_command = [
-                    CURL_CMD,
-                    "-Is",
-                    "--connect-timeout",
-                    "20",
-                    "--interface",
-                    intrf,
-                    "https://www.arm.com",
-                ]
-                print_color(f"Running curl -Is --connect-timeout 20 --interface {intrf} "
-                            "https://www.arm.com", "INFO")
-                rcurl = subprocess.run(curl_command, capture_output=True,
-                                       text=True, check=False)
-                lines = rcurl.stdout.strip().splitlines() if rcurl.stdout else []
-                first_line = lines[0] if lines else ""
-                if rcurl.stderr.strip():
-                    print_color(f"Curl Error: {rcurl.stderr.strip()}", "DEBUG")
-                if "HTTP/2 200" in first_line or "HTTP/1.1 200 OK" in first_line:
-                    curl_ok = True
-                    parts.append("curl ok")
-                    print_color("curl successfully fetched https://www.arm.com", "CHECK")
-                else:
-                    parts.append("curl failed")
-                    print_color("curl failed to fetch https://www.arm.com", "WARN")
-            else:
-                parts.append("curl not found")
-                print_color("Skipping curl check: 'curl' not found.", "WARN")
-
-            # wget and curl status
-            if wget_ok and curl_ok:
-                combined_status = PASSED
-            elif wget_ok or curl_ok:
-                combined_status = WARNING
-            else:
-                combined_status = FAILED
-
-            set_result(intrf, "wget and curl", combined_status, ", ".join(parts))
+        wait_for_links_down(physical_ifaces)
 
-            print("\n****************************************************************\n")
+        if args.jobs > 1 and len(physical_ifaces) > 1:
+            print_color(f"Validating {len(physical_ifaces)} interfaces concurrently "
+                        f"(up to {args.jobs} at a time)", "INFO")
+            run_parallel(physical_ifaces, args.jobs, have_ethtool, busybox_env)
+        else:
+            previous_eth_intrf = ""
+            for intrf in physical_ifaces:
+                if previous_eth_intrf:
+                    print_color(f"Bringing down ethernet interface: {previous_eth_intrf}", "INFO")
+                    subprocess.run([IP_CMD, "link", "set", "dev", previous_eth_intrf, "down"],
+                                   check=False)
+                    wait_for_links_down([previous_eth_intrf])
+                previous_eth_intrf = intrf
+                validate_interface(intrf, have_ethtool, busybox_env)
 
         # Restore all original interface states and print summary
         print_summary(system_config_path)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Copyright (c) 2024-2025, Arm Limited or its affiliates. All rights reserved.
+# Copyright (c) 2024-2026, Arm Limited or its affiliates. All rights reserved.
 # SPDX-License-Identifier : Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -14,43 +14,129 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import chardet
+import argparse
+import codecs
+import json
 import re
+import shlex
 import sys
 
-def extract_hex_values(file_path, pattern):
-    # Detect file encoding using chardet
+import chardet
+
+USAGE = ("Usage: python3 extract_capsule_fw_version.py <pattern> <file_path>\n"
+         "       python3 extract_capsule_fw_version.py --pattern NAME=REGEX [--pattern ...] "
+         "[--format keyvalue|json] <file_path>")
+
+# Bytes handed to chardet; CapsuleApp logs are UTF-16 with a BOM or plain text
+DETECT_BYTES = 64 * 1024
+
+NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# a numbered or named backreference would point at the wrong group once the
+# patterns share one regex
+BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def guess_encoding(raw):
+    """Return the encoding of a log from its first bytes."""
+    if raw.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    encoding = chardet.detect(raw)["encoding"] or "utf-8"
+    # The first lines are usually plain ASCII; later bytes may not be.
+    return "utf-8" if encoding.lower() == "ascii" else encoding
+
+
+def compile_patterns(patterns):
+    """Compile (name, regex) pairs, plus one alternation that finds candidate lines."""
+    compiled = [(name, re.compile(pattern)) for name, pattern in patterns]
+    combined = None
+    if len(compiled) > 1 and not any(BACKREF_RE.search(p) for _, p in patterns):
+        try:
+            combined = re.compile("|".join(f"(?:{p})" for _, p in patterns))
+        except re.error:
+            # e.g. the same group name in two patterns; search them one by one
+            combined = None
+    return compiled, combined
+
+
+def extract_values(file_path, patterns):
+    """Return {name: [group 1 of the first match on each line]} in file order."""
+    compiled, combined = compile_patterns(patterns)
+    values = {name: [] for name, _ in compiled}
+
     with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        result = chardet.detect(raw_data)
-        encoding = result['encoding']
+        encoding = guess_encoding(file.read(DETECT_BYTES))
+
+    with open(file_path, 'r', encoding=encoding, errors='replace') as file:
+        for line in file:
+            if combined is not None and not combined.search(line):
+                continue
+            for name, regex in compiled:
+                match = regex.search(line)
+                if match and regex.groups:
+                    values[name].append(match.group(1))
+    return values
+
+
+def format_keyvalue(values):
+    """NAME_<index>=value lines and NAME_count, ready for a shell eval."""
+    lines = []
+    for name, found in values.items():
+        for i, value in enumerate(found):
+            lines.append(f"{name}_{i}={shlex.quote(value)}")
+        lines.append(f"{name}_count={len(found)}")
+    return "\n".join(lines)
+
+
+def parse_pattern(text):
+    name, sep, pattern = text.partition("=")
+    if not sep or not NAME_RE.match(name) or not pattern:
+        raise ValueError(f"--pattern must be NAME=REGEX with a shell variable name, not {text!r}")
+    return name, pattern
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Extract firmware versions and statuses from CapsuleApp ESRT logs",
+        usage=USAGE)
+    parser.add_argument("--pattern", action="append", default=[],
+                        help="NAME=REGEX; group 1 of each matching line is reported under NAME")
+    parser.add_argument("--format", choices=["keyvalue", "json"], default="keyvalue",
+                        help="Output for --pattern runs (default: %(default)s)")
+    parser.add_argument("args", nargs="*", help="[<pattern>] <file_path>")
+    return parser.parse_args(argv)
+
+
+def main(args, named_patterns, output_format="keyvalue"):
+    # the single-pattern form prints one value per line
+    if len(args) != (1 if named_patterns else 2):
+        print(USAGE, file=sys.stderr)
+        return 1
+    try:
+        patterns = [parse_pattern(p) for p in named_patterns] or [("values", args[0])]
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
     try:
-        # Read the file using the detected encoding
-        with open(file_path, 'r', encoding=encoding) as file:
-            lines = file.readlines()
-
-        matches = []
-        for line in lines:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    matches.append(match.group(1))
-                except IndexError:
-                    continue
-        return matches
-
-    except UnicodeDecodeError:
-        print(f"Error: Unable to decode the file {file_path} with detected encoding: {encoding}")
-        return []
-
-if len(sys.argv) != 3:
-    print("Usage: python3 extract_capsule_fw_version.py <pattern> <file_path>")
-    sys.exit(1)
-
-pattern = sys.argv[1]
-file_path = sys.argv[2]
-
-hex_values = extract_hex_values(file_path, pattern)
-for val in hex_values:
-    print(val)
+        values = extract_values(args[-1], patterns)
+    except re.error as e:
+        print(f"Error: invalid pattern: {e}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"Error: cannot read {args[-1]}: {e.strerror or e}", file=sys.stderr)
+        return 1
+    if not named_patterns:
+        for val in values["values"]:
+            print(val)
+    elif output_format == "json":
+        print(json.dumps(values, indent=2))
+    else:
+        print(format_keyvalue(values))
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.args, args.pattern, args.format))
@@ -18,12 +18,8 @@
 
 LOG_DIR="/mnt/acs_results_template/acs_results"
 
-# Parse config file
-automation_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation`"
-if [ "$automation_enabled" == "True" ]; then
-  fwts_command="`python3 /mnt/acs_tests/parser/Parser.py -fwts`"
-  fwts_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_fwts_run`"
-fi
+# Parse config file in one run, cached against the ini's mtime
+eval "`python3 /mnt/acs_tests/parser/Parser.py --export-shell --cache /mnt/acs_tests/config/acs_run_config.cache`"
 
 # FWTS (SBBR) Execution
 echo "Executing FWTS for SBBR"
@@ -33,11 +29,10 @@ else
   mkdir -p ${LOG_DIR}/fwts
   echo "SystemReady band ACS v3.1.1" > ${LOG_DIR}/fwts/FWTSResults.log
   if [ "$automation_enabled" == "False" ]; then
-    fwts  -r stdout -q --uefi-set-var-multiple=1 --uefi-get-mn-count-multiple=1 --sbbr esrt uefibootpath aest cedt slit srat hmat pcct pdtt bgrt bert einj erst hest sdei nfit iort mpam ibft ras2 >> ${LOG_DIR}/fwts/FWTSResults.log
+    python3 /usr/bin/fwts_shards.py -- fwts -r stdout -q --uefi-set-var-multiple=1 --uefi-get-mn-count-multiple=1 --sbbr esrt uefibootpath aest cedt slit srat hmat pcct pdtt bgrt bert einj erst hest sdei nfit iort mpam ibft ras2 >> ${LOG_DIR}/fwts/FWTSResults.log
   else
-    $fwts_command >> ${LOG_DIR}/fwts/FWTSResults.log
+    python3 /usr/bin/fwts_shards.py -- $fwts_command -r stdout -q >> ${LOG_DIR}/fwts/FWTSResults.log
   fi
-  sync /mnt
-  sleep 5
+  python3 /usr/bin/results_writer.py sync ${LOG_DIR}/fwts/FWTSResults.log --settle "${settle_seconds:-0}"
   echo "FWTS Execution - Completed"
 fi
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run an FWTS command as parallel shards and merge their logs in test order."""
+
+import argparse
+import concurrent.futures
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+DEFAULT_JOBS = 4
+
+# Tests that call UEFI runtime services or into firmware through the SMCCC
+# test driver. They run in one fwts process with nothing else in flight;
+# every other test only reads ACPI/SMBIOS tables and sysfs.
+SERIAL_TESTS = {"uefirtvariable", "uefirttime", "uefirtmisc", "uefirtauthvar",
+                "uefivarinfo", "smccc"}
+
+# Options that select whole test categories, e.g. --sbbr pulls in the
+# UEFI runtime variable and time tests next to the named ones, and options
+# that only tune those runtime tests. They are passed to the serial shard
+# only, so the parallel shards run just their named table tests.
+CATEGORY_OPTIONS = {"-a", "--all", "-b", "--batch", "-i", "--interactive",
+                    "--batch-experimental", "--interactive-experimental",
+                    "-P", "--power-states", "-U", "--utils", "--unsafe",
+                    "--sbbr", "--ebbr", "--xbbr", "--ifv", "--uefitests",
+                    "--acpitests", "--acpicompliance"}
+RUNTIME_OPTION_PREFIX = "--uefi-"
+
+# fwts options whose value is the next argument
+VALUE_OPTIONS = {"-r", "--results-output", "-w", "--log-width", "-j", "--json-data-path",
+                 "-t", "--table-path", "-s", "--skip-test", "-k", "--klog",
+                 "--log-filter", "--log-format", "--log-type", "--log-level",
+                 "--arch", "--pm-method", "--acpica", "-R", "--rsdp"}
+
+SEPARATOR_RE = re.compile(r"^[=\-]{20,}$")
+COUNTS_RE = re.compile(r"^\d+ passed, \d+ failed, \d+ warning, \d+ aborted, "
+                       r"\d+ skipped, \d+ info only\.$")
+TRAILER_RE = re.compile(r"^Test Failure Summary")
+TEST_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def serial_only(option):
+    return option in CATEGORY_OPTIONS or option.startswith(RUNTIME_OPTION_PREFIX)
+
+
+def split_command(command):
+    """Split an fwts command line into (program, options, test names).
+
+    Options are returned as groups, an option together with its value.
+    """
+    program, args = command[:1], command[1:]
+    options, tests = [], []
+    value_next = False
+    for arg in args:
+        if value_next:
+            options[-1].append(arg)
+            value_next = False
+        elif arg.startswith("-"):
+            options.append([arg])
+            value_next = arg in VALUE_OPTIONS
+        elif arg not in tests:
+            tests.append(arg)
+    return program, options, tests
+
+
+def plan_shards(tests, jobs):
+    """Return (parallel shards, serial tests); each shard keeps the configured order."""
+    serial = [test for test in tests if test in SERIAL_TESTS]
+    parallel = [test for test in tests if test not in SERIAL_TESTS]
+    count = min(jobs, len(parallel))
+    # round robin, so the slow tables early in the list do not share a shard
+    shards = [parallel[i::count] for i in range(count)] if count else []
+    return shards, serial
+
+
+def shard_commands(program, options, shards, serial):
+    """Return the command line of each parallel shard and of the serial shard, if any."""
+    shared = [arg for group in options if not serial_only(group[0]) for arg in group]
+    commands = [program + shared + shard for shard in shards]
+    extra = [arg for group in options if serial_only(group[0]) for arg in group]
+    serial_command = None
+    if serial or extra:
+        # the table tests already ran; keep a category flag from running them again
+        skip = [test for shard in shards for test in shard]
+        serial_command = (program + shared + extra
+                          + (["--skip-test=" + ",".join(skip)] if skip and extra else [])
+                          + serial)
+    return commands, serial_command
+
+
+def split_output(lines, tests):
+    """Split one fwts log into (header, {test: section lines}, trailer).
+
+    Tests listed on the log's "Running tests:" line are recognised too, so
+    the ones a category option pulled in keep their sections.
+    """
+    header, sections, trailer = [], {}, []
+    tests = set(tests)
+    current = None
+    closed = False
+    in_list = False
+    for line in lines:
+        text = line.rstrip("\n")
+        if trailer:
+            trailer.append(line)
+            continue
+        if current is None and (text.startswith("Running tests:") or (in_list and text.strip())):
+            listed = text.split(":", 1)[1] if not in_list else text
+            tests.update(TEST_NAME_RE.findall(listed))
+            in_list = True
+        else:
+            in_list = False
+        name = text.split(":", 1)[0]
+        if name in tests and name not in sections:
+            current, closed = [line], False
+            sections[name] = current
+        elif current is None:
+            header.append(line)
+        elif TRAILER_RE.match(text) or (closed and text.strip()):
+            # the run's totals and failure summary follow the last test
+            trailer.append(line)
+        elif not closed:
+            current.append(line)
+            # a test section ends with its own ====/counts/==== block
+            closed = (SEPARATOR_RE.match(text) is not None and len(current) >= 3
+                      and COUNTS_RE.match(current[-2].strip()) is not None)
+    return header, sections, trailer
+
+
+def merge_header(header, tests, command):
+    """Keep the first shard's banner, listing every test and the original command."""
+    merged = []
+    in_list = False
+    for line in header:
+        if line.startswith("Running tests:"):
+            merged.append("Running tests: " + " ".join(tests) + ".\n")
+            in_list = True
+        elif in_list and line.strip():
+            continue
+        elif line.startswith("Command:"):
+            merged.append('Command: "%s".\n' % " ".join(command))
+            in_list = False
+        else:
+            merged.append(line)
+            in_list = False
+    return merged
+
+
+def merge_outputs(outputs, tests, command):
+    """Merge shard logs into one log with the sections in configured order."""
+    header, sections, trailers = None, {}, []
+    for shard_tests, lines in outputs:
+        shard_header, shard_sections, trailer = split_output(lines, shard_tests)
+        if header is None:
+            header = shard_header
+        sections.update(shard_sections)
+        if trailer:
+            trailers.append(trailer)
+
+    # named tests in the configured order, then any a category option added
+    order = [t for t in tests if t in sections] + [t for t in sections if t not in tests]
+    merged = merge_header(header or [], order, command)
+    for test in order:
+        merged.extend(sections[test])
+        merged.append("\n")
+    # each shard's failure summary covers its own tests
+    for i, trailer in enumerate(trailers):
+        if i and trailers[i - 1][-1].strip():
+            merged.append("\n")
+        merged.extend(trailer)
+    return merged
+
+
+def run_shard(command, path):
+    """Run one fwts shard with its stdout written to path; return its exit code."""
+    with open(path, "w") as f:
+        try:
+            return subprocess.run(command, stdout=f).returncode
+        except OSError as e:
+            print(f"ERROR: cannot run {command[0]}: {e.strerror or e}", file=sys.stderr)
+            return 127
+
+
+def read_lines(path):
+    with open(path, "r", errors="replace") as f:
+        return f.readlines()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run FWTS table tests in parallel shards and merge the logs")
+    parser.add_argument("--jobs", type=int, default=min(DEFAULT_JOBS, os.cpu_count() or 1),
+                        help="fwts processes for the read-only tests (default: %(default)s); "
+                             "1 runs the command unchanged")
+    parser.add_argument("command", nargs=argparse.REMAINDER,
+                        help="-- followed by the fwts command line")
+    args = parser.parse_args(argv)
+    if args.command[:1] == ["--"]:
+        args.command = args.command[1:]
+    if not args.command:
+        parser.error("an fwts command is required")
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    return args
+
+
+def main(command, jobs=DEFAULT_JOBS):
+    program, options, tests = split_command(command)
+    shards, serial = plan_shards(tests, jobs)
+    commands, serial_command = shard_commands(program, options, shards, serial)
+    if jobs == 1 or len(commands) + bool(serial_command) < 2:
+        # nothing to split, e.g. "fwts --sbbr" lets fwts pick its tests
+        sys.stdout.flush()
+        try:
+            return subprocess.run(command).returncode
+        except OSError as e:
+            print(f"ERROR: cannot run {command[0]}: {e.strerror or e}", file=sys.stderr)
+            return 127
+
+    with tempfile.TemporaryDirectory(prefix="fwts_shards.") as tmp:
+        paths = [os.path.join(tmp, f"shard{i}.log") for i in range(len(commands) + 1)]
+        codes = []
+        if commands:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(commands)) as pool:
+                codes += pool.map(run_shard, commands, paths)
+        if serial_command:
+            # after the table shards, so the firmware calls run alone
+            codes.append(run_shard(serial_command, paths[len(commands)]))
+            shards = shards + [serial]
+
+        outputs = [(shard, read_lines(path)) for shard, path in zip(shards, paths)]
+        sys.stdout.writelines(merge_outputs(outputs, tests, command))
+        sys.stdout.flush()
+
+    return next((code for code in codes if code), 0)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.command, args.jobs))
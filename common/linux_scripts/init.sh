@@ -69,22 +69,6 @@ else
   echo "Warning: the results partition could not be mounted. Logs may not be saved correctly"
 fi
 
-# Parse config file
-automation_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation`"
-if [ "$automation_enabled" == "True" ]; then
-  fwts_command="`python3 /mnt/acs_tests/parser/Parser.py -fwts`"
-  fwts_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_fwts_run`"
-
-  bsa_command="`python3 /mnt/acs_tests/parser/Parser.py -bsa`"
-  bsa_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_bsa_run`"
-
-  sbsa_command="`python3 /mnt/acs_tests/parser/Parser.py -sbsa`"
-  sbsa_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_sbsa_run`"
-
-  sbmr_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_sbmr_in_band_run`"
-  sbmr_level="`python3 /mnt/acs_tests/parser/Parser.py -sbmr_level`"
-fi
-
 if [ $ADDITIONAL_CMD_OPTION != "noacs" ]; then
   if [ $ADDITIONAL_CMD_OPTION == "secureboot" ]; then
     echo "Call BBSR ACS"
@@ -108,198 +92,13 @@ if [ $ADDITIONAL_CMD_OPTION != "noacs" ]; then
     exec sh +m
   fi
 
-  # Linux dump with ethtool and blk devices script run
-  cd /usr/bin
-  ./linux_init.sh --mode acs
-  cd -
-  sleep 2
-
-  # Linux Device Driver script run
-  echo "Running Device Driver Matching Script"
-  cd /usr/bin
-  ./device_driver_sr.sh > ${LOG_DIR}/linux_dump/device_driver.log
-  cd -
-  echo "Device Driver script run - Completed"
-  sync /mnt
-  sleep 5
-
-  # FWTS (SBBR) Execution
-  echo "Executing FWTS for SBBR"
-  if [ "$automation_enabled" == "True" ] &&  [ "$fwts_enabled" == "False" ]; then
-    echo "********* FWTS is disabled in config file**************"
-  else
-    mkdir -p ${LOG_DIR}/fwts
-    if [ -f /lib/modules/smccc_test.ko ]; then
-      echo "Loading FWTS SMCCC module"
-      insmod /lib/modules/smccc_test.ko
-    else
-      echo "Error: FWTS SMCCC kernel Driver is not found."
-    fi
-    echo "${SR_VERSION}" > ${LOG_DIR}/fwts/FWTSResults.log
-    if [ "$automation_enabled" == "False" ]; then
-      fwts  -r stdout -q --uefi-set-var-multiple=1 --uefi-get-mn-count-multiple=1 --sbbr aest cedt slit srat hmat pcct pdtt bgrt bert einj erst hest sdei nfit iort mpam ibft ras2 smccc >> ${LOG_DIR}/fwts/FWTSResults.log
-    else
-      $fwts_command -r stdout -q >> ${LOG_DIR}/fwts/FWTSResults.log
-    fi
-    sync /mnt
-    sleep 5
-    echo "FWTS Execution - Completed"
-  fi
-
-  run_sbmr_in_band(){
-      echo "Call SBMR ACS in-band test"
-      cd /usr/bin
-      python redfish-finder
-      cd sbmr-acs
-      if [ -n "$sbmr_level" ]; then
-        ./run-sbmr-acs.sh linux --level "$sbmr_level"
-      else
-        ./run-sbmr-acs.sh linux
-      fi
-      mkdir -p ${LOG_DIR}/sbmr
-      cp -r logs ${LOG_DIR}/sbmr/sbmr_in_band_logs
-      cd /
-      echo "SBMR ACS in-band run is completed\n"
-  }
-
-  # Run SBMR-ACS In-Band Tests 
-  if [ "$automation_enabled" == "True" ]; then
-    if [ "$sbmr_enabled" == "False" ]; then
-      echo "********* SBMR In-Band is disabled in config file**************"
-    else
-      run_sbmr_in_band
-      sync /mnt
-      sleep 3
-      echo "NOTE: This ACS image runs SBMR IN-BAND tests ONLY." 1>&2
-      echo "For SBMR OUT-OF-BAND tests, see: https://github.com/ARM-software/sbmr-acs.git" 1>&2
-    fi
-  else
-    echo "SBMR-ACS In-Band test is disabled by default, please enable in config file to run SBMR-ACS In-Band test"
-  fi
-
-  # Linux BSA Execution
-  echo "Running Linux BSA tests"
-  if [ "$automation_enabled" == "True" ] &&  [ "$bsa_enabled" == "False" ]; then
-    echo "********* BSA is disabled in config file**************"
-  else
-    mkdir -p ${LOG_DIR}/linux
-    if [ -f  /lib/modules/bsa_acs.ko ]; then
-      insmod /lib/modules/bsa_acs.ko
-      echo "${SR_VERSION}" > ${LOG_DIR}/linux/BsaResultsApp.log
-      if [ "$automation_enabled" == "False" ]; then
-        # based on previous certification/complaince inputs, side effects are seen
-        # when bsa/sbsa test changes config of PCIe devices whose class code are
-        # display port, mass storage, network controller...SKIP them
-        /bin/bsa --skip-dp-nic-ms >> ${LOG_DIR}/linux/BsaResultsApp.log
-      else
-        echo "Running command $bsa_command --skip PCI_MM_03 --skip-dp-nic-ms"
-        $bsa_command --skip PCI_MM_03 --skip-dp-nic-ms  >> ${LOG_DIR}/linux/BsaResultsApp.log
-      fi
-      dmesg | sed -n 'H; /PE_INFO/h; ${g;p;}' > ${LOG_DIR}/linux/BsaResultsKernel.log
-      sync /mnt
-      sleep 5
-      echo "Linux BSA test Execution - Completed"
-    else
-      echo "Error: BSA kernel Driver is not found. Linux BSA tests cannot be run."
-    fi
-  fi
-
-  # Linux SBSA Execution
-  echo "Running Linux SBSA tests"
-  if [ "$automation_enabled" == "True" ]; then
-    if [ "$sbsa_enabled" == "False" ]; then
-      echo "********* SBSA is disabled in config file**************"
-    else
-      mkdir -p ${LOG_DIR}/linux
-      if [ -f  /lib/modules/sbsa_acs.ko ]; then
-        insmod /lib/modules/sbsa_acs.ko
-        echo "${SR_VERSION}" > ${LOG_DIR}/linux/SbsaResultsApp.log
-        echo "Running command $sbsa_command --skip PCI_MM_03 --skip-dp-nic-ms"
-        $sbsa_command --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/SbsaResultsApp.log
-        dmesg | sed -n 'H; /PE_INFO/h; ${g;p;}' > ${LOG_DIR}/linux/SbsaResultsKernel.log
-        sync /mnt
-        sleep 5
-        echo "Linux SBSA test Execution - Completed"
-      else
-        echo "Error: SBSA kernel Driver is not found. Linux SBSA tests cannot be run."
-      fi
-    fi
-  else
-    echo "SBSA test is disabled by default, please enable in config file to run Sbsa"
-  fi
-
-  # EDK2 test parser
-  if [ -d "${LOG_DIR}/sct_results" ]; then
-    echo "Running edk2-test-parser tool "
-    mkdir -p ${LOG_DIR}/edk2-test-parser
-    cd /usr/bin/edk2-test-parser
-    ./parser.py --md ${LOG_DIR}/edk2-test-parser/edk2-test-parser.log --config SBBR.yaml ${LOG_DIR}/sct_results/Overall/Summary.ekl ${LOG_DIR}/sct_results/Sequence/SBBR.seq > /dev/null 2>&1
-    cd -
-    echo "edk2-test-parser run completed"
-    sync /mnt
-    sleep 5
-  else
-    echo "SCT result does not exist, cannot run edk2-test-parser tool"
-  fi
-
-  #copying acs_run_config.ini into results directory.
-  mkdir -p ${LOG_DIR}/acs_summary/config
-
-  # Copying acs_run_config into result directory.
-  if [ -f /mnt/acs_tests/config/acs_run_config.ini ]; then
-    cp /mnt/acs_tests/config/acs_run_config.ini ${LOG_DIR}/acs_summary/config/
-  fi
-  # Copying acs_waiver.json into result directory.
-  if [ -f /mnt/acs_tests/config/acs_waiver.json ]; then
-    cp /mnt/acs_tests/config/acs_waiver.json ${LOG_DIR}/acs_summary/config/
-  fi
-  # Copying system_config.txt into result directory
-  if [ -f /mnt/acs_tests/config/system_config.txt ]; then
-    cp /mnt/acs_tests/config/system_config.txt ${LOG_DIR}/acs_summary/config/
-  fi
-  # Copying systemready-commit.log into result directory
-  if [ -f /mnt/acs_tests/config/systemready-commit.log ]; then
-    cp /mnt/acs_tests/config/systemready-commit.log ${LOG_DIR}/acs_summary/config/
-  fi
-  # Copying acs_config.txt into result directory
-  if [ -f /mnt/acs_tests/config/acs_config.txt ]; then
-    cp /mnt/acs_tests/config/acs_config.txt ${LOG_DIR}/acs_summary/config/
-  fi
-
-  sync /mnt
-
-  # systemready scripts for os logs
-  if [ -d "/usr/bin/systemready-scripts" ]; then
-    echo "Running systemready scripts "
-    if [ -f "${LOG_DIR}/post-script/post-script.log" ]; then
-      rm ${LOG_DIR}/post-script/post-script.log
-    else
-      mkdir -p ${LOG_DIR}/post-script
-    fi
-    python3 /usr/bin/systemready-scripts/check-sr-results.py --dir /mnt > ${LOG_DIR}/post-script/post-script.log 2>&1
-    sync /mnt
-    sleep 5
-  else
-    echo "systemready scripts does not exist, cannot run os logs check"
-  fi
-
-  # ACS log parser run
-  echo "Running acs log parser tool "
-  if [ -d "${LOG_DIR}" ]; then
-    if [ -d "${LOG_DIR}/acs_summary/acs_jsons" ]; then
-        rm -r ${LOG_DIR}/acs_summary/acs_jsons
-    fi
-    if [ -d "${LOG_DIR}/acs_summary/html_detailed_summaries" ]; then
-        rm -r ${LOG_DIR}/acs_summary/html_detailed_summaries
-    fi
-    /usr/bin/log_parser/main_log_parser.sh ${LOG_DIR} /mnt/acs_tests/config/acs_config.txt /mnt/acs_tests/config/system_config.txt /mnt/acs_tests/config/acs_waiver.json
-    sync /mnt
-    sleep 5
-  fi
+  # Linux dump, device drivers, FWTS, SBMR, BSA, SBSA and the result parsers.
+  # Finished steps are journaled on the results partition, so after a hang or
+  # reset the next boot resumes at the step that was interrupted.
+  python3 /usr/bin/linux_phase.py
 
   echo "Please wait acs results are syncing on storage medium."
   sync /mnt
-  sleep 60
 
   echo "ACS automated test suites run is completed."
   echo "Please reboot to run BBSR tests if not done"
@@ -323,6 +122,5 @@ else
 fi
 
 sync /mnt
-sleep 5
 
 exec sh +m
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stream the kernel log of a BSA/SBSA run from /dev/kmsg into its results log."""
+
+import argparse
+import collections
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+
+KMSG = "/dev/kmsg"
+
+# The ACS kernel module announces each run with its PE_INFO line; the
+# results log starts there, as dmesg | sed -n 'H; /PE_INFO/h; ${g;p;}' did.
+START_MARKER = "PE_INFO"
+
+# Records held while waiting for the start marker. They are written only
+# when the marker never shows up, which is what the sed script did too.
+HELD_RECORDS = 2000
+
+POLL_INTERVAL = 0.1
+
+KMSG_ESCAPE_RE = re.compile(rb"\\x([0-9a-fA-F]{2})")
+
+Record = collections.namedtuple("Record", "seq usec message")
+
+
+def parse_record(line):
+    """Parse one "prio,seq,usec,flags;text" kmsg line, or return None."""
+    prefix, sep, text = line.partition(b";")
+    if not sep:
+        return None
+    fields = prefix.split(b",")
+    try:
+        seq, usec = int(fields[1]), int(fields[2])
+    except (IndexError, ValueError):
+        return None
+    # the kernel escapes non-printable bytes as \xNN
+    text = KMSG_ESCAPE_RE.sub(lambda m: bytes([int(m.group(1), 16)]), text)
+    return Record(seq, usec, text.decode("utf-8", "replace"))
+
+
+def format_record(record):
+    # dmesg's timestamp with the sequence number inside the same brackets, so
+    # the log parsers strip both as one prefix
+    return "[%5d.%06d #%d] %s\n" % (record.usec // 1000000, record.usec % 1000000,
+                                    record.seq, record.message)
+
+
+class KmsgReader:
+    """Non-blocking reader returning the complete kmsg records available now."""
+
+    def __init__(self, path=KMSG, from_start=False):
+        self.fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        self.buffer = b""
+        self.overruns = 0
+        if not from_start:
+            try:
+                # only records logged from here on
+                os.lseek(self.fd, 0, os.SEEK_END)
+            except OSError:
+                pass
+
+    def read(self):
+        while True:
+            try:
+                chunk = os.read(self.fd, 8192)
+            except BlockingIOError:
+                break
+            except BrokenPipeError:
+                # the ring buffer overwrote records before they were read; the
+                # next read resumes at the oldest one left
+                self.overruns += 1
+                continue
+            if not chunk:
+                break
+            self.buffer += chunk
+
+        *lines, self.buffer = self.buffer.split(b"\n")
+        records = []
+        for line in lines:
+            # continuation lines (" SUBSYSTEM=...") carry device metadata
+            if line and not line.startswith(b" "):
+                record = parse_record(line)
+                if record:
+                    records.append(record)
+        return records
+
+    def close(self):
+        os.close(self.fd)
+
+
+class KernelLog:
+    """Write records from the start marker on, noting any that were lost."""
+
+    def __init__(self, out, start_marker=START_MARKER, include=None, held=HELD_RECORDS):
+        self.out = out
+        self.start = re.compile(start_marker) if start_marker else None
+        self.include = re.compile(include) if include else None
+        self.started = self.start is None
+        self.held = collections.deque(maxlen=held)
+        self.last_seq = None
+        self.lost = 0
+
+    def add(self, record):
+        if self.last_seq is not None and record.seq > self.last_seq + 1:
+            self.lost += record.seq - self.last_seq - 1
+            if self.started:
+                self.write_line(f"kmsg_capture: {record.seq - self.last_seq - 1} kernel "
+                                f"messages lost to a ring buffer overrun", record)
+        self.last_seq = record.seq
+
+        if not self.started:
+            if not self.start.search(record.message):
+                self.held.append(record)
+                return
+            self.started = True
+            self.held.clear()
+        elif self.include and not self.include.search(record.message):
+            return
+        self.out.write(format_record(record))
+        self.out.flush()
+
+    def write_line(self, text, record):
+        self.out.write(format_record(Record(record.seq - 1, record.usec, text)))
+
+    def finish(self):
+        if not self.started and self.held:
+            self.out.write(f"kmsg_capture: {self.start.pattern} not seen, "
+                           f"writing the last {len(self.held)} kernel messages\n")
+            for record in self.held:
+                self.out.write(format_record(record))
+        self.out.flush()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Capture the kernel log of a BSA/SBSA run from /dev/kmsg")
+    parser.add_argument("--output", default="-",
+                        help="Kernel results log, written as records arrive (default: stdout)")
+    parser.add_argument("--kmsg", default=KMSG, help="Kernel log device (default: %(default)s)")
+    parser.add_argument("--start-marker", default=START_MARKER,
+                        help="Regex of the first record written (default: %(default)s); "
+                             "empty writes every record")
+    parser.add_argument("--include", default=None,
+                        help="Regex records must match to be written after the start marker")
+    parser.add_argument("--from-start", action="store_true",
+                        help="Read the records already in the ring buffer too")
+    parser.add_argument("--follow", action="store_true",
+                        help="Without a command, keep reading until interrupted")
+    parser.add_argument("command", nargs=argparse.REMAINDER,
+                        help="-- followed by the ACS app to run while capturing")
+    args = parser.parse_args(argv)
+    if args.command[:1] == ["--"]:
+        args.command = args.command[1:]
+    return args
+
+
+def main(output="-", kmsg=KMSG, start_marker=START_MARKER, include=None,
+         from_start=False, follow=False, command=None):
+    try:
+        # opened before the app starts, so none of its messages are missed
+        reader = KmsgReader(kmsg, from_start)
+    except OSError as e:
+        print(f"WARNING: cannot read {kmsg}: {e.strerror or e}", file=sys.stderr)
+        reader = None
+
+    out = sys.stdout if output == "-" else open(output, "w")
+    log = KernelLog(out, start_marker, include)
+    stop = []
+    proc = None
+
+    def on_sigterm(signum, frame):
+        stop.append(signum)
+        # a wrapped app is stopped too; the capture ends when it exits
+        if proc is not None and proc.poll() is None:
+            proc.send_signal(signum)
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+
+    proc = subprocess.Popen(command) if command else None
+    try:
+        while True:
+            records = reader.read() if reader else []
+            for record in records:
+                log.add(record)
+            if proc is not None:
+                if proc.poll() is not None:
+                    break
+            elif not follow or stop:
+                break
+            if not records:
+                time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if proc is not None:
+            proc.wait()
+        if reader:
+            # whatever the app logged just before it exited
+            for record in reader.read():
+                log.add(record)
+            reader.close()
+        log.finish()
+        if out is not sys.stdout:
+            out.close()
+
+    if reader and (reader.overruns or log.lost):
+        print(f"WARNING: {log.lost} kernel messages were lost to ring buffer overruns",
+              file=sys.stderr)
+    if proc is None:
+        return 0
+    # a signalled app exits like it would from the shell
+    return 128 - proc.returncode if proc.returncode < 0 else proc.returncode
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.output, args.kmsg, args.start_marker, args.include,
+                  args.from_start, args.follow, args.command))
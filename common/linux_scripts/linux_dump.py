@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collect the Linux debug dump, running independent collectors in parallel."""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import time
+
+DEFAULT_TIMEOUT = 120
+DEFAULT_JOBS = 8
+MANIFEST_NAME = "linux_dump_manifest.json"
+
+
+def helper_command(script):
+    """Command line running a helper script installed next to this one."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), script)
+    return " ".join(shlex.quote(arg) for arg in (sys.executable or "python3", path))
+
+
+# walks /sys/firmware and the device classes in-process instead of ls/cp
+SYSFS_SNAPSHOT = helper_command("sysfs_snapshot.py")
+# disassembles tables across cores, reusing output for unchanged tables
+ACPI_DISASSEMBLE = helper_command("acpi_disassemble.py")
+# Kept out of the results directory so a results bundle never carries a
+# second copy of the tables; ACS_ACPI_CACHE_DIR moves it.
+ACPI_CACHE_DIR = "/var/cache/acs/acpi-tables"
+
+TIME_SYNC_RESTORE = """\
+echo "Restoring time sync..."
+if systemctl list-unit-files 2>/dev/null | grep -q chronyd; then
+    systemctl restart chronyd
+    chronyc -a makestep
+elif systemctl list-unit-files 2>/dev/null | grep -q systemd-timesyncd; then
+    systemctl restart systemd-timesyncd
+else
+    echo "No known time sync service found"
+fi"""
+
+# Every collector writes stdout and stderr to "output" inside the log directory.
+# "after" orders a collector behind others (only those selected for the mode),
+# "append" adds to an output written by an earlier collector in the chain.
+COLLECTORS = [
+    {"name": "dmesg", "command": "dmesg", "output": "dmesg.txt"},
+    {"name": "lspci", "command": "lspci", "output": "lspci.txt"},
+    {"name": "lspci-vvv", "command": "lspci -vvv", "output": "lspci-vvv.txt"},
+    {"name": "interrupts", "command": "cat /proc/interrupts",
+     "output": "cat-proc-interrupts.txt"},
+    {"name": "cpuinfo", "command": "cat /proc/cpuinfo", "output": "cat-proc-cpuinfo.txt"},
+    {"name": "meminfo", "command": "cat /proc/meminfo", "output": "cat-proc-meminfo.txt"},
+    {"name": "iomem", "command": "cat /proc/iomem", "output": "cat-proc-iomem.txt"},
+    {"name": "lscpu", "command": "lscpu", "output": "lscpu.txt"},
+    {"name": "lsblk", "command": "lsblk", "output": "lsblk.txt"},
+    {"name": "lsusb", "command": "lsusb", "output": "lsusb.txt"},
+    {"name": "lshw", "command": "lshw", "output": "lshw.txt", "timeout": 300},
+    {"name": "dmidecode", "command": "dmidecode", "output": "dmidecode.txt"},
+    {"name": "dmidecode-bin", "command": "dmidecode --dump-bin dmidecode.bin",
+     "output": "dmidecode.txt", "append": True, "after": ["dmidecode"]},
+    {"name": "uname", "command": "uname -a", "output": "uname-a.txt"},
+    {"name": "os-release", "command": "cat /etc/os-release", "output": "cat-etc-os-release.txt"},
+    {"name": "date", "command": "date", "output": "date.txt"},
+    {"name": "timedatectl", "command": "timedatectl", "output": "timedatectl.txt",
+     "modes": ["os"]},
+    {"name": "rtc", "command": "cat /proc/driver/rtc", "output": "cat-proc-driver-rtc.txt"},
+    {"name": "hwclock", "command": "hwclock", "output": "hwclock.txt"},
+    {"name": "efibootmgr", "command": "efibootmgr", "output": "efibootmgr.txt"},
+    {"name": "efibootmgr-t-20", "command": "efibootmgr -t 20", "output": "efibootmgr-t-20.txt",
+     "after": ["efibootmgr"]},
+    {"name": "efibootmgr-t-5", "command": "efibootmgr -t 5", "output": "efibootmgr-t-5.txt",
+     "after": ["efibootmgr-t-20"]},
+    {"name": "efibootmgr-c", "command": "efibootmgr -c", "output": "efibootmgr-c.txt",
+     "after": ["efibootmgr-t-5"]},
+    {"name": "ifconfig", "command": "ifconfig", "output": "ifconfig.txt"},
+    {"name": "ip-addr", "command": "ip addr show", "output": "ip-addr-show.txt"},
+    {"name": "ping", "command": "ping -c 5 www.arm.com", "output": "ping-c-5-www-arm-com.txt",
+     "timeout": 20},
+    {"name": "cmdline", "command": "cat /proc/cmdline", "output": "cat-proc-cmdline.txt"},
+    {"name": "df", "command": "df -h", "output": "df-h.txt"},
+    {"name": "mount", "command": "mount", "output": "mount.txt"},
+    {"name": "lsmod", "command": "lsmod", "output": "lsmod.txt"},
+    {"name": "acpidump", "command": "acpidump", "output": "acpi.log"},
+    {"name": "acpixtract", "command": "acpixtract -a acpi.log", "output": "acpixtract.txt",
+     "after": ["acpidump"]},
+    {"name": "iasl", "command": f'{ACPI_DISASSEMBLE} --cache-dir "${{ACS_ACPI_CACHE_DIR:-{ACPI_CACHE_DIR}}}"',
+     "output": "iasl.txt", "timeout": 300, "after": ["acpixtract"]},
+    {"name": "date-set", "command": 'date --set="20221215 05:30"',
+     "output": "date-set-202212150530.txt", "after": ["date", "timedatectl", "rtc", "hwclock"]},
+    {"name": "date-after-set", "command": "date", "output": "date-after-set.txt",
+     "after": ["date-set"]},
+    {"name": "hwclock-set", "command": 'hwclock --set --date "2023-01-01 09:10:15"',
+     "output": "hw-clock-set-20230101091015.txt", "after": ["date-after-set"]},
+    {"name": "hwclock-after-set", "command": "hwclock", "output": "hwclock-after-set.txt",
+     "after": ["hwclock-set"]},
+    {"name": "sysfs-snapshot",
+     "command": f"{SYSFS_SNAPSHOT} --view firmware --firmware-copy firmware "
+                "--json sysfs-snapshot.json",
+     "output": "firmware.txt", "timeout": 300},
+    {"name": "ipmitool", "command": "ipmitool -C 17 -N 3 -p 623 mc info",
+     "output": "ipmitool.txt", "modes": ["acs"]},
+    {"name": "debugfs-mount", "command": "mount -t debugfs none /sys/kernel/debug",
+     "output": "debugfs-mount.txt", "modes": ["acs"]},
+    {"name": "psci", "command": "cat /sys/kernel/debug/psci", "output": "psci.txt",
+     "modes": ["acs"], "after": ["debugfs-mount"]},
+    {"name": "psci-kernel", "command": "dmesg | grep -i psci", "output": "psci-kernel.txt",
+     "modes": ["acs"]},
+    {"name": "date-restore", "command": 'date --set="$ORIG_SYS_TIME"',
+     "output": "date-restore-original.txt", "modes": ["acs"], "after": ["hwclock-after-set"]},
+    {"name": "hwclock-systohc", "command": "hwclock --systohc", "output": "hwclock-systohc.txt",
+     "modes": ["acs"], "after": ["date-restore"]},
+    {"name": "time-sync-restore", "command": TIME_SYNC_RESTORE,
+     "output": "time-sync-restore.txt", "modes": ["os"], "after": ["hwclock-after-set"]},
+    {"name": "time-sync-settle", "command": "sleep 10", "output": None, "modes": ["os"],
+     "after": ["time-sync-restore"]},
+]
+
+
+def collectors_for_mode(collectors, mode):
+    """Select the collectors for mode, dropping dependencies on ones for other modes."""
+    selected = [c for c in collectors if mode in c.get("modes", [mode])]
+    skipped = {c.get("name") for c in collectors} - {c.get("name") for c in selected}
+    return [dict(c, after=[dep for dep in c.get("after", []) if dep not in skipped])
+            for c in selected]
+
+
+def validate_collectors(collectors):
+    """Return a list of problems in a collector manifest, empty when it is usable."""
+    problems = []
+    names = [c.get("name") for c in collectors]
+    known = set(names)
+    for name in sorted(known):
+        if names.count(name) > 1:
+            problems.append(f"duplicate collector {name}")
+
+    writers = {}
+    for collector in collectors:
+        if not collector.get("command"):
+            problems.append(f"{collector.get('name')}: missing command")
+        for dep in collector.get("after", []):
+            if dep not in known:
+                problems.append(f"{collector['name']}: unknown dependency {dep}")
+        output = collector.get("output")
+        if output and not collector.get("append"):
+            if output in writers:
+                problems.append(f"{collector['name']}: output {output} also written by "
+                                f"{writers[output]}")
+            writers[output] = collector["name"]
+
+    # every collector must be reachable, i.e. the "after" graph has no cycles
+    done = set()
+    pending = [c for c in collectors if c.get("name") in known]
+    while pending:
+        ready = [c for c in pending if set(c.get("after", [])) & known <= done]
+        if not ready:
+            problems.append("dependency cycle between " +
+                            ", ".join(sorted(c["name"] for c in pending)))
+            break
+        done.update(c["name"] for c in ready)
+        pending = [c for c in pending if c["name"] not in done]
+    return problems
+
+
+def run_collector(collector, log_dir, env, default_timeout):
+    """Run one collector in its own process group and return its manifest record."""
+    timeout = collector.get("timeout", default_timeout)
+    output = collector.get("output")
+    record = {
+        "name": collector["name"],
+        "command": collector["command"],
+        "output": output,
+        "exit_code": None,
+        "timed_out": False,
+        "duration_s": 0.0,
+    }
+
+    start = time.monotonic()
+    out = None
+    try:
+        if output:
+            out = open(os.path.join(log_dir, output), "ab" if collector.get("append") else "wb")
+        proc = subprocess.Popen(collector["command"], shell=True, cwd=log_dir, env=env,
+                                stdin=subprocess.DEVNULL,
+                                stdout=out if out else subprocess.DEVNULL,
+                                stderr=subprocess.STDOUT, start_new_session=True)
+        try:
+            record["exit_code"] = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # kill the whole group so pipelines and their children go too
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+            record["timed_out"] = True
+            if out:
+                out.write(f"\nTimed out after {timeout} s\n".encode())
+    except OSError as e:
+        record["error"] = str(e)
+    finally:
+        if out:
+            out.close()
+    record["duration_s"] = round(time.monotonic() - start, 3)
+    return record
+
+
+def run_collectors(collectors, log_dir, jobs=DEFAULT_JOBS, default_timeout=DEFAULT_TIMEOUT,
+                   env=None):
+    """Run collectors as soon as their dependencies finish, at most jobs at a time."""
+    pending = list(collectors)
+    finished = set()
+    records = {}
+    running = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for collector in [c for c in pending if set(c.get("after", [])) <= finished]:
+                pending.remove(collector)
+                future = pool.submit(run_collector, collector, log_dir, env, default_timeout)
+                running[future] = collector["name"]
+            if not running:
+                # whatever is left waits on something that never runs
+                for collector in pending:
+                    records[collector["name"]] = {
+                        "name": collector["name"], "command": collector["command"],
+                        "output": collector.get("output"), "exit_code": None,
+                        "timed_out": False, "duration_s": 0.0,
+                        "error": "unresolved dependency"}
+                break
+            done, _ = concurrent.futures.wait(running,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                records[name] = future.result()
+                finished.add(name)
+
+    # report in manifest order, not completion order
+    return [records[c["name"]] for c in collectors if c["name"] in records]
+
+
+def load_manifest(path):
+    with open(path, "r") as f:
+        collectors = json.load(f)
+    if not isinstance(collectors, list):
+        raise ValueError(f"{path}: expected a list of collectors")
+    return collectors
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Collect the Linux debug dump")
+    parser.add_argument("mode", choices=["os", "acs"],
+                        help="Run on an installed OS or inside the ACS image")
+    parser.add_argument("log_dir", help="Directory the dump is written to")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help="Collectors run at the same time (default: %(default)s)")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT,
+                        help="Seconds a collector may run unless it sets its own "
+                             "(default: %(default)s)")
+    parser.add_argument("--manifest", default=None,
+                        help="JSON list of collectors to run instead of the built-in set")
+    return parser.parse_args(argv)
+
+
+def main(mode, log_dir, jobs=DEFAULT_JOBS, timeout=DEFAULT_TIMEOUT, manifest=None):
+    collectors = load_manifest(manifest) if manifest else COLLECTORS
+    collectors = collectors_for_mode(collectors, mode)
+    problems = validate_collectors(collectors)
+    if problems:
+        for problem in problems:
+            print(f"ERROR: {problem}")
+        return 1
+
+    os.makedirs(log_dir, exist_ok=True)
+    print("Collecting Linux Debug Dump")
+
+    env = dict(os.environ)
+    # restored once the date/hwclock checks have run
+    env["ORIG_SYS_TIME"] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    start = time.monotonic()
+    records = run_collectors(collectors, log_dir, jobs, timeout, env)
+    summary = {
+        "mode": mode,
+        "jobs": jobs,
+        "duration_s": round(time.monotonic() - start, 3),
+        "collectors": records,
+    }
+    with open(os.path.join(log_dir, MANIFEST_NAME), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    for record in records:
+        if record["timed_out"]:
+            print(f"WARNING: {record['name']} timed out after {record['duration_s']} s")
+        elif "error" in record:
+            print(f"WARNING: {record['name']} did not run: {record['error']}")
+
+    print(f"Linux Debug Dump - Completed in {summary['duration_s']} s")
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.mode, args.log_dir, args.jobs, args.timeout, args.manifest))
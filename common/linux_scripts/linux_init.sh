@@ -19,7 +19,6 @@
 MODE="auto"
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
-LINUX_DUMP_SH="$SCRIPT_DIR/linux_dump.sh"
 
 usage() {
     cat <<EOF
@@ -118,16 +117,11 @@ install_os_tools() {
 }
 
 run_linux_dump() {
-    if [ ! -f "$LINUX_DUMP_SH" ]; then
-        if [ -f /usr/bin/linux_dump.sh ]; then
-            LINUX_DUMP_SH="/usr/bin/linux_dump.sh"
-        else
-            echo "linux_dump.sh not found"
-            exit 1
-        fi
+    if [ "$MODE" = "acs" ]; then
+        python3 /usr/bin/linux_dump.py "$MODE" "$LOG_DIR"
+    else
+        python3 "$SCRIPT_DIR/linux_dump.py" "$MODE" "$LOG_DIR"
     fi
-
-    sh "$LINUX_DUMP_SH" "$MODE" "$LOG_DIR"
 }
 
 run_block_device_check() {
@@ -144,11 +138,13 @@ run_block_device_check() {
 
 run_ethtool_check() {
     echo "Running Ethtool test Script"
+    # interfaces validated concurrently, each with its own policy-routing table
+    ethtool_jobs="${ETHTOOL_JOBS:-4}"
 
     if [ "$MODE" = "acs" ]; then
-        python3 /usr/bin/ethtool-test.py /mnt/acs_tests/config/system_config.txt | tee "$LOG_DIR/ethtool-test-temp.log"
+        python3 /usr/bin/ethtool-test.py --jobs "$ethtool_jobs" /mnt/acs_tests/config/system_config.txt | tee "$LOG_DIR/ethtool-test-temp.log"
     else
-        python3 "$SCRIPT_DIR/ethtool-test.py" "$SCRIPT_DIR/system_config.txt" | tee "$LOG_DIR/ethtool-test-temp.log"
+        python3 "$SCRIPT_DIR/ethtool-test.py" --jobs "$ethtool_jobs" "$SCRIPT_DIR/system_config.txt" | tee "$LOG_DIR/ethtool-test-temp.log"
     fi
 
     awk '{gsub(/\x1B\[[0-9;]*[JKmsu]/, "")}1' "$LOG_DIR/ethtool-test-temp.log" > "$LOG_DIR/ethtool-test.log"
@@ -198,8 +194,7 @@ print_os_copy_instructions() {
 
 sync_results() {
     if [ "$MODE" = "acs" ]; then
-        sync /mnt 2>/dev/null || sync
-        sleep 5
+        python3 /usr/bin/results_writer.py sync "$LOG_DIR" || sync
     else
         sync
     fi
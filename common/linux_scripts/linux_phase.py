@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run the ACS Linux phase step by step, resuming after a hang or reset."""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import shlex
+import subprocess
+import sys
+import threading
+
+from results_writer import StepJournal, settle, sync_paths
+
+SR_VERSION = "SystemReady band ACS v3.1.1"
+LOG_DIR = "/mnt/acs_results_template/acs_results"
+JOURNAL = "/mnt/acs_results_template/linux_steps.journal"
+PARSER = "/mnt/acs_tests/parser/Parser.py"
+CONFIG = "/mnt/acs_tests/config/acs_run_config.ini"
+CONFIG_CACHE = "/mnt/acs_tests/config/acs_run_config.cache"
+
+# A step that was started this many times without finishing took the board
+# down with it; it is recorded as interrupted and the run moves on.
+MAX_ATTEMPTS = 2
+
+DEFAULT_JOBS = 4
+
+# What a step touches. Steps sharing anything but "read-only" never overlap;
+# "exclusive" steps (BSA/SBSA reprogram PCIe config space and load test
+# drivers) run with nothing else in flight.
+RESOURCES = {"read-only", "block", "network", "firmware", "pcie-config"}
+
+# runs the read-only FWTS table tests in parallel fwts processes, merged
+# back into one log in the configured test order
+FWTS_SHARDS = "python3 /usr/bin/fwts_shards.py -- "
+
+# streams the ACS module's kernel messages into the results log while the app runs
+KMSG_CAPTURE = 'python3 /usr/bin/kmsg_capture.py --output "$LOG_DIR/linux/%s" -- '
+
+SBMR_IN_BAND = """\
+python redfish-finder
+cd sbmr-acs
+./run-sbmr-acs.sh linux ${sbmr_level:+--level "$sbmr_level"}
+mkdir -p "$LOG_DIR/sbmr"
+cp -r logs "$LOG_DIR/sbmr/sbmr_in_band_logs"
+echo "NOTE: This ACS image runs SBMR IN-BAND tests ONLY." 1>&2
+echo "For SBMR OUT-OF-BAND tests, see: https://github.com/ARM-software/sbmr-acs.git" 1>&2"""
+
+CONFIG_COPY = """\
+mkdir -p "$LOG_DIR/acs_summary/config"
+for file in acs_run_config.ini acs_waiver.json system_config.txt systemready-commit.log acs_config.txt; do
+    if [ -f "/mnt/acs_tests/config/$file" ]; then
+        cp "/mnt/acs_tests/config/$file" "$LOG_DIR/acs_summary/config/"
+    fi
+done"""
+
+LOG_PARSER = """\
+rm -rf "$LOG_DIR/acs_summary/acs_jsons" "$LOG_DIR/acs_summary/html_detailed_summaries"
+/usr/bin/log_parser/main_log_parser.sh "$LOG_DIR" /mnt/acs_tests/config/acs_config.txt \
+    /mnt/acs_tests/config/system_config.txt /mnt/acs_tests/config/acs_waiver.json"""
+
+# Commands run through the shell with the acs_run_config.ini settings and
+# LOG_DIR in the environment. "log" captures stdout under LOG_DIR ("header"
+# starts it with the ACS version); "sync" lists further outputs to flush.
+# "flag" names the setting that disables the step in an automation run, and
+# "automation_only" steps run only when automation is enabled. "summary"
+# steps also follow a rerun, so the reports pick up the new results.
+# "resources" and "exclusive" decide which steps may run at the same time;
+# "after" names earlier steps that must have finished first.
+STEPS = [
+    # block device and ethtool checks read/write disks and bring links up;
+    # the dump also sets the RTC and adds a UEFI boot entry
+    {"name": "linux_dump", "title": "Linux debug dump", "cwd": "/usr/bin",
+     "command": "./linux_init.sh --mode acs", "sync": ["linux_dump"],
+     "resources": ["block", "network", "firmware"]},
+    {"name": "device_driver", "title": "Device Driver Matching Script",
+     "command": 'python3 /usr/bin/sysfs_snapshot.py --json "$LOG_DIR/linux_dump/device_driver.json"',
+     "log": "linux_dump/device_driver.log", "sync": ["linux_dump/device_driver.json"],
+     "resources": ["read-only"], "after": ["linux_dump"]},
+    # ACPI table checks only read, but the UEFI runtime and SMCCC tests call
+    # into firmware
+    {"name": "fwts", "title": "FWTS", "flag": "fwts_enabled", "resources": ["firmware"],
+     "setup": "if [ -f /lib/modules/smccc_test.ko ]; then "
+              "echo 'Loading FWTS SMCCC module'; insmod /lib/modules/smccc_test.ko; "
+              "else echo 'Error: FWTS SMCCC kernel Driver is not found.'; fi",
+     "command": FWTS_SHARDS + "fwts -r stdout -q --uefi-set-var-multiple=1 --uefi-get-mn-count-multiple=1 "
+                "--sbbr aest cedt slit srat hmat pcct pdtt bgrt bert einj erst hest sdei "
+                "nfit iort mpam ibft ras2 smccc",
+     "automation_command": FWTS_SHARDS + "$fwts_command -r stdout -q",
+     "log": "fwts/FWTSResults.log", "header": True},
+    {"name": "sbmr", "title": "SBMR-ACS In-Band", "flag": "sbmr_enabled",
+     "automation_only": True, "cwd": "/usr/bin", "command": SBMR_IN_BAND, "sync": ["sbmr"],
+     "resources": ["network"]},
+    {"name": "edk2_test_parser", "title": "edk2-test-parser", "requires": "sct_results",
+     "missing": "SCT result does not exist, cannot run edk2-test-parser tool",
+     "cwd": "/usr/bin/edk2-test-parser",
+     "command": 'mkdir -p "$LOG_DIR/edk2-test-parser"; '
+                './parser.py --md "$LOG_DIR/edk2-test-parser/edk2-test-parser.log" '
+                '--config SBBR.yaml "$LOG_DIR/sct_results/Overall/Summary.ekl" '
+                '"$LOG_DIR/sct_results/Sequence/SBBR.seq" > /dev/null 2>&1',
+     "sync": ["edk2-test-parser"], "resources": ["read-only"]},
+    {"name": "config_copy", "title": "Config copy", "command": CONFIG_COPY,
+     "sync": ["acs_summary/config"], "summary": True, "resources": ["read-only"]},
+    {"name": "bsa", "title": "Linux BSA", "flag": "bsa_enabled", "exclusive": True,
+     "requires": "/lib/modules/bsa_acs.ko",
+     "missing": "Error: BSA kernel Driver is not found. Linux BSA tests cannot be run.",
+     "setup": "insmod /lib/modules/bsa_acs.ko",
+     # side effects are seen when BSA/SBSA change the config of display,
+     # mass storage and network PCIe devices, so those are skipped
+     "command": KMSG_CAPTURE % "BsaResultsKernel.log" + "/bin/bsa --skip-dp-nic-ms",
+     "automation_command": KMSG_CAPTURE % "BsaResultsKernel.log"
+                           + "$bsa_command --skip PCI_MM_03 --skip-dp-nic-ms",
+     "log": "linux/BsaResultsApp.log", "header": True,
+     "sync": ["linux/BsaResultsKernel.log"]},
+    {"name": "sbsa", "title": "Linux SBSA", "flag": "sbsa_enabled", "automation_only": True,
+     "exclusive": True,
+     "requires": "/lib/modules/sbsa_acs.ko",
+     "missing": "Error: SBSA kernel Driver is not found. Linux SBSA tests cannot be run.",
+     "setup": "insmod /lib/modules/sbsa_acs.ko",
+     "command": KMSG_CAPTURE % "SbsaResultsKernel.log"
+                + "$sbsa_command --skip PCI_MM_03 --skip-dp-nic-ms",
+     "log": "linux/SbsaResultsApp.log", "header": True,
+     "sync": ["linux/SbsaResultsKernel.log"]},
+    # the result checks read every suite's logs, so they wait for all of them
+    {"name": "post_script", "title": "systemready scripts",
+     "requires": "/usr/bin/systemready-scripts",
+     "missing": "systemready scripts does not exist, cannot run os logs check",
+     "command": "python3 /usr/bin/systemready-scripts/check-sr-results.py --dir /mnt 2>&1",
+     "log": "post-script/post-script.log", "summary": True, "resources": ["read-only"],
+     "after": ["linux_dump", "device_driver", "fwts", "sbmr", "edk2_test_parser",
+               "config_copy", "bsa", "sbsa"]},
+    {"name": "log_parser", "title": "acs log parser", "command": LOG_PARSER,
+     "sync": ["acs_summary"], "summary": True, "resources": ["read-only"],
+     "after": ["post_script"]},
+]
+
+
+def load_settings(parser=PARSER, config=CONFIG, cache=CONFIG_CACHE):
+    """Return acs_run_config.ini settings as exported by Parser.py --export-shell."""
+    command = [sys.executable or "python3", parser, "--export-shell", "--config", config]
+    if cache:
+        command += ["--cache", cache]
+    try:
+        output = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                universal_newlines=True).stdout
+    except OSError as e:
+        print(f"Warning: could not read {config}: {e}")
+        return {}
+
+    settings = {}
+    for line in output.splitlines():
+        name, sep, value = line.partition("=")
+        if sep and not line.startswith("#"):
+            settings[name] = " ".join(shlex.split(value))
+    return settings
+
+
+def load_manifest(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def validate_steps(steps):
+    """Return a list of problems with a step list; empty when it can be scheduled."""
+    errors = []
+    seen = set()
+    for step in steps:
+        name = step.get("name")
+        if name in seen:
+            errors.append(f"{name}: duplicate step name")
+        for resource in step.get("resources", []):
+            if resource not in RESOURCES:
+                errors.append(f"{name}: unknown resource {resource}")
+        # only earlier steps may be named, which also rules out cycles
+        for dep in step.get("after", []):
+            if dep not in seen:
+                errors.append(f"{name}: 'after' must name an earlier step, not {dep}")
+        seen.add(name)
+    return errors
+
+
+def rerun_names(text):
+    return [name.strip() for name in text.replace(",", " ").split() if name.strip()]
+
+
+def skip_reason(step, settings, log_dir):
+    """Return why a step does not run under this config, or None when it does."""
+    automation = settings.get("automation_enabled") == "True"
+    flag = step.get("flag")
+    if step.get("automation_only") and not automation:
+        return (f"{step['title']} test is disabled by default, "
+                f"please enable in config file to run {step['title']}")
+    if automation and flag and settings.get(flag) == "False":
+        return f"********* {step['title']} is disabled in config file**************"
+    requires = step.get("requires")
+    if requires and not os.path.exists(os.path.join(log_dir, requires)):
+        return step.get("missing", f"{requires} does not exist, cannot run {step['title']}")
+    return None
+
+
+def step_state(entries):
+    """Map each step to its last status and to the number of times it was started."""
+    status, attempts = {}, {}
+    for entry in entries:
+        status[entry["step"]] = entry.get("status")
+        if entry.get("status") == "started":
+            attempts[entry["step"]] = attempts.get(entry["step"], 0) + 1
+    return status, attempts
+
+
+def run_step(step, settings, log_dir):
+    """Run one step with its output streamed to its log; return its exit code."""
+    env = dict(os.environ, LOG_DIR=log_dir, SR_VERSION=SR_VERSION)
+    env.update(settings)
+    cwd = step.get("cwd")
+    automation = settings.get("automation_enabled") == "True"
+    command = step.get("automation_command") if automation else None
+    command = command or step["command"]
+
+    if step.get("setup"):
+        subprocess.run(step["setup"], shell=True, cwd=cwd, env=env)
+
+    log = os.path.join(log_dir, step["log"]) if step.get("log") else None
+    if log:
+        os.makedirs(os.path.dirname(log), exist_ok=True)
+        with open(log, "w") as f:
+            if step.get("header"):
+                f.write(SR_VERSION + "\n")
+                f.flush()
+            code = subprocess.run(command, shell=True, cwd=cwd, env=env, stdout=f).returncode
+    else:
+        code = subprocess.run(command, shell=True, cwd=cwd, env=env).returncode
+    return code
+
+
+def shared_resources(step):
+    return set(step.get("resources", [])) - {"read-only"}
+
+
+def next_runnable(pending, running, finished, planned):
+    """Pick the first pending step that may start next to the running ones."""
+    for step in pending:
+        if any(dep in planned and dep not in finished for dep in step.get("after", [])):
+            continue
+        if running and step.get("exclusive"):
+            # nothing later jumps the queue while an exclusive step waits
+            return None
+        if any(other.get("exclusive") for other in running):
+            return None
+        busy = set().union(*(shared_resources(other) for other in running))
+        if shared_resources(step) & busy:
+            continue
+        return step
+    return None
+
+
+def step_outputs(step, log_dir):
+    paths = [step["log"]] if step.get("log") else []
+    return [os.path.join(log_dir, path) for path in paths + step.get("sync", [])]
+
+
+def settle_seconds_setting(settings):
+    """Return settle_seconds from the settings; a bad value warns and means no pause."""
+    value = settings.get("settle_seconds") or "0"
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = -1
+    if not 0 <= seconds < float("inf"):
+        print(f"Warning: settle_seconds = {value} is not a number of seconds; using 0")
+        return 0
+    return seconds
+
+
+def run_steps(plan, settings, log_dir, journal, jobs=DEFAULT_JOBS, settle_seconds=0):
+    """Run the planned steps, overlapping those whose resources do not clash."""
+    lock = threading.Lock()
+
+    def execute(step):
+        with lock:
+            # flushed so the console shows it ahead of the step's own output
+            print(f"Running {step['title']}", flush=True)
+            # journaled first, so a step that resets the board is not retried forever
+            journal.record(step["name"], "started")
+        try:
+            code = run_step(step, settings, log_dir)
+        except OSError as e:
+            print(f"ERROR: {step['title']} could not be run: {e}")
+            code = None
+        sync_paths(step_outputs(step, log_dir))
+        with lock:
+            journal.record(step["name"], "done", exit_code=code)
+            print(f"{step['title']} Execution - Completed", flush=True)
+        settle(settle_seconds)
+
+    planned = {step["name"] for step in plan}
+    pending, running, finished = list(plan), {}, set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        while pending or running:
+            while pending and len(running) < max(jobs, 1):
+                step = next_runnable(pending, running.values(), finished, planned)
+                if step is None:
+                    break
+                pending.remove(step)
+                running[pool.submit(execute, step)] = step
+            done, _ = concurrent.futures.wait(running,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                finished.add(running.pop(future)["name"])
+                future.result()
+
+
+def main(log_dir=LOG_DIR, journal_path=JOURNAL, parser=PARSER, config=CONFIG,
+         cache=CONFIG_CACHE, manifest=None, rerun=None, jobs=DEFAULT_JOBS):
+    steps = load_manifest(manifest) if manifest else STEPS
+    errors = validate_steps(steps)
+    for error in errors:
+        print(f"ERROR: {error}")
+    if errors:
+        return 1
+
+    settings = load_settings(parser, config, cache)
+    names = [step["name"] for step in steps]
+
+    rerun = rerun_names(settings.get("rerun_steps", "") if rerun is None else rerun)
+    unknown = [name for name in rerun if name not in names]
+    if unknown:
+        print(f"ERROR: unknown step in rerun_steps: {', '.join(unknown)}")
+        print(f"Valid steps: {', '.join(names)}")
+        return 1
+    if rerun:
+        print(f"Re-running {', '.join(rerun)} as requested in {config}")
+
+    journal = StepJournal(journal_path)
+    journal.start()
+    status, attempts = step_state(journal.entries())
+    settle_seconds = settle_seconds_setting(settings)
+
+    plan = []
+    for step in steps:
+        name = step["name"]
+        if rerun and name not in rerun and not step.get("summary"):
+            continue
+        if status.get(name) in ("done", "interrupted"):
+            print(f"{step['title']} already completed, skipping")
+            continue
+        if attempts.get(name, 0) >= MAX_ATTEMPTS:
+            print(f"ERROR: {step['title']} did not complete in {MAX_ATTEMPTS} attempts, skipping")
+            journal.record(name, "interrupted")
+            continue
+
+        reason = skip_reason(step, settings, log_dir)
+        if reason:
+            print(reason)
+            continue
+        if attempts.get(name):
+            # retried alone, so another reset is blamed on the right step
+            step = dict(step, exclusive=True)
+        plan.append(step)
+
+    run_steps(plan, settings, log_dir, journal, jobs, settle_seconds)
+    journal.finish()
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the ACS Linux phase, resuming after a reset")
+    parser.add_argument("--log-dir", default=LOG_DIR, help="ACS results directory")
+    parser.add_argument("--journal", default=JOURNAL, help="Completed-step journal")
+    parser.add_argument("--parser", default=PARSER, help="Parser.py exporting the run config")
+    parser.add_argument("--config", default=CONFIG, help="acs_run_config.ini")
+    parser.add_argument("--cache", default=CONFIG_CACHE,
+                        help="Parser.py cache for the exported config")
+    parser.add_argument("--manifest", default=None,
+                        help="JSON list of steps replacing the built-in Linux phase")
+    parser.add_argument("--rerun", default=None,
+                        help="Steps to run on their own (default: rerun_steps in the config)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help="Steps run at the same time at most; 1 runs them in order "
+                             "(default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.log_dir, args.journal, args.parser, args.config, args.cache,
+                  args.manifest, args.rerun, args.jobs))
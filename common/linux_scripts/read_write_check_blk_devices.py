@@ -18,15 +18,39 @@
 
 The script detects block devices, identifies MBR/GPT/raw devices, skips known
 precious partitions, performs a block read test, and optionally performs a
-single-block write/restore verification on non-precious partitions.
+single-block write/restore verification on non-precious partitions. Block I/O
+is done in-process with sector-aligned pread/pwrite (O_DIRECT where
+supported); the original block is kept in memory and restored even if the
+write or read-back fails.
+
+Disks and partitions are discovered from /sys/block and partition tables are
+parsed directly from the device, falling back to lsblk/gdisk/fdisk/sgdisk when
+either is unavailable. Disks are scanned concurrently; reporting and the
+interactive write checks then run disk by disk in detection order.
+
+With --benchmark, each non-precious partition (or raw disk) that passed the
+block read also gets a time-bounded sequential and random read benchmark; MB/s,
+IOPS and latency percentiles are logged for logs_to_json.py.
 """
 
+import argparse
+import errno
+import fcntl
 import hashlib
+import itertools
+import mmap
 import os
+import random
 import re
+import struct
 import subprocess
 import sys
 import threading
+import time
+import uuid
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Precious partitions dictionary. This is a set of partition types that might
@@ -43,6 +67,38 @@ PRECIOUS_PARTS_GPT = {
     "U-Boot environment partition": "3DE21764-95BD-54BD-A5C3-4ABE786F38A8",
 }
 
+SYS_BLOCK = "/sys/block"
+DEV_DIR = "/dev"
+
+# Disks scanned (partition table parse + block reads) at the same time.
+SCAN_WORKERS = 8
+
+# ioctl returning the logical sector size of a block device.
+BLKSSZGET = 0x1268
+READ_CHECK_BYTES = 1024 * 1024
+WRITE_CHECK_PATTERN = b"Hello!"
+
+# Read benchmark request sizes; both are multiples of any logical sector size.
+BENCH_SEQUENTIAL_BLOCK_BYTES = 1024 * 1024
+BENCH_RANDOM_BLOCK_BYTES = 4096
+BENCH_PERCENTILES = (50, 95, 99)
+
+# lsblk -e 7: loop devices are not reported.
+LOOP_MAJOR = "7"
+
+MBR_SIGNATURE = b"\x55\xaa"
+MBR_PROTECTIVE_TYPE = 0xEE
+MBR_EXTENDED_TYPES = {0x05, 0x0F, 0x85}
+GPT_SIGNATURE = b"EFI PART"
+# Room for the usual 128 x 128-byte GPT entry array right after the header.
+GPT_ENTRY_ARRAY_BYTES = 128 * 128
+
+# type_id is "0xNN" (MBR) or a type GUID (GPT); None if it could not be parsed.
+Partition = namedtuple("Partition", ["label", "type_id", "platform_required"])
+
+# --benchmark settings: seconds per access pattern and reads kept in flight.
+ReadBenchmark = namedtuple("ReadBenchmark", ["seconds", "queue_depth"])
+
 SEPARATOR = (
     "\n"
     "****************************************************************"
@@ -80,15 +136,74 @@ def input_with_timeout(prompt, timeout=5):
     return input_queue[0] if input_queue else "no"
 
 
-def calculate_sha256(file_path):
-    """Calculate and return the SHA256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
-
-    with open(file_path, "rb") as file_obj:
-        for byte_block in iter(lambda: file_obj.read(4096), b""):
-            sha256_hash.update(byte_block)
-
-    return sha256_hash.hexdigest()
+class BlockDevice:
+    """Sector-aligned pread/pwrite access to a block device.
+
+    O_DIRECT is used when the device supports it so reads come from the
+    device, not the page cache; otherwise cached pages are dropped before
+    each read.
+    """
+
+    def __init__(self, path, writable=False):
+        self.path = path
+        self.direct = False
+        flags = os.O_RDWR if writable else os.O_RDONLY
+        direct_flag = getattr(os, "O_DIRECT", 0)
+        self.fd = None
+        if direct_flag:
+            try:
+                self.fd = os.open(path, flags | direct_flag)
+                self.direct = True
+            except OSError as error:
+                if error.errno != errno.EINVAL:
+                    raise
+        if self.fd is None:
+            self.fd = os.open(path, flags)
+        self.sector = self._logical_sector_size()
+
+    def _logical_sector_size(self):
+        try:
+            raw = fcntl.ioctl(self.fd, BLKSSZGET, bytes(4))
+        except OSError:
+            return 512
+        return struct.unpack("I", raw)[0] or 512
+
+    def size(self):
+        """Return the device size in bytes."""
+        return os.lseek(self.fd, 0, os.SEEK_END)
+
+    def readinto(self, buffer, offset):
+        """Fill a page-aligned buffer from offset; return the byte count read."""
+        if not self.direct:
+            os.posix_fadvise(self.fd, offset, len(buffer), os.POSIX_FADV_DONTNEED)
+        return os.preadv(self.fd, [buffer], offset)
+
+    def read(self, offset, length):
+        """Read length bytes at offset; may return fewer at the end of the device."""
+        # Anonymous mmaps are page aligned, as O_DIRECT requires.
+        with mmap.mmap(-1, length) as buffer:
+            count = self.readinto(buffer, offset)
+            return buffer[:count]
+
+    def write(self, offset, data):
+        """Write data at offset and flush it to the device."""
+        with mmap.mmap(-1, len(data)) as buffer:
+            buffer.write(data)
+            written = os.pwrite(self.fd, buffer, offset)
+        if written != len(data):
+            raise OSError(errno.EIO, f"short write ({written} of {len(data)} bytes)")
+        os.fsync(self.fd)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 def get_partition_space(partition_path):
@@ -125,33 +240,83 @@ def is_ram_disk(device):
     return device.startswith("ram")
 
 
-def create_hello_file(file_path):
-    """Create a 512-byte test file and return its SHA256 checksum."""
-    hello_content = "Hello!".ljust(512, "\x00")
+def restore_backup(device, device_path, offset, backup):
+    """Write the backed-up block back and verify it; save it to a file on failure."""
+    print("INFO: Restoring the backup to the device after write check...")
+    try:
+        device.write(offset, backup)
+        if device.read(offset, len(backup)) != backup:
+            raise OSError(errno.EIO, "restored block does not match the backup")
+    except OSError as error:
+        rescue_file = os.path.abspath(
+            f"{os.path.basename(device_path)}_backup_{offset}.bin"
+        )
+        with open(rescue_file, "wb") as file_obj:
+            file_obj.write(backup)
+        print(
+            f"ERROR: Failed to restore {device_path} at byte offset {offset}: {error}. "
+            f"Original block saved to {rescue_file}"
+        )
+        return False
 
-    with open(file_path, "wb") as file_obj:
-        file_obj.write(hello_content.encode("utf-8"))
+    print(f"INFO: Backup restored for {device_path}.")
+    return True
 
-    return calculate_sha256(file_path)
 
+def verify_block_write(device, device_path, offset):
+    """Back up, write, read back and restore one sector; return True if it verified."""
+    offset -= offset % device.sector
+    test_data = WRITE_CHECK_PATTERN.ljust(device.sector, b"\x00")
+
+    print("INFO: Creating backup of the current block before write check...")
+    try:
+        backup = device.read(offset, device.sector)
+    except OSError as error:
+        backup = b""
+        print(f"WARNING: Unable to back up {device_path}: {error}")
+    if len(backup) != device.sector:
+        print(f"WARNING: No complete block to back up on {device_path}. Skipping write check.")
+        return False
+
+    passed = False
+    try:
+        print("INFO: Writing test data to the device for write check...")
+        device.write(offset, test_data)
 
-def cleanup_files(file_paths):
-    """Remove temporary files if they exist."""
-    for file_path in file_paths:
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        print("INFO: Reading back the test data for verification...")
+        read_back = device.read(offset, device.sector)
 
+        print(f"Original SHA256: {hashlib.sha256(test_data).hexdigest()}")
+        print(f"Read-back SHA256: {hashlib.sha256(read_back).hexdigest()}")
+        passed = read_back == test_data
+        if passed:
+            print(f"INFO: write check passed on {device_path}.")
+        else:
+            print(f"INFO: write check failed on {device_path}.")
+            print(
+                f"WARNING: Data integrity check failed for {device_path}. "
+                "Possible data corruption."
+            )
+    except OSError as error:
+        print(f"INFO: write check failed on {device_path}.")
+        print(f"WARNING: I/O error during write check on {device_path}: {error}")
+    finally:
+        restore_backup(device, device_path, offset, backup)
 
-def restore_backup(partition_label, backup_filename, used_blocks):
-    """Restore the backed-up block to the target partition."""
-    print("INFO: Restoring the backup to the device after write check...")
-    run_command(["dd", f"if={backup_filename}", f"of=/dev/{partition_label}",
-                 "bs=512", "count=1", f"seek={used_blocks}"], check=True)
-    print(f"INFO: Backup restored for /dev/{partition_label}.")
+    return passed
 
 
-def perform_write_check(partition_label, partition_id, precious_parts):
-    """Optionally perform a single-block write/read/restore check."""
+def write_check_offsets(used_blocks, available_blocks, samples):
+    """Return the 512-byte block numbers to test: after the used space, then spread."""
+    step = available_blocks // samples
+    return sorted({used_blocks + index * step for index in range(samples)})
+
+
+def perform_write_check(partition_label, partition_id, precious_parts, samples=1):
+    """Optionally perform a single-block write/read/restore check.
+
+    With samples > 1, that many blocks spread over the free space are checked.
+    """
     device_path = f"/dev/{partition_label}"
 
     if is_mounted(device_path):
@@ -176,40 +341,180 @@ def perform_write_check(partition_label, partition_id, precious_parts):
         )
         return
 
-    hello_file = "hello.txt"
-    read_back_file = "read_hello.txt"
-    backup_filename = f"{partition_label}_backup.bin"
+    try:
+        device = BlockDevice(os.path.join(DEV_DIR, partition_label), writable=True)
+    except OSError as error:
+        print(f"INFO: write check failed on {device_path}.")
+        print(f"WARNING: Unable to open {device_path} for write check: {error}")
+        return
 
-    original_sha256 = create_hello_file(hello_file)
+    with device:
+        blocks = write_check_offsets(used_blocks, available_blocks, samples)
+        for block in blocks:
+            if len(blocks) > 1:
+                print(f"INFO: Write check at 512-byte block {block} of {device_path}")
+            verify_block_write(device, device_path, block * 512)
 
-    print("INFO: Creating backup of the current block before write check...")
-    run_command(["dd", f"if={device_path}", f"of={backup_filename}",
-                 "bs=512", "count=1", f"skip={used_blocks}"], check=True)
 
-    print("INFO: Writing test data to the device for write check...")
-    run_command(["dd", f"if={hello_file}", f"of={device_path}",
-                 "bs=512", "count=1", f"seek={used_blocks}"], check=True)
+def read_sysfs_attr(*path_parts):
+    """Return a stripped /sys/block attribute, or None if it cannot be read."""
+    try:
+        with open(os.path.join(SYS_BLOCK, *path_parts), encoding="utf-8") as file_obj:
+            return file_obj.read().strip()
+    except OSError:
+        return None
+
+
+def is_sysfs_disk(name):
+    """Return True for /sys/block entries lsblk would list with TYPE disk."""
+    major = (read_sysfs_attr(name, "dev") or "").split(":")[0]
+    if major == LOOP_MAJOR:
+        return False
+    # Device-mapper and MD RAID devices are reported as lvm/raidN, not disk.
+    if os.path.isdir(os.path.join(SYS_BLOCK, name, "dm")) or \
+            os.path.isdir(os.path.join(SYS_BLOCK, name, "md")):
+        return False
+    # SCSI type 5 is an optical drive (TYPE rom).
+    return read_sysfs_attr(name, "device", "type") != "5"
+
+
+def get_sysfs_disks():
+    """Return disks listed in /sys/block, or None if it is unavailable."""
+    try:
+        names = sorted(os.listdir(SYS_BLOCK))
+    except OSError:
+        return None
+    return [name for name in names if is_sysfs_disk(name)]
+
 
-    print("INFO: Reading back the test data for verification...")
-    run_command(["dd", f"if={device_path}", f"of={read_back_file}",
-                 "bs=512", "count=1", f"skip={used_blocks}"], check=True)
+def get_sysfs_partitions(disk):
+    """Return [(number, label)] from /sys/block/<disk>, or None if unavailable."""
+    try:
+        entries = os.listdir(os.path.join(SYS_BLOCK, disk))
+    except OSError:
+        return None
+
+    partitions = []
+    for entry in entries:
+        number = read_sysfs_attr(disk, entry, "partition")
+        if number and number.isdigit():
+            partitions.append((int(number), entry))
+    return sorted(partitions)
+
+
+def parse_mbr_entries(sector_data):
+    """Return [(slot, type, start_lba)] for the used entries of an MBR/EBR sector."""
+    entries = []
+    for slot in range(4):
+        offset = 446 + 16 * slot
+        part_type = sector_data[offset + 4]
+        start_lba = struct.unpack_from("<I", sector_data, offset + 8)[0]
+        if part_type:
+            entries.append((slot, part_type, start_lba))
+    return entries
+
+
+def read_logical_partitions(fd, sector, extended_start, first_number=5):
+    """Walk the EBR chain of an extended partition; return {number: type}."""
+    types = {}
+    ebr_lba = extended_start
+    number = first_number
+    # Bound the walk so a looping chain cannot hang the scan.
+    for _ in range(256):
+        ebr = os.pread(fd, sector, ebr_lba * sector)
+        if len(ebr) < 512 or ebr[510:512] != MBR_SIGNATURE:
+            break
+        entries = parse_mbr_entries(ebr)
+        next_lba = None
+        for slot, part_type, start_lba in entries:
+            if slot == 0 and part_type not in MBR_EXTENDED_TYPES:
+                types[number] = part_type
+                number += 1
+            elif part_type in MBR_EXTENDED_TYPES:
+                next_lba = extended_start + start_lba
+        if next_lba is None or next_lba == ebr_lba:
+            break
+        ebr_lba = next_lba
+    return types
 
-    read_back_sha256 = calculate_sha256(read_back_file)
 
-    print(f"Original SHA256: {original_sha256}")
-    print(f"Read-back SHA256: {read_back_sha256}")
+def parse_gpt(fd, sector, head):
+    """Return {number: (type GUID, platform required bit)}, or None if invalid."""
+    header = head[sector:sector + 92]
+    if len(header) < 92 or header[:8] != GPT_SIGNATURE:
+        return None
 
-    if original_sha256 == read_back_sha256:
-        print(f"INFO: write check passed on {device_path}.")
+    header_size, header_crc = struct.unpack_from("<II", header, 12)
+    header = head[sector:sector + header_size]
+    if zlib.crc32(header[:16] + b"\0\0\0\0" + header[20:]) != header_crc:
+        return None
+
+    entries_lba, entry_count, entry_size, entries_crc = struct.unpack_from(
+        "<QIII", header, 72
+    )
+    entries_offset = entries_lba * sector
+    entries_length = entry_count * entry_size
+    if entries_offset + entries_length <= len(head):
+        entry_array = head[entries_offset:entries_offset + entries_length]
     else:
-        print(f"INFO: write check failed on {device_path}.")
-        print(
-            f"WARNING: Data integrity check failed for {device_path}. "
-            "Possible data corruption."
-        )
+        entry_array = os.pread(fd, entries_length, entries_offset)
+    if len(entry_array) < entries_length or zlib.crc32(entry_array) != entries_crc:
+        return None
+
+    partitions = {}
+    for index in range(entry_count):
+        entry = entry_array[index * entry_size:(index + 1) * entry_size]
+        if not any(entry[:16]):
+            continue
+        type_guid = str(uuid.UUID(bytes_le=entry[:16])).upper()
+        attributes = struct.unpack_from("<Q", entry, 48)[0]
+        partitions[index + 1] = (type_guid, attributes & 1)
+    return partitions
 
-    restore_backup(partition_label, backup_filename, used_blocks)
-    cleanup_files([hello_file, read_back_file, backup_filename])
+
+def read_partition_table(disk):
+    """Read the partition table of /dev/<disk> in-process.
+
+    Returns (table, partitions) with table MBR, GPT or RAW and partitions
+    mapping partition number to "0xNN" (MBR) or (type GUID, platform required
+    bit) (GPT). Returns None when the device cannot be read or its GPT is
+    damaged, so the caller can fall back to gdisk/fdisk/sgdisk.
+    """
+    sector = int(read_sysfs_attr(disk, "queue", "logical_block_size") or 512)
+    try:
+        fd = os.open(os.path.join(DEV_DIR, disk), os.O_RDONLY)
+    except OSError:
+        return None
+
+    try:
+        # LBA 0 (MBR), LBA 1 (GPT header) and normally the whole entry array.
+        head = os.pread(fd, 2 * sector + GPT_ENTRY_ARRAY_BYTES, 0)
+        if len(head) < 512 or head[510:512] != MBR_SIGNATURE:
+            return "RAW", {}
+
+        entries = parse_mbr_entries(head)
+        if any(part_type == MBR_PROTECTIVE_TYPE for _, part_type, _ in entries):
+            gpt_partitions = parse_gpt(fd, sector, head)
+            if gpt_partitions is None:
+                return None
+            return "GPT", gpt_partitions
+
+        types = {slot + 1: part_type for slot, part_type, _ in entries}
+        for _, part_type, start_lba in entries:
+            if part_type in MBR_EXTENDED_TYPES:
+                types.update(read_logical_partitions(fd, sector, start_lba))
+                break
+        return "MBR", {number: f"0x{part_type:X}" for number, part_type in types.items()}
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def partition_number(label):
+    """Return the partition number encoded at the end of a partition label."""
+    match = re.search(r"(\d+)$", label)
+    return int(match.group(1)) if match else None
 
 
 def get_partition_labels(disk):
@@ -229,6 +534,10 @@ def get_partition_labels(disk):
 
 def get_disks():
     """Return detected disk block devices."""
+    sysfs_disks = get_sysfs_disks()
+    if sysfs_disks is not None:
+        return sysfs_disks
+
     command_result = run_command(
         ["lsblk", "-e", "7", "-d", "-n", "-o", "NAME,TYPE"]
     )
@@ -254,30 +563,114 @@ def get_partition_table_type(disk):
     if "GPT: present" in command_result.stdout:
         return "GPT"
 
-    print(f"INFO: No valid partition table found for {disk}, treating as raw device.")
     return "RAW"
 
 
-def get_partition_count(disk):
-    """Return the number of partitions detected on the disk."""
-    return len(get_partition_labels(disk))
+def read_block(partition_label):
+    """Perform a block read test (first 1 MiB) for the given partition label."""
+    try:
+        with BlockDevice(os.path.join(DEV_DIR, partition_label)) as device:
+            device.read(0, READ_CHECK_BYTES)
+    except OSError:
+        return False
+    return True
+
+
+def timed_reads(device, block_size, next_offset, deadline):
+    """Read blocks from next_offset() until it returns None or the deadline passes.
+
+    Returns the latency of each read in seconds.
+    """
+    latencies = []
+    with mmap.mmap(-1, block_size) as buffer:
+        while time.monotonic() < deadline:
+            offset = next_offset()
+            if offset is None:
+                break
+            start = time.perf_counter()
+            if device.readinto(buffer, offset) != block_size:
+                raise OSError(errno.EIO, f"short read at offset {offset}")
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def percentile(sorted_values, percent):
+    """Return the nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[rank - 1]
+
+
+def benchmark_pattern(device, device_path, pattern, seconds, queue_depth):
+    """Run one access pattern with queue_depth reads in flight and log the results."""
+    block_size = BENCH_SEQUENTIAL_BLOCK_BYTES if pattern == "sequential" else BENCH_RANDOM_BLOCK_BYTES
+    blocks = device.size() // block_size
+    if blocks == 0:
+        print(f"WARNING: Read benchmark {pattern} on {device_path} failed: device is too small")
+        return
 
+    if pattern == "sequential":
+        # itertools.count is safe to advance from several threads.
+        block_numbers = itertools.count()
 
-def read_block(partition_label):
-    """Perform a block read test for the given partition label."""
-    command_result = run_command(["dd", f"if=/dev/{partition_label}",
-                                  "of=/dev/null", "bs=1M", "count=1"])
-    return command_result.returncode == 0
+        def next_offset():
+            block = next(block_numbers)
+            return block * block_size if block < blocks else None
+    else:
+        def next_offset():
+            return random.randrange(blocks) * block_size
+
+    deadline = time.monotonic() + seconds
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=queue_depth) as pool:
+        workers = [
+            pool.submit(timed_reads, device, block_size, next_offset, deadline)
+            for _ in range(queue_depth)
+        ]
+        latencies = sorted(latency for worker in workers for latency in worker.result())
+    elapsed = time.monotonic() - start
+
+    if not latencies:
+        print(f"WARNING: Read benchmark {pattern} on {device_path} failed: no reads completed")
+        return
 
+    reads = len(latencies)
+    latency_ms = " ".join(
+        f"p{percent} {percentile(latencies, percent) * 1000:.3f}"
+        for percent in BENCH_PERCENTILES
+    )
+    print(
+        f"INFO: Read benchmark {pattern} on {device_path}: "
+        f"{block_size // 1024} KiB blocks, queue depth {queue_depth}, "
+        f"{reads} reads in {elapsed:.2f} s, "
+        f"{reads * block_size / elapsed / 1e6:.2f} MB/s, {reads / elapsed:.1f} IOPS, "
+        f"latency ms {latency_ms} max {latencies[-1] * 1000:.3f}"
+    )
+
+
+def benchmark_reads(partition_label, seconds, queue_depth):
+    """Log sequential and random read throughput, IOPS and latency for a device."""
+    device_path = f"/dev/{partition_label}"
+    try:
+        with BlockDevice(os.path.join(DEV_DIR, partition_label)) as device:
+            for pattern in ("sequential", "random"):
+                try:
+                    benchmark_pattern(device, device_path, pattern, seconds, queue_depth)
+                except OSError as error:
+                    print(f"WARNING: Read benchmark {pattern} on {device_path} failed: {error}")
+    except OSError as error:
+        print(f"WARNING: Read benchmark on {device_path} failed: {error}")
 
-def process_raw_device(disk):
+
+def process_raw_device(disk, read_ok, samples=1, bench=None):
     """Process a raw block device with no partition table."""
     print(f"INFO: No partitions detected for {disk}, treating as raw device.")
 
     print(f"INFO: Performing block read on /dev/{disk}")
-    if read_block(disk):
+    if read_ok:
         print(f"INFO: Block read on /dev/{disk} successful")
-        perform_write_check(disk, "", {})
+        perform_write_check(disk, "", {}, samples)
+        if bench:
+            benchmark_reads(disk, bench.seconds, bench.queue_depth)
     else:
         print(f"INFO: Block read on /dev/{disk} failed")
 
@@ -324,22 +717,15 @@ def print_precious_partition_info(partition_label, partition_id, precious_parts)
             break
 
 
-def process_mbr_disk(disk, partition_labels, num_parts):
+def process_mbr_disk(scan, samples=1, bench=None):
     """Process all MBR partitions on a disk."""
-    mbr_part_ids = parse_mbr_partition_ids(disk)
-
-    if len(mbr_part_ids) < num_parts:
+    if len(scan.partitions) < scan.num_parts:
         print(
             "WARNING: Could not parse enough MBR partition IDs. "
-            f"Found {len(mbr_part_ids)}, expected {num_parts}."
+            f"Found {len(scan.partitions)}, expected {scan.num_parts}."
         )
 
-    process_count = min(len(partition_labels), len(mbr_part_ids), num_parts)
-
-    for index in range(process_count):
-        partition_label = partition_labels[index]
-        partition_id = mbr_part_ids[index]
-
+    for partition_label, partition_id, _ in scan.partitions:
         print(f"\nINFO: Partition : /dev/{partition_label} Partition type : {partition_id}")
 
         if partition_id in PRECIOUS_PARTS_MBR.values():
@@ -355,12 +741,14 @@ def process_mbr_disk(disk, partition_labels, num_parts):
             f"mbr_part_id = {partition_id}"
         )
 
-        if read_block(partition_label):
+        if scan.reads[partition_label]:
             print(
                 f"INFO: Block read on /dev/{partition_label} "
                 f"mbr_part_id = {partition_id} successful"
             )
-            perform_write_check(partition_label, partition_id, PRECIOUS_PARTS_MBR)
+            perform_write_check(partition_label, partition_id, PRECIOUS_PARTS_MBR, samples)
+            if bench:
+                benchmark_reads(partition_label, bench.seconds, bench.queue_depth)
         else:
             print(
                 f"INFO: Block read on /dev/{partition_label} "
@@ -393,16 +781,9 @@ def parse_gpt_partition_info(disk, partition_index):
     return partition_guid_code, platform_required_bit
 
 
-def process_gpt_disk(disk, partition_labels, num_parts):
+def process_gpt_disk(scan, samples=1, bench=None):
     """Process all GPT partitions on a disk."""
-    process_count = min(len(partition_labels), num_parts)
-
-    for index in range(process_count):
-        partition_label = partition_labels[index]
-        partition_guid_code, platform_required_bit = parse_gpt_partition_info(
-            disk, index
-        )
-
+    for partition_label, partition_guid_code, platform_required_bit in scan.partitions:
         if not partition_guid_code:
             print(f"INFO: Unable to parse sgdisk info for {partition_label}. Skipping.")
             continue
@@ -433,7 +814,7 @@ def process_gpt_disk(disk, partition_labels, num_parts):
             f"part_guid = {partition_guid_code}"
         )
 
-        if read_block(partition_label):
+        if scan.reads[partition_label]:
             print(
                 f"INFO: Block read on /dev/{partition_label} "
                 f"part_guid = {partition_guid_code} successful"
@@ -442,7 +823,10 @@ def process_gpt_disk(disk, partition_labels, num_parts):
                 partition_label,
                 partition_guid_code,
                 PRECIOUS_PARTS_GPT,
+                samples,
             )
+            if bench:
+                benchmark_reads(partition_label, bench.seconds, bench.queue_depth)
         else:
             print(
                 f"INFO: Block read on /dev/{partition_label} "
@@ -452,6 +836,93 @@ def process_gpt_disk(disk, partition_labels, num_parts):
     print(SEPARATOR)
 
 
+def should_read_partition(table, partition):
+    """Return True if the partition gets a block read (not precious/required)."""
+    if table == "MBR":
+        return partition.type_id not in PRECIOUS_PARTS_MBR.values()
+    return (
+        bool(partition.type_id)
+        and partition.platform_required != 1
+        and partition.type_id not in PRECIOUS_PARTS_GPT.values()
+    )
+
+
+class DiskScan:
+    """Partition layout and block-read results for one disk.
+
+    Built by scan_disk() without printing, so disks can be scanned on worker
+    threads and reported afterwards in order.
+    """
+
+    def __init__(self, disk):
+        self.disk = disk
+        self.table = "RAW"
+        self.num_parts = 0
+        self.partitions = []
+        self.reads = {}
+
+
+def scan_disk(disk):
+    """Detect the partition table and partitions of a disk and run its block reads."""
+    scan = DiskScan(disk)
+    sysfs_partitions = get_sysfs_partitions(disk)
+    if sysfs_partitions is None:
+        labels = get_partition_labels(disk)
+        numbered = [(partition_number(label), label) for label in labels]
+    else:
+        numbered = sysfs_partitions
+    scan.num_parts = len(numbered)
+
+    # Without sysfs the sector size is unknown; let the tools read the table.
+    layout = read_partition_table(disk) if sysfs_partitions is not None else None
+    if layout is None:
+        scan.table = get_partition_table_type(disk)
+    else:
+        scan.table, entries = layout
+
+    if scan.table == "RAW" or scan.num_parts == 0:
+        scan.reads[disk] = read_block(disk)
+        return scan
+
+    if scan.table == "MBR":
+        if layout is None:
+            mbr_part_ids = parse_mbr_partition_ids(disk)
+            scan.partitions = [
+                Partition(label, part_id, 0)
+                for (_, label), part_id in zip(numbered, mbr_part_ids)
+            ]
+        else:
+            scan.partitions = [
+                Partition(label, entries[number], 0)
+                for number, label in numbered if number in entries
+            ]
+    else:
+        for index, (number, label) in enumerate(numbered):
+            if layout is None:
+                guid_code, required_bit = parse_gpt_partition_info(disk, index)
+            else:
+                guid_code, required_bit = entries.get(number, (None, None))
+            scan.partitions.append(Partition(label, guid_code, required_bit))
+
+    for partition in scan.partitions:
+        if should_read_partition(scan.table, partition):
+            scan.reads[partition.label] = read_block(partition.label)
+    return scan
+
+
+def scan_disks(disks):
+    """Scan all MTD/RAM-free disks concurrently; return {disk: DiskScan}."""
+    targets = [
+        disk for disk in disks
+        if not is_mtd_block_device(disk) and not is_ram_disk(disk)
+    ]
+    if not targets:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(targets))) as pool:
+        return dict(zip(targets, pool.map(scan_disk, targets)))
+
+
 def print_detected_disks(disks):
     """Print detected block devices."""
     print(SEPARATOR)
@@ -465,8 +936,8 @@ def print_detected_disks(disks):
     print(SEPARATOR)
 
 
-def process_disk(disk):
-    """Process a single disk block device."""
+def process_disk(disk, scan=None, samples=1, bench=None):
+    """Report a single disk block device, scanning it first if needed."""
     if is_mtd_block_device(disk):
         print(f"INFO: Skipping MTD block device /dev/{disk}")
         return
@@ -475,50 +946,83 @@ def process_disk(disk):
         print(f"INFO: Skipping RAM disk /dev/{disk}")
         return
 
-    print(f"INFO: Block device : /dev/{disk}")
+    if scan is None:
+        scan = scan_disk(disk)
 
-    partition_table = get_partition_table_type(disk)
-    print(f"INFO: Partition table type : {partition_table}\n")
+    print(f"INFO: Block device : /dev/{disk}")
 
-    num_parts = get_partition_count(disk)
+    if scan.table == "RAW":
+        print(f"INFO: No valid partition table found for {disk}, treating as raw device.")
+    print(f"INFO: Partition table type : {scan.table}\n")
 
-    if partition_table == "RAW" or num_parts == 0:
-        process_raw_device(disk)
+    if scan.table == "RAW" or scan.num_parts == 0:
+        process_raw_device(disk, scan.reads[disk], samples, bench)
         return
 
-    partition_labels = get_partition_labels(disk)
-
-    if len(partition_labels) < num_parts:
-        print(
-            "WARNING: Mismatch in partition count. "
-            f"Found {len(partition_labels)} partition labels, "
-            f"but lsblk reported {num_parts} partitions for {disk}. "
-            "Proceeding with the ones we have..."
-        )
-
-    if partition_table == "MBR":
-        process_mbr_disk(disk, partition_labels, num_parts)
-    elif partition_table == "GPT":
-        process_gpt_disk(disk, partition_labels, num_parts)
+    if scan.table == "MBR":
+        process_mbr_disk(scan, samples, bench)
+    elif scan.table == "GPT":
+        process_gpt_disk(scan, samples, bench)
     else:
         print(
             "INFO: Invalid partition table, expected MBR or GPT "
-            f"reported type = {partition_table}"
+            f"reported type = {scan.table}"
         )
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Read-check block devices and optionally write-check free blocks."
+    )
+    parser.add_argument(
+        "--write-samples",
+        type=int,
+        default=1,
+        help="Blocks to write-check per partition, spread over its free space (default: 1)",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Also benchmark sequential and random reads on each read-checked device",
+    )
+    parser.add_argument(
+        "--bench-seconds",
+        type=float,
+        default=5.0,
+        help="Duration of each benchmark access pattern in seconds (default: 5)",
+    )
+    parser.add_argument(
+        "--bench-queue-depth",
+        type=int,
+        default=4,
+        help="Benchmark reads kept in flight, one thread each (default: 4)",
+    )
+    args = parser.parse_args(argv)
+    if args.write_samples < 1:
+        parser.error("--write-samples must be at least 1")
+    if args.bench_seconds <= 0 or args.bench_queue_depth < 1:
+        parser.error("--bench-seconds must be positive and --bench-queue-depth at least 1")
+    return args
+
+
+def main(write_samples=1, bench=None):
     """Main entry point."""
     disks = get_disks()
     print_detected_disks(disks)
 
+    scans = scan_disks(disks)
     for disk in disks:
-        process_disk(disk)
+        process_disk(disk, scans.get(disk), write_samples, bench)
 
 
 if __name__ == "__main__":
+    cli_args = parse_args()
+    cli_bench = None
+    if cli_args.benchmark:
+        cli_bench = ReadBenchmark(cli_args.bench_seconds, cli_args.bench_queue_depth)
     try:
-        main()
+        main(cli_args.write_samples, cli_bench)
     except (OSError, ValueError, subprocess.SubprocessError) as error:
         print(f"Error occurred: {error}")
         sys.exit(1)
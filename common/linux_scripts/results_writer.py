@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Flush step results to the results partition and journal completed steps."""
+
+import argparse
+import errno
+import json
+import os
+import sys
+import time
+
+PHASE_END = "phase-complete"
+
+
+def fsync_path(path):
+    """fsync one file or directory; filesystems without directory fsync are skipped."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        # FAT and some FUSE mounts reject fsync on a directory handle
+        if e.errno not in (errno.EINVAL, errno.EBADF, errno.EROFS):
+            raise
+    finally:
+        os.close(fd)
+    return True
+
+
+def sync_paths(paths):
+    """fsync the given logs, everything below given directories, and their parents."""
+    synced = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for top, _, files in os.walk(path):
+                for name in files:
+                    fsync_path(os.path.join(top, name))
+                fsync_path(top)
+                synced.add(top)
+        elif fsync_path(path):
+            synced.add(path)
+        parent = os.path.dirname(os.path.abspath(path))
+        if parent not in synced:
+            fsync_path(parent)
+            synced.add(parent)
+    return synced
+
+
+def settle(seconds):
+    """Optional pause after a step, for media that needs it; zero by default."""
+    if seconds and seconds > 0:
+        time.sleep(seconds)
+
+
+class StepJournal:
+    """Append-only record of completed steps, one JSON object per line.
+
+    Each record is fsynced before the step is treated as done, and a torn
+    last line left by a power loss is ignored when the journal is read back.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def entries(self):
+        entries = []
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and "step" in entry:
+                        entries.append(entry)
+        except OSError:
+            pass
+        return entries
+
+    def completed(self):
+        return [entry["step"] for entry in self.entries() if entry.get("status") == "done"]
+
+    def start(self):
+        """Return the steps to skip: none for a fresh run, the finished ones on resume."""
+        entries = self.entries()
+        if not entries or entries[-1]["step"] == PHASE_END:
+            self.reset()
+            return []
+        return self.completed()
+
+    def reset(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w"):
+            pass
+        sync_paths([self.path])
+
+    def record(self, step, status="done", **info):
+        entry = {"step": step, "status": status, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        entry.update(info)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        fsync_path(os.path.dirname(os.path.abspath(self.path)))
+        return entry
+
+    def finish(self):
+        return self.record(PHASE_END)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Flush results and journal completed steps")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sync = sub.add_parser("sync", help="fsync logs or result directories")
+    sync.add_argument("paths", nargs="+")
+    sync.add_argument("--settle", type=float, default=0,
+                      help="Seconds to pause after syncing (default: %(default)s)")
+
+    pause = sub.add_parser("settle", help="Sleep for the configured settle time")
+    pause.add_argument("seconds", type=float)
+
+    journal = sub.add_parser("journal", help="Query or update the step journal")
+    journal.add_argument("--file", required=True, help="Journal file on the results partition")
+    action = journal.add_subparsers(dest="action", required=True)
+    action.add_parser("start", help="Begin or resume a run; print finished steps for the shell")
+    action.add_parser("finish", help="Mark the whole run complete")
+    record = action.add_parser("record", help="Mark a step finished")
+    record.add_argument("step")
+    record.add_argument("--status", default="done")
+    record.add_argument("--sync", nargs="*", default=[], metavar="PATH",
+                        help="Logs or directories written by the step, fsynced first")
+    record.add_argument("--settle", type=float, default=0,
+                        help="Seconds to pause after recording (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    if args.command == "sync":
+        sync_paths(args.paths)
+        settle(args.settle)
+    elif args.command == "settle":
+        settle(args.seconds)
+    elif args.action == "start":
+        done = StepJournal(args.file).start()
+        # sourceable, matched in init.sh with case "$completed_steps" in *" step "*
+        print(f"completed_steps=' {' '.join(done)} '")
+    elif args.action == "finish":
+        StepJournal(args.file).finish()
+    else:
+        sync_paths(args.sync)
+        StepJournal(args.file).record(args.step, args.status)
+        settle(args.settle)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
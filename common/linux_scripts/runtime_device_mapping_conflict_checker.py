@@ -23,7 +23,10 @@ regions do not conflict with UEFI runtime memory map as per EBBR 2.2.0 specifica
 The validator:
 1. Parses UEFI runtime memory segments (RT_Code, RT_Data, MMIO, MMIO_Port)
    from the UEFI memory map log
-2. Parses the Linux device tree and extracts MMIO register regions
+2. Parses the Linux device tree and extracts MMIO register regions. The
+   tree is read from, in order: the --dtb or --dts argument; the flattened
+   blob firmware passed to Linux (/sys/firmware/fdt); the dtc-decompiled
+   DTS that init.sh writes to linux_tools/device_tree.dts
 3. Performs address translation through device tree "ranges" properties
    to convert device tree addresses to physical addresses
 4. Detects any overlaps between UEFI runtime regions and DTS MMIO ranges
@@ -35,14 +38,23 @@ exclusive access to runtime regions without interference from OS drivers.
 
 from __future__ import annotations
 
+import argparse
+import heapq
+import mmap
 import re
-from dataclasses import dataclass
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 PAGE_SIZE = 4096
 
 DTS_PATH = Path("/mnt/acs_results_template/acs_results/linux_tools/device_tree.dts")
+# Flattened device tree blob passed by firmware; without --dts/--dtb it is
+# preferred over DTS_PATH when readable since it needs neither dtc nor a
+# text parse.
+DTB_PATH = Path("/sys/firmware/fdt")
 MEMMAP_PATH = Path("/mnt/acs_results_template/acs_results/uefi_dump/memmap.log")
 OUT_LOG_PATH = Path("/mnt/acs_results_template/acs_results/linux_tools/runtime_device_mapping_conflict_test.log")
 
@@ -58,13 +70,36 @@ class MemSeg:
     size: int
     attributes: int
 
+# DTS text nodes hold property values as source text; FDT nodes hold the raw
+# big-endian property bytes. Use prop_cells()/prop_strings()/prop_text().
+PropValue = Union[str, bytes]
+
 @dataclass
 class Node:
     name: str
     path: str
     parent: Optional["Node"]
-    props: Dict[str, str]
+    props: Dict[str, PropValue]
     children: List["Node"]
+    # Filled in lazily by bus_translation() for nodes that act as a bus.
+    xlate: Optional["BusTranslation"] = field(default=None, repr=False, compare=False)
+
+@dataclass(frozen=True)
+class BusTranslation:
+    """Composed child->root address mapping of one bus node.
+
+    segments are disjoint, sorted (start, end, delta, fail_note) tuples over
+    the bus's child address space: the root address is addr + delta, or the
+    translation fails with fail_note when delta is None. Addresses outside
+    every segment fail with gap_note. note is the success note for the whole
+    walk up to the root.
+    """
+    addr_cells: int
+    size_cells: int
+    starts: List[int]
+    segments: List[Tuple[int, int, Optional[int], str]]
+    gap_note: str
+    note: str
 
 @dataclass(frozen=True)
 class DtsRange:
@@ -126,7 +161,7 @@ def overlaps(a_start: int, a_end: int, b_start: int, b_end: int) -> bool:
 
 def node_is_disabled(node: Node) -> bool:
     """Check if a node has status='disabled' property."""
-    v = node.props.get("status", "")
+    v = prop_text(node, "status")
     return "disabled" in v.lower()
 
 def is_disabled_in_ancestry(node: Node) -> bool:
@@ -241,17 +276,41 @@ def parse_reg_names(prop: str) -> List[str]:
 
     Handles quoted strings and null-separated values as used in DTS.
     Example: reg-names = "fspi_base\0fspi_mmap"; → ["fspi_base", "fspi_mmap"]
+    Example: reg-names = "fspi_base", "fspi_mmap"; → ["fspi_base", "fspi_mmap"]
     """
-    # Extract quoted strings and split on \0 (DTS uses \0 inside string literals)
-    # Example: reg-names = "fspi_base\0fspi_mmap";
+    # Extract quoted strings and split each on \0 (DTS uses \0 inside string literals)
     if not prop:
         return []
     m = re.findall(r'"([^"]*)"', prop)
-    if not m:
+    return [s for quoted in m for s in quoted.split("\\0") if s != ""]
+
+def prop_cells(node: Node, key: str) -> List[int]:
+    """Return a property as a list of u32 cells (empty if missing)."""
+    v = node.props.get(key)
+    if v is None:
+        return []
+    if isinstance(v, bytes):
+        return list(struct.unpack(f">{len(v) // 4}I", v[: len(v) - len(v) % 4]))
+    return extract_cells_from_angle_list(v)
+
+def prop_strings(node: Node, key: str) -> List[str]:
+    """Return a string-list property (e.g. reg-names) as a list of strings."""
+    v = node.props.get(key)
+    if not v:
         return []
-    joined = "".join(m)
-    return [s for s in joined.split("\\0") if s != ""]
+    if isinstance(v, bytes):
+        return [s.decode("utf-8", errors="replace") for s in v.split(b"\0") if s]
+    return parse_reg_names(v)
+
+def prop_text(node: Node, key: str) -> str:
+    """Return a property as DTS-style text for substring checks.
 
+    FDT string lists are rendered the way dtc prints them ("a", "b").
+    """
+    v = node.props.get(key, "")
+    if isinstance(v, bytes):
+        return ", ".join(f'"{s}"' for s in prop_strings(node, key))
+    return v
 
 def join_u32_cells(cells: List[int]) -> int:
     """Combine multiple 32-bit cell values into single address/value.
@@ -444,16 +503,132 @@ def iter_nodes(root: Node) -> List[Node]:
     return out
 
 
+# ============================================================================
+# SECTION: DTB Parsing - Flattened Device Tree Structure Block
+# ============================================================================
+
+FDT_MAGIC = 0xD00DFEED
+FDT_BEGIN_NODE = 0x1
+FDT_END_NODE = 0x2
+FDT_PROP = 0x3
+FDT_NOP = 0x4
+FDT_END = 0x9
+
+_FDT_HEADER = struct.Struct(">10I")
+_FDT_U32 = struct.Struct(">I")
+_FDT_PROP_HDR = struct.Struct(">II")
+
+def is_fdt_blob(head: bytes) -> bool:
+    """Check whether data starts with the FDT header magic."""
+    return len(head) >= 4 and _FDT_U32.unpack_from(head, 0)[0] == FDT_MAGIC
+
+def parse_fdt(blob: Union[bytes, mmap.mmap]) -> Node:
+    """
+    Parse a flattened device tree blob into the same Node tree as parse_dts_tree().
+
+    Walks the structure block token by token. Property values are kept as the
+    raw big-endian bytes, so reg/ranges/#*-cells are decoded straight into
+    integers by prop_cells() with no text round-trip.
+
+    Args:
+        blob: DTB contents (bytes or a read-only mmap).
+
+    Returns:
+        Node: Root node of the device tree.
+
+    Raises:
+        ValueError: If the blob is not a well-formed FDT.
+    """
+    if len(blob) < _FDT_HEADER.size or not is_fdt_blob(blob[:4]):
+        raise ValueError("not a flattened device tree (bad magic)")
+    (_magic, totalsize, off_struct, off_strings, _off_rsvmap,
+     version, _last_comp, _boot_cpu, size_strings, size_struct) = _FDT_HEADER.unpack_from(blob, 0)
+    if totalsize > len(blob) or off_struct >= totalsize or off_strings > totalsize:
+        raise ValueError("truncated flattened device tree")
+    # size_dt_struct only exists from version 17 on.
+    struct_end = off_struct + size_struct if version >= 17 else totalsize
+    strings_end = off_strings + size_strings
+
+    names: Dict[int, str] = {}
+
+    def prop_name(nameoff: int) -> str:
+        name = names.get(nameoff)
+        if name is None:
+            start = off_strings + nameoff
+            end = blob.find(b"\0", start, strings_end)
+            if end < 0:
+                raise ValueError(f"unterminated property name at string offset {nameoff}")
+            name = blob[start:end].decode("ascii", errors="replace")
+            names[nameoff] = name
+        return name
+
+    root: Optional[Node] = None
+    stack: List[Node] = []
+    off = off_struct
+    while off + 4 <= struct_end:
+        token = _FDT_U32.unpack_from(blob, off)[0]
+        off += 4
+        if token == FDT_BEGIN_NODE:
+            end = blob.find(b"\0", off, struct_end)
+            if end < 0:
+                raise ValueError("unterminated node name")
+            name = blob[off:end].decode("ascii", errors="replace")
+            off = (end + 4) & ~3
+            if not stack:
+                root = Node(name="/", path="/", parent=None, props={}, children=[])
+                stack.append(root)
+                continue
+            parent = stack[-1]
+            path = (parent.path.rstrip("/") + "/" + name).replace("//", "/")
+            node = Node(name=name, path=path, parent=parent, props={}, children=[])
+            parent.children.append(node)
+            stack.append(node)
+        elif token == FDT_PROP:
+            length, nameoff = _FDT_PROP_HDR.unpack_from(blob, off)
+            off += _FDT_PROP_HDR.size
+            if not stack or off + length > struct_end:
+                raise ValueError("property outside of a node")
+            stack[-1].props[prop_name(nameoff)] = bytes(blob[off:off + length])
+            off = (off + length + 3) & ~3
+        elif token == FDT_END_NODE:
+            if not stack:
+                raise ValueError("unbalanced FDT_END_NODE")
+            stack.pop()
+        elif token == FDT_NOP:
+            continue
+        elif token == FDT_END:
+            break
+        else:
+            raise ValueError(f"unknown FDT token 0x{token:x} at offset 0x{off - 4:x}")
+
+    if root is None:
+        raise ValueError("flattened device tree has no root node")
+    return root
+
+def load_device_tree(path: Path) -> Node:
+    """Load a device tree from a DTB (mmap'd) or, failing the magic check, DTS text."""
+    with path.open("rb") as fh:
+        if not is_fdt_blob(fh.read(4)):
+            return parse_dts_tree(read_text_smart(path))
+        fh.seek(0)
+        try:
+            blob = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # sysfs binary attributes such as /sys/firmware/fdt cannot be mmap'd.
+            return parse_fdt(fh.read())
+        with blob:
+            return parse_fdt(blob)
+
+
 # ============================================================================
 # SECTION: Address Translation - Cell Properties & Ranges Parsing
 # ============================================================================
 
 def get_prop_int(node: Node, key: str) -> Optional[int]:
     """Extract single integer value from device tree property."""
-    v = node.props.get(key)
-    if v is None:
+    if key not in node.props:
         return None
-    cells = extract_cells_from_angle_list(v)
+    cells = prop_cells(node, key)
     return cells[0] if cells else None
 
 def inherited_cells(node: Node, key: str, root_default: int) -> int:
@@ -494,10 +669,10 @@ def get_bus_ranges(bus: Node) -> Tuple[bool, List[Tuple[int, int, int]]]:
         return (False, [])
 
     val = bus.props.get("ranges", "")
-    if val.strip() == "":
+    if not val or (isinstance(val, str) and val.strip() == ""):
         return (True, [])  # explicit identity
 
-    cells = extract_cells_from_angle_list(val)
+    cells = prop_cells(bus, "ranges")
     if not cells:
         return (True, [])
 
@@ -521,14 +696,121 @@ def get_bus_ranges(bus: Node) -> Tuple[bool, List[Tuple[int, int, int]]]:
 
     return (True, maps)
 
+# Upper bound of any DT address (4 address cells) plus room for offsets.
+_ADDR_LIMIT = (1 << 160) - 1
+
+def _first_match_windows(maps: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """Split possibly overlapping ranges windows into disjoint (start, end, delta).
+
+    A child address uses the first window (in property order) containing it,
+    as in a linear scan of the ranges entries.
+    """
+    windows = [(c_base, c_base + sz - 1, p_base - c_base) for c_base, p_base, sz in maps]
+    bounds = sorted({w[0] for w in windows} | {w[1] + 1 for w in windows})
+    pieces: List[Tuple[int, int, int]] = []
+    for lo, nxt in zip(bounds, bounds[1:]):
+        hi = nxt - 1
+        for w_start, w_end, delta in windows:
+            if w_start <= lo and hi <= w_end:
+                if pieces and pieces[-1][1] + 1 == lo and pieces[-1][2] == delta:
+                    pieces[-1] = (pieces[-1][0], hi, delta)
+                else:
+                    pieces.append((lo, hi, delta))
+                break
+    return pieces
+
+def _compose_segments(
+    pieces: List[Tuple[int, int, int]], parent: BusTranslation
+) -> List[Tuple[int, int, Optional[int], str]]:
+    """Chain this bus's windows through the parent's composed segments."""
+    out: List[Tuple[int, int, Optional[int], str]] = []
+    segs = parent.segments
+    for lo, hi, delta in pieces:
+        cur, end = lo + delta, hi + delta
+        i = max(bisect_right(parent.starts, cur) - 1, 0)
+        while cur <= end:
+            while i < len(segs) and segs[i][1] < cur:
+                i += 1
+            if i < len(segs) and segs[i][0] <= cur:
+                upto = min(segs[i][1], end)
+                p_delta = segs[i][2]
+                seg = (cur - delta, upto - delta, None if p_delta is None else p_delta + delta, segs[i][3])
+            else:
+                upto = min(end, segs[i][0] - 1) if i < len(segs) else end
+                seg = (cur - delta, upto - delta, None, parent.gap_note)
+            if out and out[-1][1] + 1 == seg[0] and out[-1][2:] == seg[2:]:
+                out[-1] = (out[-1][0], seg[1], seg[2], seg[3])
+            else:
+                out.append(seg)
+            cur = upto + 1
+    return out
+
+def _inherit_cells(node: Node, key: str, inherited: int) -> int:
+    v = get_prop_int(node, key)
+    return v if v is not None and 0 <= v <= 4 else inherited
+
+def bus_translation(bus: Node) -> BusTranslation:
+    """Return the cached composed translation table of a bus node.
+
+    Built once per bus from its own "ranges" and its parent's table, so each
+    ancestor's ranges and cell counts are parsed only once per tree. Tables
+    are stored on Node.xlate; a tree must not be edited after translation.
+    """
+    chain: List[Node] = []
+    cur: Optional[Node] = bus
+    while cur is not None and cur.xlate is None:
+        chain.append(cur)
+        cur = cur.parent
+
+    for node in reversed(chain):
+        parent = node.parent
+        if parent is None:
+            node.xlate = BusTranslation(
+                addr_cells=_inherit_cells(node, "#address-cells", 2),
+                size_cells=_inherit_cells(node, "#size-cells", 2),
+                starts=[0],
+                segments=[(0, _ADDR_LIMIT, 0, "")],
+                gap_note="",
+                note="",
+            )
+            continue
+
+        pt = parent.xlate
+        assert pt is not None
+        ac = _inherit_cells(node, "#address-cells", pt.addr_cells)
+        sc = _inherit_cells(node, "#size-cells", pt.size_cells)
+        present, maps = get_bus_ranges(node)
+        if not maps:
+            own = f"{node.path}:ranges-missing->identity" if not present else f"{node.path}:identity"
+            starts, segments, gap_note = pt.starts, pt.segments, pt.gap_note
+        else:
+            own = f"{node.path}:mapped"
+            segments = _compose_segments(_first_match_windows(maps), pt)
+            starts = [seg[0] for seg in segments]
+            gap_note = f"{node.path}:no-range-match"
+        node.xlate = BusTranslation(
+            addr_cells=ac,
+            size_cells=sc,
+            starts=starts,
+            segments=segments,
+            gap_note=gap_note,
+            note=",".join(n for n in (own, pt.note) if n),
+        )
+
+    assert bus.xlate is not None
+    return bus.xlate
+
 def translate_up_to_root(addr: int, parent_bus: Node) -> Tuple[Optional[int], str]:
     """Translate device tree address to physical (root) address via ranges.
 
-    Walks up the device tree hierarchy applying 'ranges' translations at each
-    level until reaching the root node. Implements strict validation:
+    Applies the 'ranges' translations of every bus up to the root node with
+    strict validation:
       - If ranges present and non-empty => address must match a window
       - If ranges missing or empty => identity (pass-through) translation
 
+    The walk is precomputed per bus by bus_translation(), so a lookup is a
+    single binary search over the composed windows.
+
     Args:
         addr (int): Device tree address to translate
         parent_bus (Node): Node whose parent bus will be traversed
@@ -537,42 +819,14 @@ def translate_up_to_root(addr: int, parent_bus: Node) -> Tuple[Optional[int], st
         (phys_addr, notes): tuple of translated physical address (or None on error)
                            and comma-separated translation notes for debugging
     """
-    cur_addr = addr
-    bus = parent_bus
-    notes: List[str] = []
-
-    while bus is not None:
-        if bus.parent is None:
-            # Root node - no further translation needed
-            break
-
-        present, maps = get_bus_ranges(bus)
-
-        if not present:
-            notes.append(f"{bus.path}:ranges-missing->identity")
-            bus = bus.parent
-            continue
-
-        if not maps:
-            notes.append(f"{bus.path}:identity")
-            bus = bus.parent
-            continue
-
-        mapped = False
-        for c_base, p_base, sz in maps:
-            # Include the end address (c_base + sz - 1) for inclusive range check
-            if c_base <= cur_addr <= (c_base + sz - 1):
-                cur_addr = p_base + (cur_addr - c_base)
-                notes.append(f"{bus.path}:mapped")
-                mapped = True
-                break
-
-        if not mapped:
-            return (None, f"{bus.path}:no-range-match")
-
-        bus = bus.parent
-
-    return (cur_addr, ",".join(notes) if notes else "no-translation-needed")
+    table = bus_translation(parent_bus)
+    i = bisect_right(table.starts, addr) - 1
+    if i < 0 or addr > table.segments[i][1]:
+        return (None, table.gap_note)
+    _start, _end, delta, fail_note = table.segments[i]
+    if delta is None:
+        return (None, fail_note)
+    return (addr + delta, table.note or "no-translation-needed")
 
 
 # ============================================================================
@@ -589,7 +843,7 @@ def is_memory_like(node: Node) -> bool:
         return True
     if "/reserved-memory" in node.path:
         return True
-    dev_type = node.props.get("device_type", "")
+    dev_type = prop_text(node, "device_type")
     return ("\"memory\"" in dev_type) or ("'memory'" in dev_type)
 
 def is_storage_like(node: Node) -> bool:
@@ -598,7 +852,7 @@ def is_storage_like(node: Node) -> bool:
     These nodes describe storage layout, not MMIO register blocks, and
     should be excluded from runtime conflict checks.
     """
-    comp = node.props.get("compatible", "")
+    comp = prop_text(node, "compatible")
     if "fixed-partitions" in comp:
         return True
     if "jedec,spi-nor" in comp or "spi-nor" in comp:
@@ -640,12 +894,13 @@ def extract_dts_mmio_ranges(root: Node) -> List[DtsRange]:
             continue
 
         parent_bus = n.parent if n.parent is not None else root
-        ac = addr_cells(parent_bus)
-        sc = size_cells(parent_bus)
+        bus = bus_translation(parent_bus)
+        ac = bus.addr_cells
+        sc = bus.size_cells
         t = ac + sc
 
-        reg_cells = extract_cells_from_angle_list(n.props.get("reg", ""))
-        reg_names = parse_reg_names(n.props.get("reg-names", ""))
+        reg_cells = prop_cells(n, "reg")
+        reg_names = prop_strings(n, "reg-names")
         if not reg_cells or len(reg_cells) < t:
             continue
 
@@ -667,12 +922,11 @@ def extract_dts_mmio_ranges(root: Node) -> List[DtsRange]:
             # parent bus has no ranges (identity translation), treat child_addr as offset
             # when it fits inside the parent's reg size.
             if phys == child_addr and ("ranges-missing->identity" in note or ":identity" in note):
-                preg = parent_bus.props.get("reg", "")
-                preg_cells = extract_cells_from_angle_list(preg)
+                preg_cells = prop_cells(parent_bus, "reg")
                 # Parent "reg" is expressed in the address space of parent_bus.parent
                 reg_bus = parent_bus.parent
-                pac = addr_cells(reg_bus) if reg_bus is not None else 2
-                psc = size_cells(reg_bus) if reg_bus is not None else 1
+                pac = bus_translation(reg_bus).addr_cells if reg_bus is not None else 2
+                psc = bus_translation(reg_bus).size_cells if reg_bus is not None else 1
                 pt = pac + psc
                 if preg_cells and len(preg_cells) >= pt:
                     p_child_base = join_u32_cells(preg_cells[0:pac])
@@ -699,11 +953,111 @@ def extract_dts_mmio_ranges(root: Node) -> List[DtsRange]:
     return sorted(uniq.values(), key=lambda x: (x.base, x.size, x.node_path))
 
 
+# ============================================================================
+# SECTION: Overlap Engine - Sort-and-Sweep over Two Address Maps
+# ============================================================================
+
+L = TypeVar("L")
+R = TypeVar("R")
+
+def find_overlaps(
+    left: Sequence[L],
+    right: Sequence[R],
+    left_span: Callable[[L], Tuple[int, int]],
+    right_span: Callable[[R], Tuple[int, int]],
+) -> List[Tuple[int, int]]:
+    """Return (left_index, right_index) for every overlapping pair.
+
+    Ranges are inclusive (start, end) as returned by the span callables, so the
+    engine can be reused for other address-map checks (e.g. /proc/iomem vs.
+    memmap). Intervals from both maps are swept in start order; each side keeps
+    a min-heap of open intervals keyed by end. Every interval still open on the
+    other side when one starts overlaps it, so the cost is
+    O((n + m) log(n + m) + k) for k overlaps. Pairs are returned sorted by
+    (left_index, right_index), i.e. the order of a nested loop over both lists.
+    """
+    events: List[Tuple[int, int, int, int]] = []
+    for idx, item in enumerate(left):
+        start, end = left_span(item)
+        events.append((start, 0, idx, end))
+    for idx, item in enumerate(right):
+        start, end = right_span(item)
+        events.append((start, 1, idx, end))
+    events.sort()
+
+    active: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]] = ([], [])
+    pairs: List[Tuple[int, int]] = []
+    for start, side, idx, end in events:
+        other = active[1 - side]
+        # Anything on the other side ending before this start can never
+        # overlap a later interval either.
+        while other and other[0][0] < start:
+            heapq.heappop(other)
+        for _other_end, other_idx in other:
+            pairs.append((idx, other_idx) if side == 0 else (other_idx, idx))
+        heapq.heappush(active[side], (end, idx))
+
+    pairs.sort()
+    return pairs
+
+def find_conflicts(mem_segs: Sequence[MemSeg], dts_regs: Sequence[DtsRange]) -> List[Conflict]:
+    """Return a Conflict for every UEFI segment / DTS MMIO range overlap."""
+    conflicts: List[Conflict] = []
+    pairs = find_overlaps(
+        mem_segs, dts_regs,
+        lambda s: (s.start, s.end),
+        lambda r: (r.base, r.end),
+    )
+    for mem_idx, dts_idx in pairs:
+        s = mem_segs[mem_idx]
+        r = dts_regs[dts_idx]
+        conflicts.append(
+            Conflict(
+                mem_type=s.seg_type,
+                mem_start=s.start,
+                mem_end=s.end,
+                mem_size=s.size,
+                dts_path=r.node_path,
+                dts_base=r.base,
+                dts_end=r.end,
+                dts_size=r.size,
+                dts_note=r.note,
+            )
+        )
+    return conflicts
+
+
 # ============================================================================
 # SECTION: Main Entry Point - Orchestration & Reporting
 # ============================================================================
 
-def main() -> None:
+def select_device_tree(dts_path: Optional[Path] = None,
+                       dtb_path: Optional[Path] = None) -> Tuple[str, Path]:
+    """Return ("DTB" or "DTS", path) of the device tree to check.
+
+    An explicit --dtb or --dts path is used as given; otherwise DTB_PATH when
+    it is a file, then DTS_PATH.
+    """
+    if dtb_path is not None:
+        return "DTB", dtb_path
+    if dts_path is not None:
+        return "DTS", dts_path
+    if DTB_PATH.is_file():
+        return "DTB", DTB_PATH
+    return "DTS", DTS_PATH
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check device tree MMIO ranges against the UEFI runtime memory map")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--dts", type=Path, default=None,
+                        help=f"Device tree source to check (default: {DTB_PATH} when "
+                             f"readable, else {DTS_PATH})")
+    source.add_argument("--dtb", type=Path, default=None,
+                        help="Flattened device tree blob to check")
+    return parser.parse_args(argv)
+
+def main(dts_path: Optional[Path] = None, dtb_path: Optional[Path] = None) -> None:
     """
     Main entry point for runtime device mapping conflict detection.
 
@@ -721,12 +1075,15 @@ def main() -> None:
     log("Testing Runtime Device Mapping Conflict Test")
     log("============================================================")
 
-    log(f"INFO: Using DTS: {DTS_PATH}")
+    dt_kind, dt_path = select_device_tree(dts_path, dtb_path)
+    log(f"INFO: Using {dt_kind}: {dt_path}")
+    if dts_path is None and dtb_path is None and dt_path == DTB_PATH and DTS_PATH.exists():
+        log(f"INFO: {DTS_PATH} not read; pass --dts to check it instead")
     log(f"INFO: Using memmap: {MEMMAP_PATH}")
     log(f"INFO: Writing log to: {OUT_LOG_PATH}")
 
-    if not DTS_PATH.exists():
-        log(f"DEBUG: DTS file not found: {DTS_PATH}")
+    if not dt_path.exists():
+        log(f"DEBUG: {dt_kind} file not found: {dt_path}")
         log(f"RESULTS: WARNINGS")
         close_log()
         return
@@ -737,12 +1094,17 @@ def main() -> None:
         return
 
     # Read files (memmap often UTF-16LE)
-    dts_text = read_text_smart(DTS_PATH)
     mem_text = read_text_smart(MEMMAP_PATH)
 
     # Parse
     mem_segs = parse_memmap(mem_text)
-    root = parse_dts_tree(dts_text)
+    try:
+        root = load_device_tree(dt_path)
+    except ValueError as exc:
+        log(f"DEBUG: Could not parse device tree {dt_path}: {exc}")
+        log(f"RESULTS: WARNINGS")
+        close_log()
+        return
     dts_regs = extract_dts_mmio_ranges(root)
 
     # Print ALL UEFI segments checked (without pages/attr)
@@ -786,23 +1148,7 @@ def main() -> None:
             )
 
     # Verify + report conflicts
-    conflicts: List[Conflict] = []
-    for s in mem_segs:
-        for r in dts_regs:
-            if overlaps(s.start, s.end, r.base, r.end):
-                conflicts.append(
-                    Conflict(
-                        mem_type=s.seg_type,
-                        mem_start=s.start,
-                        mem_end=s.end,
-                        mem_size=s.size,
-                        dts_path=r.node_path,
-                        dts_base=r.base,
-                        dts_end=r.end,
-                        dts_size=r.size,
-                        dts_note=r.note,
-                    )
-                )
+    conflicts = find_conflicts(mem_segs, dts_regs)
 
     log("")
     log("=====================================================================")
@@ -829,4 +1175,5 @@ def main() -> None:
     close_log()
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(args.dts, args.dtb)
@@ -19,9 +19,8 @@
 
 LOG_DIR="/mnt/acs_results_template/acs_results"
 
-automation_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation`"
-sbmr_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_sbmr_in_band_run`"
-sbmr_level="`python3 /mnt/acs_tests/parser/Parser.py -sbmr_level`"
+# Parse config file in one run, cached against the ini's mtime
+eval "`python3 /mnt/acs_tests/parser/Parser.py --export-shell --cache /mnt/acs_tests/config/acs_run_config.cache`"
 
 run_sbmr_in_band(){
     echo "Call SBMR ACS in-band test"
@@ -46,8 +45,7 @@ elif [ "$sbmr_enabled" == "False" ]; then
     echo "********* SBMR in-band test is disabled in config file**************"
 else
     run_sbmr_in_band
-    sync /mnt
-    sleep 3
+    python3 /usr/bin/results_writer.py sync ${LOG_DIR}/sbmr --settle "${settle_seconds:-0}"
     echo "NOTE: This ACS image runs SBMR IN-BAND tests ONLY." 1>&2
     echo "For SBMR OUT-OF-BAND tests, see: https://github.com/ARM-software/sbmr-acs.git" 1>&2
     echo "Please press <Enter> to continue ..."
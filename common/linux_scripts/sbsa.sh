@@ -18,12 +18,8 @@
 
 LOG_DIR="/mnt/acs_results_template/acs_results"
 
-# Parse config file
-automation_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation`"
-if [ "$automation_enabled" == "True" ]; then
-    sbsa_command="`python3 /mnt/acs_tests/parser/Parser.py -sbsa`"
-    sbsa_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_sbsa_run`"
-fi
+# Parse config file in one run, cached against the ini's mtime
+eval "`python3 /mnt/acs_tests/parser/Parser.py --export-shell --cache /mnt/acs_tests/config/acs_run_config.cache`"
 
 # Linux SBSA Execution
 echo "Running Linux SBSA tests"
@@ -34,13 +30,11 @@ else
     insmod /lib/modules/sbsa_acs.ko
     echo "SystemReady band ACS v3.1.1" > ${LOG_DIR}/linux/SbsaResultsApp.log
     if [ "$automation_enabled" == "False" ]; then
-      /bin/sbsa --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/SbsaResultsApp.log
+      python3 /usr/bin/kmsg_capture.py --output ${LOG_DIR}/linux/SbsaResultsKernel.log -- /bin/sbsa --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/SbsaResultsApp.log
     else
-      $sbsa_command --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/SbsaResultsApp.log
+      python3 /usr/bin/kmsg_capture.py --output ${LOG_DIR}/linux/SbsaResultsKernel.log -- $sbsa_command --skip PCI_MM_03 --skip-dp-nic-ms >> ${LOG_DIR}/linux/SbsaResultsApp.log
     fi
-    dmesg | sed -n 'H; /PE_INFO/h; ${g;p;}' > ${LOG_DIR}/linux/SbsaResultsKernel.log
-    sync /mnt
-    sleep 5
+    python3 /usr/bin/results_writer.py sync ${LOG_DIR}/linux/SbsaResultsApp.log ${LOG_DIR}/linux/SbsaResultsKernel.log --settle "${settle_seconds:-0}"
     echo "Linux SBSA test Execution - Completed"
   else
     echo "Error: SBSA kernel Driver is not found. Linux SBSA tests cannot be run."
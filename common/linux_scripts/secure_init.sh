@@ -35,12 +35,8 @@ fi
 YOCTO_FLAG="/mnt/yocto_image.flag"
 
 if [ ! -f "$YOCTO_FLAG" ]; then
-  # Parse config file
-  automation_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation`"
-  if [ "$automation_enabled" == "True" ]; then
-    bbsr_fwts_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_bbsr_fwts_run`"
-    bbsr_tpm_enabled="`python3 /mnt/acs_tests/parser/Parser.py -automation_bbsr_tpm_run`"
-  fi
+  # Parse config file in one run, cached against the ini's mtime
+  eval "`python3 /mnt/acs_tests/parser/Parser.py --export-shell --cache /mnt/acs_tests/config/acs_run_config.cache`"
 fi
 
 # give linux time to finish initializing disks
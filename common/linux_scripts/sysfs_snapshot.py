@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Snapshot block, network, PCI and firmware details straight from sysfs."""
+
+import argparse
+import fnmatch
+import json
+import os
+import shutil
+import stat
+import sys
+
+SYSFS_ROOT = "/sys"
+
+# PCI class codes reported as graphics devices, with lspci's names
+GRAPHICS_CLASSES = {
+    0x0300: "VGA compatible controller",
+    0x0302: "3D controller",
+    0x0380: "Display controller",
+}
+
+# Where lspci finds its vendor, device and class names
+PCI_IDS_PATHS = ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids")
+
+# Candidate modules for a device, as lspci -k reports them from its modalias
+MODULES_ALIAS = os.path.join("/lib/modules", os.uname().release, "modules.alias")
+
+
+def read_attr(path):
+    """Return a stripped sysfs attribute, or None when it cannot be read."""
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def link_name(path):
+    """Return the last component of a symlink target, or None when absent."""
+    try:
+        return os.path.basename(os.readlink(path))
+    except OSError:
+        return None
+
+
+def scan_entries(path):
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def scan_block(root=SYSFS_ROOT):
+    devices = {}
+    for entry in scan_entries(os.path.join(root, "class", "block")):
+        device = os.path.join(entry.path, "device")
+        devices[entry.name] = {
+            "driver": link_name(os.path.join(device, "driver")),
+            "module": link_name(os.path.join(device, "driver", "module")),
+            "address": link_name(device),
+        }
+    return devices
+
+
+def scan_net(root=SYSFS_ROOT):
+    devices = {}
+    for entry in scan_entries(os.path.join(root, "class", "net")):
+        device = os.path.join(entry.path, "device")
+        devices[entry.name] = {
+            "driver": link_name(os.path.join(device, "driver")),
+            "module": link_name(os.path.join(device, "driver", "module")),
+            "address": read_attr(os.path.join(entry.path, "address")),
+            "operstate": read_attr(os.path.join(entry.path, "operstate")),
+            "bus_address": link_name(device),
+        }
+    return devices
+
+
+def scan_pci(root=SYSFS_ROOT):
+    devices = {}
+    for entry in scan_entries(os.path.join(root, "bus", "pci", "devices")):
+        devices[entry.name] = {
+            "vendor": read_attr(os.path.join(entry.path, "vendor")),
+            "device": read_attr(os.path.join(entry.path, "device")),
+            "class": read_attr(os.path.join(entry.path, "class")),
+            "revision": read_attr(os.path.join(entry.path, "revision")),
+            "modalias": read_attr(os.path.join(entry.path, "modalias")),
+            "driver": link_name(os.path.join(entry.path, "driver")),
+            "module": link_name(os.path.join(entry.path, "driver", "module")),
+        }
+    return devices
+
+
+def scan_firmware(root=SYSFS_ROOT):
+    """Map every path under firmware/ to its type, size and link target."""
+    tree = {}
+    top = os.path.join(root, "firmware")
+    pending = [top]
+    while pending:
+        path = pending.pop()
+        for entry in scan_entries(path):
+            rel = os.path.relpath(entry.path, top)
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if stat.S_ISLNK(st.st_mode):
+                tree[rel] = {"type": "link", "target": os.readlink(entry.path)}
+            elif stat.S_ISDIR(st.st_mode):
+                tree[rel] = {"type": "dir"}
+                pending.append(entry.path)
+            else:
+                tree[rel] = {"type": "file", "size": st.st_size,
+                             "mode": stat.filemode(st.st_mode)}
+    return dict(sorted(tree.items()))
+
+
+def take_snapshot(root=SYSFS_ROOT, firmware=True):
+    snapshot = {
+        "block": scan_block(root),
+        "net": scan_net(root),
+        "pci": scan_pci(root),
+    }
+    if firmware:
+        snapshot["firmware"] = scan_firmware(root)
+    return snapshot
+
+
+def pci_class(device):
+    try:
+        return int(device["class"], 16) >> 8
+    except (TypeError, ValueError):
+        return None
+
+
+def pci_id(device, key):
+    try:
+        return int(device[key], 16)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def load_pci_names(path, devices):
+    """Return the pci.ids vendor, device and class names of the given devices.
+
+    Keys are ("vendor", v), ("device", v, d), ("class", c) and
+    ("subclass", c << 8 | s); only the ids in use are kept.
+    """
+    vendors = {pci_id(d, "vendor") for d in devices.values()}
+    ids = {(pci_id(d, "vendor"), pci_id(d, "device")) for d in devices.values()}
+    codes = {pci_class(d) for d in devices.values()}
+    names = {}
+    if not path:
+        return names
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            vendor = cls = None
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                try:
+                    if line.startswith("C "):
+                        vendor, cls = None, int(line[2:4], 16)
+                        if any(code is not None and code >> 8 == cls for code in codes):
+                            names[("class", cls)] = line[4:].strip()
+                    elif not line.startswith("\t"):
+                        vendor, cls = int(line[:4], 16), None
+                        if vendor in vendors:
+                            names[("vendor", vendor)] = line[4:].strip()
+                    elif line.startswith("\t\t"):
+                        continue
+                    elif vendor is not None and (vendor, int(line[1:5], 16)) in ids:
+                        names[("device", vendor, int(line[1:5], 16))] = line[5:].strip()
+                    elif cls is not None and (cls << 8 | int(line[1:3], 16)) in codes:
+                        names[("subclass", cls << 8 | int(line[1:3], 16))] = line[3:].strip()
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return names
+
+
+def load_module_aliases(path):
+    """Return the (pattern, module) pairs of the PCI entries in modules.alias."""
+    aliases = []
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 3 and fields[0] == "alias" and fields[1].startswith("pci:"):
+                    aliases.append((fields[1], fields[2]))
+    except OSError:
+        return None
+    return aliases
+
+
+def candidate_modules(device, aliases):
+    """Modules whose alias matches the device, or the bound driver's module without aliases."""
+    if aliases is None or not device.get("modalias"):
+        return [device["module"]] if device["module"] else []
+    modules = []
+    for pattern, module in aliases:
+        if module not in modules and fnmatch.fnmatchcase(device["modalias"], pattern):
+            modules.append(module)
+    return modules
+
+
+def pci_header(address, device, names):
+    """The device line lspci prints: address, class and vendor/device names."""
+    code = pci_class(device)
+    vendor, product = pci_id(device, "vendor"), pci_id(device, "device")
+    if code is None:
+        class_name = "Class ????"
+    else:
+        class_name = (names.get(("subclass", code)) or GRAPHICS_CLASSES.get(code)
+                      or names.get(("class", code >> 8)) or f"Class {code:04x}")
+    vendor_name = names.get(("vendor", vendor))
+    product_name = names.get(("device", vendor, product))
+    ids = f"{(device['vendor'] or '?')[2:]}:{(device['device'] or '?')[2:]}"
+    if vendor_name and product_name:
+        name = f"{vendor_name} {product_name}"
+    elif vendor_name:
+        name = f"{vendor_name} Device {(device['device'] or '?')[2:]}"
+    else:
+        name = f"Device {ids}"
+    revision = pci_id(device, "revision")
+    if revision:
+        name += f" (rev {revision:02x})"
+    return f"{address} {class_name}: {name}"
+
+
+def short_addresses(pci):
+    """lspci leaves out the PCI domain when every device is in domain 0000."""
+    if all(address.startswith("0000:") for address in pci):
+        return {address: address[5:] for address in pci}
+    return {address: address for address in pci}
+
+
+def format_drivers(snapshot, pci_ids=None, modules_alias=MODULES_ALIAS):
+    """Render the device_driver.log view: block, graphics, network and PCIe drivers."""
+    names = load_pci_names(pci_ids, snapshot["pci"])
+    shown = short_addresses(snapshot["pci"])
+    graphics = {address: device for address, device in snapshot["pci"].items()
+                if pci_class(device) in GRAPHICS_CLASSES}
+    aliases = load_module_aliases(modules_alias) if graphics else None
+
+    lines = ["", "Block Device Drivers Details", "----------------------------", ""]
+    lines.append("%10s %10s " % ("Device", "Driver"))
+    for name, device in snapshot["block"].items():
+        if device["driver"]:
+            lines.append("%10s %10s " % (name, device["driver"]))
+    lines += ["", ""]
+
+    lines += ["Graphics Device Driver Details", "------------------------------", ""]
+    for address, device in graphics.items():
+        lines.append(pci_header(shown[address], device, names))
+        if device["driver"]:
+            lines.append(f"\tKernel driver in use: {device['driver']}")
+        modules = candidate_modules(device, aliases)
+        if modules:
+            lines.append(f"\tKernel modules: {', '.join(modules)}")
+    lines += ["", ""]
+
+    lines += ["Network Device Drivers Details", "------------------------------", ""]
+    lines.append("%10s %30s (%s)" % ("Device", "Driver", "Status"))
+    for name, device in snapshot["net"].items():
+        lines.append("%10s [%s] %10s (%s)" % (name, device["address"] or "",
+                                              device["module"] or "N/A",
+                                              device["operstate"] or ""))
+    lines += ["", ""]
+
+    lines += ["PCIe Device Driver Details", "--------------------------", ""]
+    for address, device in snapshot["pci"].items():
+        lines.append(pci_header(shown[address], device, names))
+        if device["driver"]:
+            lines.append(f"\tKernel driver in use: {device['driver']}")
+            lines.append("")
+        else:
+            lines.append("        No driver found")
+            lines.append("")
+    lines += ["", ""]
+    return "\n".join(lines) + "\n"
+
+
+def format_firmware(snapshot, root=SYSFS_ROOT):
+    """Render a recursive listing of firmware/, one line per entry."""
+    lines = []
+    for rel, info in snapshot["firmware"].items():
+        path = os.path.join(root, "firmware", rel)
+        if info["type"] == "link":
+            lines.append(f"l {path} -> {info['target']}")
+        elif info["type"] == "dir":
+            lines.append(f"d {path}")
+        else:
+            lines.append(f"{info['mode']} {info['size']:>8} {path}")
+    return "\n".join(lines) + "\n"
+
+
+def copy_firmware(snapshot, dest, root=SYSFS_ROOT):
+    """Copy the readable firmware files in-process, returning the paths that failed."""
+    failed = []
+    for rel, info in snapshot["firmware"].items():
+        src = os.path.join(root, "firmware", rel)
+        dst = os.path.join(dest, rel)
+        try:
+            if info["type"] == "dir":
+                os.makedirs(dst, exist_ok=True)
+            elif info["type"] == "link":
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                if not os.path.lexists(dst):
+                    os.symlink(info["target"], dst)
+            else:
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(src, dst)
+        except OSError as e:
+            failed.append(f"{src}: {e.strerror or e}")
+    return failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot device and firmware details from sysfs")
+    parser.add_argument("--root", default=SYSFS_ROOT, help="sysfs mount point")
+    parser.add_argument("--view", choices=["drivers", "firmware", "none"], default="drivers",
+                        help="Text view printed to stdout (default: %(default)s)")
+    parser.add_argument("--json", default=None, help="Write the structured snapshot here")
+    parser.add_argument("--firmware-copy", default=None,
+                        help="Copy firmware/ into this directory")
+    parser.add_argument("--pci-ids", default=None,
+                        help="pci.ids used for device names (default: the first of %s)"
+                             % ", ".join(PCI_IDS_PATHS))
+    parser.add_argument("--modules-alias", default=MODULES_ALIAS,
+                        help="modules.alias used for candidate modules (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(root=SYSFS_ROOT, view="drivers", json_path=None, firmware_copy=None,
+         pci_ids=None, modules_alias=MODULES_ALIAS):
+    if pci_ids is None:
+        pci_ids = next((path for path in PCI_IDS_PATHS if os.path.exists(path)), None)
+    firmware = view == "firmware" or bool(json_path) or bool(firmware_copy)
+    snapshot = take_snapshot(root, firmware=firmware)
+
+    if view == "drivers":
+        sys.stdout.write(format_drivers(snapshot, pci_ids, modules_alias))
+    elif view == "firmware":
+        sys.stdout.write(format_firmware(snapshot, root))
+
+    if firmware_copy:
+        for failure in copy_firmware(snapshot, firmware_copy, root):
+            print(f"cp: cannot copy {failure}")
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(snapshot, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.root, args.view, args.json, args.firmware_copy,
+                  args.pci_ids, args.modules_alias))
@@ -18,6 +18,13 @@
 import sys
 import yaml
 import re
+import hashlib
+
+# libyaml's C loader is an order of magnitude faster on large measured-boot logs
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# PCR banks that can be replayed in-process
+REPLAY_ALGOS = ['sha256', 'sha384', 'sha512']
 
 # TPM log review checklist
 tpmlog_checklist = \
@@ -35,7 +42,8 @@ tpmlog_checklist = \
    "Verify presence of EV_SEPARATOR event for each PCR",
    "Verify EV_TABLE_OF_DEVICES events for measurements of config data to PCR[1] with "
    "recommended strings",
-   "Verify presence of “Exit Boot Services Invocation” event with EV_EFI_ACTION type"
+   "Verify presence of “Exit Boot Services Invocation” event with EV_EFI_ACTION type",
+   "Verify that replaying the event log digests reproduces the TPM PCR values"
    ]
 max_width = max(len(item) for item in tpmlog_checklist)
 print_buffer = []
@@ -51,18 +59,46 @@ def TestResult(test_idx, test_result):
     print(f"{tpmlog_checklist[test_idx - 1].ljust(max_width)} : {test_result}")
     print_buffer_call()
 
-def compare_measurements(pcr_log_path, event_log_path):
+def load_yaml(path):
+    with open(path, 'r') as file:
+        return yaml.load(file, Loader=YAML_LOADER)
+
+def load_logs(pcr_log_path, event_log_path):
+    # parse each input exactly once, all checks share the result
     try:
-        with open(pcr_log_path, 'r') as pcr_log, open(event_log_path, 'r') as event_log:
-            pcr_data = yaml.safe_load(pcr_log)
-            eventlog_data = yaml.safe_load(event_log)
+        pcr_data = load_yaml(pcr_log_path)
+        eventlog_data = load_yaml(event_log_path)
     except Exception as e:
         print_buffer.append(f"ERROR: {e}")
         TestResult(1, "FAIL")
         exit(1)
+    return pcr_data, eventlog_data
+
+def bank_value(bank, index):
+    # tpm2 tools print banks as {index: value} maps, older dumps as lists
+    if isinstance(bank, dict):
+        return bank.get(index)
+    if isinstance(bank, list) and index < len(bank):
+        return bank[index]
+    return None
+
+def digest_bytes(value, size):
+    # PCR values may be hex strings or, when unquoted 0x..., YAML integers
+    if isinstance(value, int):
+        return value.to_bytes(size, 'big') if value.bit_length() <= size * 8 else None
+    if isinstance(value, str):
+        value = value.strip()
+        if value[:2].lower() == '0x':
+            value = value[2:]
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            return None
+    return None
 
+def compare_measurements(pcr_data, eventlog_data):
     # check if event log and TPM PCR log as expected data
-    if not 'pcrs' in eventlog_data:
+    if not isinstance(eventlog_data, dict) or not 'pcrs' in eventlog_data:
         print_buffer.append("Event log doesn't contain PCR data.")
         TestResult(1, "FAIL")
         return
@@ -93,33 +129,91 @@ def compare_measurements(pcr_log_path, event_log_path):
         status = "PASS"
     TestResult(1, status)
 
-def parse_eventlog_data(event_log_path):
+def iter_events(eventlog_data):
+    # yield one normalised event at a time instead of building copies up front
+    for event in eventlog_data['events'] or []:
+        # parse common fields
+        event_details = {
+            'event_num': event['EventNum'],
+            'pcr_index': event['PCRIndex'],
+            'event_type': event['EventType'],
+        }
+        # parse event specific data if available
+        if 'Event' in event:
+            event_details['event_data'] = event['Event']
+        elif 'SpecID' in event:
+            event_details['spec_id'] = str(event['SpecID'][0]['specVersionMajor']) \
+            + '.' + str(event['SpecID'][0]['specVersionMajor'])
+        if 'Digests' in event:
+            event_details['digests'] = {digest['AlgorithmId']: digest['Digest']
+                                        for digest in event['Digests'] or []}
+        yield event_details
+
+def parse_eventlog_data(eventlog_data):
     try:
-        with open(event_log_path, 'r') as file:
-            yaml_data = yaml.safe_load(file)
-            events = []
-            for event in yaml_data['events']:
-                # parse common fields
-                event_details = {
-                    'event_num': event['EventNum'],
-                    'pcr_index': event['PCRIndex'],
-                    'event_type': event['EventType'],
-                }
-                # parse event specific data if available
-                if 'Event' in event:
-                    event_details['event_data'] = event['Event']
-                elif 'SpecID' in event:
-                    event_details['spec_id'] = str(event['SpecID'][0]['specVersionMajor']) \
-                    + '.' + str(event['SpecID'][0]['specVersionMajor'])
-                events.append(event_details)
-            return events
-    except yaml.YAMLError as e:
-        print(f"Error: Failed to parse YAML: {e}")
-        exit(1)
+        return list(iter_events(eventlog_data))
     except Exception as e:
         print(f"ERROR: {e}")
         exit(1)
 
+def replay_pcrs(events):
+    # extend a zeroed PCR per bank with every logged digest, as the TPM did
+    banks = {}
+    for event in events:
+        if event['event_type'] == "EV_NO_ACTION":
+            event_data = event.get('event_data')
+            # a StartupLocality event sets the initial value of PCR[0]
+            if isinstance(event_data, dict) and 'StartupLocality' in event_data:
+                for algo in REPLAY_ALGOS:
+                    size = hashlib.new(algo).digest_size
+                    pcrs = banks.setdefault(algo, {})
+                    pcrs[0] = bytes(size - 1) + bytes([int(event_data['StartupLocality'])])
+            continue
+        for algo, digest in event.get('digests', {}).items():
+            if algo not in REPLAY_ALGOS:
+                continue
+            size = hashlib.new(algo).digest_size
+            value = digest_bytes(digest, size)
+            if value is None or len(value) != size:
+                raise ValueError(f"Event {event['event_num']} has a malformed {algo} digest")
+            pcrs = banks.setdefault(algo, {})
+            index = event['pcr_index']
+            pcrs[index] = hashlib.new(algo, pcrs.get(index, bytes(size)) + value).digest()
+    return banks
+
+def check_replay(pcr_data, events):
+    status = "FAIL"
+    try:
+        banks = replay_pcrs(events)
+    except Exception as e:
+        print_buffer.append(f"ERROR: {e}")
+        TestResult(12, status)
+        return
+
+    compared = 0
+    mismatches = 0
+    for algo, pcrs in banks.items():
+        if not isinstance(pcr_data, dict) or algo not in pcr_data:
+            continue
+        size = hashlib.new(algo).digest_size
+        # only PCRs extended by this log can be reproduced from it
+        for index in sorted(pcrs):
+            expected = digest_bytes(bank_value(pcr_data[algo], index), size)
+            if expected is None:
+                continue
+            compared += 1
+            if expected != pcrs[index]:
+                mismatches += 1
+                print_buffer.append(f"PCR[{index}] replay does not match for {algo}")
+                print_buffer.append(f"TPM      PCR[{index}] : {expected.hex()}")
+                print_buffer.append(f"Replayed PCR[{index}] : {pcrs[index].hex()}")
+
+    if compared == 0:
+        print_buffer.append("No sha256/sha384/sha512 PCR could be replayed from the event log")
+    elif mismatches == 0:
+        status = "PASS"
+    TestResult(12, status)
+
 def check_events(event_list):
     try:
         # Verify the EV_NO_ACTION event for Specification ID version.
@@ -278,7 +372,7 @@ def check_events(event_list):
             event['pcr_index'] in pcrs:
                 pcrs.remove(event['pcr_index'])
         if pcrs:
-            print_buffer(f"EV_SEPARATOR event not found for pcrs {pcrs}")
+            print_buffer.append(f"EV_SEPARATOR event not found for pcrs {pcrs}")
             status = "FAIL"
         else:
             status = "PASS"
@@ -352,24 +446,31 @@ def check_events(event_list):
 
 if __name__ == "__main__":
     # check if log files are passed to script
-    if len(sys.argv) != 3:
-        print("Usage: python3 verify_tpm_measurements.py"
+    args = sys.argv[1:]
+    replay = '--replay' in args
+    paths = [arg for arg in args if arg != '--replay']
+    if len(paths) != 2:
+        print("Usage: python3 verify_tpm_measurements.py [--replay]"
               " <path to pcr.log> <path to eventlog.log>")
         exit(1)
 
     try:
         # parse command line for file
-        pcr_log_path  = sys.argv[1]
-        eventlog_path = sys.argv[2]
+        pcr_log_path, eventlog_path = paths
+        pcr_data, eventlog_data = load_logs(pcr_log_path, eventlog_path)
 
         # Verify that the cumulative SHA256 measurements from the event log match the TPM PCRs 0-7.
         # The events logged in the TPM event log must match the actual measurements extended
         # in the TPM PCRs.
-        compare_measurements(pcr_log_path, eventlog_path)
+        compare_measurements(pcr_data, eventlog_data)
 
         # parse eventlog and store for further processing
-        events = parse_eventlog_data(eventlog_path)
+        events = parse_eventlog_data(eventlog_data)
         check_events(events)
+
+        # Recompute every PCR extended by the event log and compare it to the TPM
+        if replay:
+            check_replay(pcr_data, events)
     except Exception as e:
         print(f"ERROR: {e}")
         exit(1)
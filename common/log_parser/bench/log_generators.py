@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Seeded synthetic log generators for every log_parser input format.
+# The generated logs follow the layouts the suite parsers match on, so the
+# benchmark exercises the same code paths as a real acs_results bundle.
+
+import argparse
+import json
+import os
+import random
+import sys
+
+BSA_SUITES = ["PE", "GIC", "Timer", "Watchdog", "PCIe", "Memory", "SMMU", "Power_Wakeup"]
+BSA_RESULTS = ["PASSED", "PASSED", "PASSED", "FAILED", "SKIPPED",
+               "PAL NOT SUPPORTED", "PASSED(*PARTIAL)", "TEST NOT IMPLEMENTED"]
+BSA_NOISE = [
+    "INFO: Checking PE index {n}",
+    "       Reading register 0x{n:08x}",
+    "DEBUG: Mapping address 0x{n:016x}",
+]
+
+FWTS_TESTS = ["esrt", "uefibootpath", "aest", "cedt", "slit", "srat", "hmat",
+              "pcct", "pdtt", "bgrt", "bert", "einj", "erst", "hest", "mpam",
+              "ibft", "ras2", "smccc", "dmicheck", "acpitables", "spcr", "gtdt"]
+FWTS_RESULTS = ["PASSED", "PASSED", "PASSED", "FAILED", "SKIPPED", "WARNING"]
+
+SCT_CASES = ["PlatformSpecificElements", "RequiredElements", "TestEfiSpecVerLvl",
+             "BootExcLevel", "GetVariable_Conf", "SetVariable_Func",
+             "GetTime_Func", "SetWatchdogTimer_Func", "AllocatePages_Func"]
+SCT_RESULTS = ["PASS", "PASS", "PASS", "FAIL", "WARNING", "NOT SUPPORTED"]
+
+SCMI_PROTOCOLS = ["BASE", "POWER DOMAIN", "SYSTEM POWER", "PERFORMANCE",
+                  "CLOCK", "SENSOR", "RESET", "VOLTAGE", "POWERCAP", "PIN CONTROL"]
+SCMI_RESULTS = ["CONFORMANT", "CONFORMANT", "CONFORMANT", "NON CONFORMANT", "SKIPPED"]
+
+PFDI_SUITES = ["PE", "PFDI_FEATURES", "PFDI_FORCE_ERROR", "PFDI_RUN"]
+PFDI_RESULTS = ["PASS", "PASS", "PASS", "FAIL", "SKIP", "WARN"]
+
+SBMR_SUITES = ["Redfish", "IPMI", "SMBUS", "MCTP"]
+SBMR_STATUS = ["PASS", "PASS", "PASS", "FAIL", "SKIP"]
+
+# Waivable suite names and the first test suite each generated log contains.
+# The benchmark uses these to build a waiver.json that matches real entries.
+WAIVER_TARGETS = {
+    "bsa": ("BSA", BSA_SUITES[0]),
+    "fwts": ("FWTS", FWTS_TESTS[0]),
+    "sct": ("SCT", "GenericTest"),
+    "scmi": ("SCMI", SCMI_PROTOCOLS[0].lower()),
+    "pfdi": ("PFDI", PFDI_SUITES[0]),
+    "sbmr": ("SBMR", SBMR_SUITES[0]),
+}
+
+
+def _hex_guid(rng):
+    """Return a random GUID string in SCT log formatting."""
+    raw = "%032X" % rng.getrandbits(128)
+    return f"{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:]}"
+
+
+def generate_bsa_log(records, seed=0, kernel=False):
+    """Return BsaResults.log (or BsaResultsKernel.log) text with nested rules."""
+    rng = random.Random(seed)
+    prefix = ""
+    lines = [
+        " *** BSA ACS synthetic log ***",
+        "Selected rules: all",
+        "---------------------- Running tests ------------------------",
+    ]
+    timestamp = 0.0
+    per_suite = max(1, records // len(BSA_SUITES))
+    rule_no = 0
+    for suite in BSA_SUITES:
+        lines.append(f"*** Running {suite} tests ***")
+        for _ in range(per_suite):
+            if rule_no >= records:
+                break
+            rule_no += 1
+            rule_id = f"B_{suite.upper()[:4]}_{rule_no:04d}"
+            children = rng.randint(0, 3)
+            entries = [f"{rule_id} : {rule_no} : Synthetic check {rule_no} for {suite}"]
+            for _ in range(rng.randint(0, 2)):
+                entries.append("  " + rng.choice(BSA_NOISE).format(n=rng.getrandbits(32)))
+            if children:
+                entries.append(f"  === Start tests for rules referenced by {rule_id} ===")
+                for child in range(children):
+                    child_id = f"{rule_id}_C{child}"
+                    entries.append(f"    {child_id} : - : Referenced rule {child}")
+                    entries.append(f"      Result: {rng.choice(BSA_RESULTS)}")
+                entries.append(f"  === End tests for rules referenced by {rule_id} ===")
+            entries.append(f"  Result: {rng.choice(BSA_RESULTS)}")
+            for entry in entries:
+                if kernel:
+                    timestamp += rng.random() / 100
+                    prefix = f"[{timestamp:12.6f}] "
+                lines.append(prefix + entry)
+    lines.append("      ------------------------------------------------------- ")
+    lines.append(f"      Total Tests run  = {rule_no:4d}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_fwts_log(records, seed=0):
+    """Return FWTSResults.log text with records subtests spread over tests."""
+    rng = random.Random(seed)
+    tests = FWTS_TESTS
+    lines = [
+        "Results generated by fwts: Version V26.01.00 (synthetic).",
+        "",
+        "Running tests: " + " ".join(tests) + ".",
+        "",
+        "=" * 80,
+    ]
+    per_test = max(1, records // len(tests))
+    emitted = 0
+    for test in tests:
+        if emitted >= records:
+            break
+        count = min(per_test, records - emitted)
+        lines.append(f"{test}: Synthetic {test} table checks.")
+        lines.append("-" * 80)
+        for number in range(1, count + 1):
+            emitted += 1
+            lines.append(f"Test {number} of {count}: Check {test} field {number}.")
+            for _ in range(rng.randint(1, 3)):
+                result = rng.choice(FWTS_RESULTS)
+                if result == "FAILED":
+                    lines.append(f"FAILED [MEDIUM] {test.upper()}BadField: Test {number}, "
+                                 f"field {rng.randint(0, 255)} has invalid value")
+                    lines.append(f"0x{rng.getrandbits(32):08x} expected 0x{rng.getrandbits(32):08x}.")
+                elif result == "SKIPPED":
+                    lines.append(f"SKIPPED: Test {number}, feature not present.")
+                elif result == "WARNING":
+                    lines.append(f"WARNING: Test {number}, reserved bits set.")
+                else:
+                    lines.append(f"PASSED: Test {number}, {test} field {number} is valid.")
+            lines.append("")
+        lines.append("=" * 80)
+        lines.append(f"{count} passed, 0 failed, 0 warning, 0 aborted, 0 skipped, 0 info only.")
+        lines.append("=" * 80)
+    return "\n".join(lines) + "\n"
+
+
+def generate_sct_log(records, seed=0):
+    """Return an SCT Overall/Summary.log text with records subtests."""
+    rng = random.Random(seed)
+    lines = []
+    emitted = 0
+    case_idx = 0
+    while emitted < records:
+        case = SCT_CASES[case_idx % len(SCT_CASES)]
+        case_idx += 1
+        lines.extend([
+            "-" * 60,
+            "BBR ACS",
+            case,
+            "Revision 0x00010000",
+            "Test Entry Point GUID: " + _hex_guid(rng),
+            "Test Support Library GUIDs:",
+            "-" * 60,
+            "Test Configuration #0",
+            "-" * 60,
+            f"Synthetic {case} conformance test",
+            "-" * 60,
+            "Logfile: \"\\SCT\\Log\\" + case + ".log\"",
+            "Test Finished: 01/01/26  00:00a",
+            "-" * 60,
+            "Returned Status Code: Success",
+            f"{case}: [{'PASSED' if rng.random() > 0.2 else 'FAILED'}]",
+            "  Passes........... 1",
+            "  Warnings......... 0",
+            "  Errors........... 0",
+            "-" * 60,
+        ])
+        for _ in range(min(rng.randint(1, 8), records - emitted)):
+            emitted += 1
+            lines.append(f"{case} - Assertion {emitted} -- {rng.choice(SCT_RESULTS)}")
+            lines.append(_hex_guid(rng))
+            lines.append(f"/home/sct/Source/{case}.c:{rng.randint(10, 4000)}:Status - Success")
+            lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def generate_scmi_log(records, seed=0):
+    """Return an SCMI arm_scmi_test_log.txt text with records testcases."""
+    rng = random.Random(seed)
+    lines = ["**** SCMI Compliance Suite ****", ""]
+    per_protocol = max(1, records // len(SCMI_PROTOCOLS))
+    number = 0
+    for protocol in SCMI_PROTOCOLS:
+        lines.append(f"*** Starting {protocol} tests ***")
+        for _ in range(per_protocol):
+            if number >= records:
+                break
+            number += 1
+            result = rng.choice(SCMI_RESULTS)
+            if rng.random() < 0.5:
+                lines.append(f"  {number:03d} : Query {protocol.lower()} attribute {number} : {result}")
+                continue
+            lines.append(f"  {number:03d} : Query {protocol.lower()} attribute {number}")
+            lines.append(f"              CHECK STATUS   : {'FAILED' if result == 'NON CONFORMANT' else 'PASSED'}")
+            lines.append(f"              EXPECTED : 0x{rng.getrandbits(16):04x}")
+            lines.append(f"              RECEIVED : 0x{rng.getrandbits(16):04x}")
+            lines.append(f"              CHECK HEADER   : {result}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def generate_pfdi_log(records, seed=0):
+    """Return a PFDI pfdiresults.log text with records tests."""
+    rng = random.Random(seed)
+    lines = ["PFDI ACS synthetic log", ""]
+    per_suite = max(1, records // len(PFDI_SUITES))
+    number = 0
+    for suite in PFDI_SUITES:
+        lines.append(f"*** Starting {suite} tests ***")
+        for _ in range(per_suite):
+            if number >= records:
+                break
+            number += 1
+            result = rng.choice(PFDI_RESULTS)
+            if rng.random() < 0.5:
+                lines.append(f"  {number} : PFDI check {number} : Result: {result}")
+                continue
+            lines.append(f"  {number} : PFDI check {number}")
+            lines.append(f"       PE {rng.randint(0, 127)} returned 0x{rng.getrandbits(32):08x}")
+            if result == "FAIL":
+                lines.append(f"       Check failed at step {rng.randint(1, 9)}")
+            lines.append(f"       Result: {result}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def generate_sbmr_xml(records, seed=0):
+    """Return a Robot Framework output.xml text with records tests."""
+    rng = random.Random(seed)
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<robot generator="Robot 6.1 (synthetic)">',
+             '<suite id="s1" name="Sbmr">']
+    per_suite = max(1, records // len(SBMR_SUITES))
+    number = 0
+    for s_idx, suite in enumerate(SBMR_SUITES, start=1):
+        lines.append(f'<suite id="s1-s{s_idx}" name="{suite}">')
+        case_idx = 0
+        while number < records and number < per_suite * s_idx:
+            case_idx += 1
+            lines.append(f'<suite id="s1-s{s_idx}-s{case_idx}" name="{suite} Case {case_idx}">')
+            for _ in range(min(rng.randint(1, 6), per_suite * s_idx - number)):
+                number += 1
+                status = rng.choice(SBMR_STATUS)
+                lines.append(f'<test id="t{number}" name="Check {suite} item {number}">')
+                lines.append(f'<kw name="Run Check"><msg level="INFO">step {number}</msg>')
+                if status == "FAIL":
+                    lines.append(f'<msg level="FAIL">Item {number} mismatch</msg>')
+                lines.append(f'<status status="{status}"/></kw>')
+                reason = f"Item {number} mismatch" if status == "FAIL" else ""
+                lines.append(f'<status status="{status}">{reason}</status>')
+                lines.append('</test>')
+            lines.append('<status status="PASS"/></suite>')
+        lines.append('<status status="PASS"/></suite>')
+    lines.append('<status status="PASS"/></suite>')
+    lines.append('</robot>')
+    return "\n".join(lines) + "\n"
+
+
+def generate_waiver(formats):
+    """Return a waiver.json dict holding one testsuite waiver per format."""
+    suites = []
+    for fmt in formats:
+        if fmt not in WAIVER_TARGETS:
+            continue
+        suite_name, test_suite = WAIVER_TARGETS[fmt]
+        suites.append({
+            "Suite": suite_name,
+            "TestSuites": [{
+                "Test_suite": test_suite,
+                "Reason": "Synthetic benchmark waiver."
+            }]
+        })
+    return {"Suites": suites}
+
+
+# Each format lists (file name, generator) for every input log it needs. BSA
+# produces both the UEFI and kernel logs, as main_log_parser.sh parses them
+# together.
+FORMATS = {
+    "bsa": [
+        ("uefi/BsaResults.log", lambda n, s: generate_bsa_log(n, s)),
+        ("linux/BsaResultsKernel.log", lambda n, s: generate_bsa_log(n, s + 1, kernel=True)),
+    ],
+    "fwts": [("fwts/FWTSResults.log", generate_fwts_log)],
+    "sct": [("sct_results/Overall/Summary.log", generate_sct_log)],
+    "scmi": [("linux_acs/scmi_acs_app/arm_scmi_test_log.txt", generate_scmi_log)],
+    "pfdi": [("uefi/pfdiresults.log", generate_pfdi_log)],
+    "sbmr": [("sbmr/sbmr_in_band_logs/output.xml", generate_sbmr_xml)],
+}
+
+
+def write_format(fmt, output_dir, records, seed=0):
+    """Write every log of one format under output_dir and return their paths."""
+    paths = []
+    for rel_path, generator in FORMATS[fmt]:
+        path = os.path.join(output_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(generator(records, seed))
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate seeded synthetic ACS logs for parser benchmarking."
+    )
+    parser.add_argument("output_dir", help="Directory to write the acs_results style tree into")
+    parser.add_argument("--formats", nargs="+", choices=sorted(FORMATS), default=sorted(FORMATS),
+                        help="Log formats to generate (default: all)")
+    parser.add_argument("--records", type=int, default=1000,
+                        help="Approximate number of test records per log (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    if args.records <= 0:
+        print("ERROR: --records must be a positive integer")
+        sys.exit(1)
+
+    for fmt in args.formats:
+        for path in write_format(fmt, args.output_dir, args.records, args.seed):
+            print(f"{fmt}: {path}")
+
+    waiver_path = os.path.join(args.output_dir, "waiver.json")
+    with open(waiver_path, "w", encoding="utf-8") as out:
+        json.dump(generate_waiver(args.formats), out, indent=2)
+    print(f"waiver: {waiver_path}")
+
+
+if __name__ == "__main__":
+    main()
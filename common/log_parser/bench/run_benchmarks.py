@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput benchmark for the log_parser pipeline.
+#
+# Every stage is run exactly as main_log_parser.sh runs it: one python3
+# process per script. Each child is reaped with os.wait4() so wall time and
+# CPU time are measured for that stage alone; stage_exec.py reports the
+# child's own peak RSS.
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from log_generators import generate_waiver, write_format
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_PARSER_DIR = os.path.dirname(BENCH_DIR)
+STAGE_EXEC = os.path.join(BENCH_DIR, "stage_exec.py")
+
+STAGES = ["parse", "waive", "render", "merge"]
+
+# Per format: parser script, waiver suite name and renderer script, all
+# relative to the log_parser directory.
+PIPELINES = {
+    "bsa": ("bsa/logs_to_json.py", "BSA", "bsa/json_to_html.py"),
+    "fwts": ("bbr/fwts/logs_to_json.py", "FWTS", "bbr/fwts/json_to_html.py"),
+    "sct": ("bbr/sct/logs_to_json.py", "SCT", "bbr/sct/json_to_html.py"),
+    "scmi": ("scmi/logs_to_json.py", "SCMI", "scmi/json_to_html.py"),
+    "pfdi": ("pfdi/logs_to_json.py", "PFDI", "pfdi/json_to_html.py"),
+    "sbmr": ("sbmr/logs_to_json.py", "SBMR", "sbmr/json_to_html.py"),
+}
+
+
+def count_input(paths):
+    """Return (bytes, lines) over all input files that exist."""
+    total_bytes = 0
+    total_lines = 0
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                total_bytes += len(chunk)
+                total_lines += chunk.count(b"\n")
+    return total_bytes, total_lines
+
+
+def run_stage(cmd, log_path):
+    """Run one stage script and return its exit code and resource usage."""
+    rss_path = log_path + ".rss"
+    if os.path.exists(rss_path):
+        os.remove(rss_path)
+    with open(log_path, "w", encoding="utf-8") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, STAGE_EXEC, rss_path, *cmd],
+                                stdout=log, stderr=subprocess.STDOUT, cwd=LOG_PARSER_DIR)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    # Popen still owns the pid; record the status so it does not reap again.
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    try:
+        with open(rss_path, "r", encoding="ascii") as rss:
+            peak_rss_kb = int(rss.read().strip())
+    except (OSError, ValueError):
+        # No /proc (e.g. macOS): fall back to ru_maxrss, which is bytes there.
+        peak_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return {
+        "returncode": proc.returncode,
+        "wall_time_s": wall,
+        "cpu_time_s": usage.ru_utime + usage.ru_stime,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def measure(cmd, inputs, log_path, repeat):
+    """Run a stage repeat times and keep the fastest wall time and largest RSS."""
+    input_bytes, input_lines = count_input(inputs)
+    best = None
+    peak_rss_kb = 0
+    for _ in range(repeat):
+        sample = run_stage(cmd, log_path)
+        # every repeat counts towards the peak, not only the fastest one
+        peak_rss_kb = max(peak_rss_kb, sample["peak_rss_kb"])
+        if sample["returncode"] != 0:
+            best = sample
+            break
+        if best is None or sample["wall_time_s"] < best["wall_time_s"]:
+            best = sample
+    best["peak_rss_kb"] = peak_rss_kb
+    best["input_bytes"] = input_bytes
+    best["input_lines"] = input_lines
+    wall = best["wall_time_s"]
+    best["lines_per_sec"] = round(input_lines / wall, 1) if wall > 0 else 0.0
+    best["status"] = "ok" if best["returncode"] == 0 else "failed"
+    if best["status"] == "failed":
+        with open(log_path, "r", encoding="utf-8", errors="replace") as log:
+            best["error"] = log.read()[-2000:].strip()
+    return best
+
+
+def bench_records(formats, stages, records, seed, work_dir, repeat):
+    """Benchmark every requested stage for one input size."""
+    results = []
+    case_dir = os.path.join(work_dir, f"records_{records}")
+    logs_dir = os.path.join(case_dir, "acs_results")
+    jsons_dir = os.path.join(case_dir, "acs_jsons")
+    htmls_dir = os.path.join(case_dir, "html_detailed_summaries")
+    stage_logs = os.path.join(case_dir, "stage_logs")
+    for path in (jsons_dir, htmls_dir, stage_logs):
+        os.makedirs(path, exist_ok=True)
+
+    waiver_path = os.path.join(case_dir, "waiver.json")
+    with open(waiver_path, "w", encoding="utf-8") as out:
+        json.dump(generate_waiver(formats), out, indent=2)
+
+    def record(fmt, stage, cmd, inputs):
+        entry = {"format": fmt, "records": records, "stage": stage}
+        entry.update(measure(cmd, inputs, os.path.join(stage_logs, f"{fmt}_{stage}.log"), repeat))
+        results.append(entry)
+        print(f"  {fmt:<6} {stage:<7} {entry['status']:<7} "
+              f"{entry['wall_time_s']:8.3f}s {entry['lines_per_sec']:12.1f} lines/s "
+              f"{entry['peak_rss_kb']:8d} KiB")
+        return entry["status"] == "ok"
+
+    parsed_jsons = []
+    for fmt in formats:
+        parser_script, suite_name, html_script = PIPELINES[fmt]
+        logs = write_format(fmt, logs_dir, records, seed)
+        out_json = os.path.join(jsons_dir, f"{fmt}.json")
+
+        # Later stages read the parser output, so they only run if it exists.
+        if "parse" in stages or not os.path.isfile(out_json):
+            cmd = [parser_script, *logs, out_json]
+            if not record(fmt, "parse", cmd, logs):
+                continue
+        parsed_jsons.append(out_json)
+
+        if "waive" in stages:
+            cmd = ["apply_waivers.py", suite_name, out_json, waiver_path, "--quiet"]
+            record(fmt, "waive", cmd, [out_json])
+
+        if "render" in stages:
+            cmd = [html_script, out_json,
+                   os.path.join(htmls_dir, f"{fmt}_detailed.html"),
+                   os.path.join(htmls_dir, f"{fmt}_summary.html")]
+            record(fmt, "render", cmd, [out_json])
+
+    if "merge" in stages and parsed_jsons:
+        merged_json = os.path.join(jsons_dir, "merged_results.json")
+        cmd = ["merge_jsons.py", merged_json, *parsed_jsons]
+        record("all", "merge", cmd, parsed_jsons)
+
+    return results
+
+
+def compare_with_baseline(results, baseline_path, max_regression):
+    """Return regression messages for stages slower than the baseline allows."""
+    with open(baseline_path, "r", encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    previous = {
+        (entry["format"], entry["records"], entry["stage"]): entry
+        for entry in baseline.get("results", [])
+        if entry.get("status") == "ok"
+    }
+    regressions = []
+    for entry in results:
+        key = (entry["format"], entry["records"], entry["stage"])
+        old = previous.get(key)
+        if entry["status"] != "ok" or old is None or old["wall_time_s"] <= 0:
+            continue
+        ratio = entry["wall_time_s"] / old["wall_time_s"]
+        if ratio > 1.0 + max_regression:
+            regressions.append(
+                f"{key[0]} {key[2]} @ {key[1]} records: {old['wall_time_s']:.3f}s -> "
+                f"{entry['wall_time_s']:.3f}s ({(ratio - 1.0) * 100:.0f}% slower)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark log_parser stages (parse, waive, render, merge) on synthetic logs."
+    )
+    parser.add_argument("--formats", nargs="+", choices=sorted(PIPELINES), default=sorted(PIPELINES),
+                        help="Log formats to benchmark (default: all)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES,
+                        help="Stages to measure (default: all)")
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10000],
+                        help="Input sizes as approximate test records per log (default: 1000 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the generators (default: 0)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Runs per stage; the fastest wall time is reported (default: 1)")
+    parser.add_argument("--output", help="Write the results JSON to this file")
+    parser.add_argument("--work-dir", help="Keep generated logs and outputs in this directory")
+    parser.add_argument("--baseline", help="Results JSON from a previous run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed wall time increase over the baseline as a fraction (default: 0.25)")
+    args = parser.parse_args()
+
+    if args.repeat <= 0 or any(n <= 0 for n in args.records):
+        print("ERROR: --repeat and --records must be positive integers")
+        sys.exit(1)
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="log_parser_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+
+    results = []
+    try:
+        for records in args.records:
+            print(f"Benchmarking {records} records per log:")
+            results.extend(
+                bench_records(args.formats, args.stages, records, args.seed, work_dir, args.repeat)
+            )
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+        print(f"Benchmark results: {args.output}")
+
+    exit_code = 0
+    if any(entry["status"] != "ok" for entry in results):
+        print("WARNING: some stages failed; see the 'error' field in the results.")
+        exit_code = 2
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.max_regression)
+        for message in regressions:
+            print(f"REGRESSION: {message}")
+        if regressions:
+            exit_code = 3
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
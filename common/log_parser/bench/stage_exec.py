@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Run one log_parser script as __main__ and record its own peak RSS.
+#
+# Linux carries ru_maxrss across fork/exec, so a child reaped by the
+# benchmark would report at least the parent's peak. VmHWM belongs to the
+# exec'd address space only, so it is read here just before the script exits.
+#
+# Usage: stage_exec.py <rss_out_file> <script.py> [script args...]
+
+import atexit
+import os
+import runpy
+import sys
+
+
+def read_vm_hwm_kb():
+    """Return VmHWM in KiB from /proc/self/status, or None if unavailable."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: stage_exec.py <rss_out_file> <script.py> [args...]")
+        sys.exit(1)
+
+    rss_out = sys.argv[1]
+    script = os.path.abspath(sys.argv[2])
+
+    def write_rss():
+        peak = read_vm_hwm_kb()
+        if peak is not None:
+            with open(rss_out, "w", encoding="ascii") as out:
+                out.write(f"{peak}\n")
+
+    atexit.register(write_rss)
+    sys.argv = [script, *sys.argv[3:]]
+    sys.path[0] = os.path.dirname(script)
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
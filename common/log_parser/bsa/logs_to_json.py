@@ -16,6 +16,7 @@
 
 import argparse
 import chardet
+import copy
 import json
 import re
 import sys
@@ -280,295 +281,334 @@ def merge_matching_subtests(existing_subtests, override_subtests):
             existing_by_key[key].clear()
             existing_by_key[key].update(override)
 
-def main(input_files, output_file):
-    # Per-suite list of testcases
-    testcases_per_suite = defaultdict(list)
-    # Per-suite summary
-    suite_summaries = defaultdict(init_summary)
-    # Global summary
-    total_summary = init_summary()
-
-    for input_file in input_files:
+def source_from_path(input_file):
+    # stdin carries the live kernel log from kmsg_capture.py
+    if input_file == "-":
+        return "linux"
+    lower_path = input_file.lower()
+    if "/linux" in lower_path or "bsaresultskernel" in lower_path or "/linux_acs" in lower_path:
+        return "linux"
+    if "/uefi" in lower_path:
+        return "uefi"
+    return "unknown"
+
+class BsaLogParser:
+    """Line-at-a-time BSA/SBSA parser.
+
+    Completed testcases accumulate across files; feed_line() can be called as
+    a log grows and build_output() snapshots the current results without
+    disturbing the parse state (used by watch_results.py).
+    """
+
+    def __init__(self):
+        # Per-suite list of testcases
+        self.testcases_per_suite = defaultdict(list)
+        # Per-suite summary
+        self.suite_summaries = defaultdict(init_summary)
+        # Global summary
+        self.total_summary = init_summary()
+        self.start_file("")
+
+    def start_file(self, input_file):
         # Parsing state is file-local. Completed testcases are accumulated
         # across files, but an unfinished rule/marker/suite must not leak into
         # the next log.
-        rule_stack = []
-        marker_stack = []
-        current_suite = ""
-        processing = False
-
-        lower_path = input_file.lower()
-        if "/linux" in lower_path or "bsaresultskernel" in lower_path or "/linux_acs" in lower_path:
-            current_source = "linux"
-        elif "/uefi" in lower_path:
-            current_source = "uefi"
-        else:
-            current_source = "unknown"
+        self.rule_stack = []
+        self.marker_stack = []
+        self.current_suite = ""
+        self.processing = False
+        self.current_source = source_from_path(input_file)
+
+    def parse_file(self, input_file):
+        self.start_file(input_file)
         file_encoding = detect_file_encoding(input_file)
 
         with open(input_file, "r", encoding=file_encoding, errors="ignore") as f:
             lines = f.read().splitlines()
 
-        i = 0
-        while i < len(lines):
-            raw_line = lines[i]
-            i += 1
-
-            line_no_timestamp = normalize_log_line(raw_line)
-
-            # Strip leading spaces before matching. Nesting comes from explicit
-            # referenced-rule markers, not indentation.
-            line = line_no_timestamp.strip()
-
-            if not line:
-                continue
-
-            # Start processing when we see Selected rules / Running tests / START (old format)
-            # or "*** Running <suite> tests ***" (new format)
-            if not processing and (
-                "---------------------- Running tests ------------------------" in line
-                or "Selected rules:" in line
-                or re.search(r'\bSTART\s+', line)
-                or "*** Running " in line
-            ):
-                processing = True
-
-            if not processing:
-                continue
-
-            # ---------------- New log format support ----------------
-            # Newer BSA/SBSA logs can nest rule groups:
-            #   <PARENT_RULE> : <index> : <description>
-            #     === Start tests for rules referenced by <PARENT_RULE> ===
-            #     <CHILD_RULE> : <index> : <description>
-            #       Result: <status text>
-            #     === End tests for rules referenced by <PARENT_RULE> ===
-            #   Result: <status text>
-            suite_hdr = SUITE_HEADER_RE.search(line)
-            if suite_hdr:
-                current_suite = suite_hdr.group(1).strip().replace(" ", "_")
-
-            referenced_rules_marker = REFERENCED_RULES_MARKER_RE.search(line)
-            if referenced_rules_marker:
-                marker_action = referenced_rules_marker.group(1).lower()
-                marker_rule_id = referenced_rules_marker.group(2).strip()
-                if marker_action == "start":
-                    # The marker names the parent rule. Children that follow
-                    # should be attached under this open parent frame.
-                    frame_idx = find_frame_from_top(rule_stack, marker_rule_id)
-                    if frame_idx is not None:
-                        marker_stack.append(rule_stack[frame_idx])
-                else:
-                    # End marker closes the current parent scope, but does not
-                    # complete the parent rule. The following Result line does.
-                    for marker_idx in range(len(marker_stack) - 1, -1, -1):
-                        if marker_stack[marker_idx].get("rule_id") == marker_rule_id:
-                            marker_stack.pop(marker_idx)
-                            break
-
-            # RULE line. Start/End referenced-by markers provide explicit parent
-            # scope for nested logs.
-            rule_line = RULE_LINE_RE.search(line)
-            if rule_line:
-                rule_id = rule_line.group(1).strip()
-                test_index = (rule_line.group(2) or "").strip() or "-"
-                desc = (rule_line.group(3) or "").strip()
-                suite = current_suite or ""
-                inline_result = RESULT_RE.search(desc)
-                status_text = ""
-                if inline_result:
-                    # Compact logs may print "RULE : idx : desc Result: PASS".
-                    # Split it so Result is not stored as part of description.
-                    status_text = extract_status_text(inline_result.group(1))
-                    desc = desc[:inline_result.start()].strip()
-
-                parent = marker_stack[-1] if marker_stack else None
-                if parent is None and rule_stack:
-                    # A new top-level rule should only appear after the previous
-                    # top-level result. If a malformed log leaves frames open,
-                    # clear them instead of guessing a parent from whitespace.
-                    rule_stack.clear()
-                    marker_stack.clear()
-
-                frame = make_rule_frame(
-                    suite, rule_id, test_index, desc, parent, current_source
-                )
-                if inline_result:
-                    formatted_result, summary_category = classify_status(status_text)
-                    complete_rule_frame(
-                        frame,
-                        formatted_result,
-                        summary_category,
-                        testcases_per_suite,
-                        suite_summaries,
-                        total_summary
-                    )
-                else:
-                    rule_stack.append(frame)
-                continue
-
-            # In the new log format, Result closes the most recently opened rule.
-            # That rule is either emitted as a testcase or attached to its parent.
-            result_match = RESULT_RE.search(line)
-            if result_match:
-                status_text = extract_status_text(result_match.group(1))
-                if not rule_stack:
-                    continue
-
-                frame = rule_stack.pop()
-                remove_marker_frame(marker_stack, frame)
+        for raw_line in lines:
+            self.feed_line(raw_line)
+
+    def parse_stream(self, stream, input_file="-"):
+        # Lines are parsed as they arrive, so a pipe from a running capture
+        # is consumed live instead of after the run.
+        self.start_file(input_file)
+        for raw_line in stream:
+            self.feed_line(raw_line.rstrip("\r\n"))
+
+    def feed_line(self, raw_line):
+        line_no_timestamp = normalize_log_line(raw_line)
+
+        # Strip leading spaces before matching. Nesting comes from explicit
+        # referenced-rule markers, not indentation.
+        line = line_no_timestamp.strip()
+
+        if not line:
+            return
+
+        # Start processing when we see Selected rules / Running tests / START (old format)
+        # or "*** Running <suite> tests ***" (new format)
+        if not self.processing and (
+            "---------------------- Running tests ------------------------" in line
+            or "Selected rules:" in line
+            or re.search(r'\bSTART\s+', line)
+            or "*** Running " in line
+        ):
+            self.processing = True
+
+        if not self.processing:
+            return
+
+        # ---------------- New log format support ----------------
+        # Newer BSA/SBSA logs can nest rule groups:
+        #   <PARENT_RULE> : <index> : <description>
+        #     === Start tests for rules referenced by <PARENT_RULE> ===
+        #     <CHILD_RULE> : <index> : <description>
+        #       Result: <status text>
+        #     === End tests for rules referenced by <PARENT_RULE> ===
+        #   Result: <status text>
+        suite_hdr = SUITE_HEADER_RE.search(line)
+        if suite_hdr:
+            self.current_suite = suite_hdr.group(1).strip().replace(" ", "_")
+
+        referenced_rules_marker = REFERENCED_RULES_MARKER_RE.search(line)
+        if referenced_rules_marker:
+            marker_action = referenced_rules_marker.group(1).lower()
+            marker_rule_id = referenced_rules_marker.group(2).strip()
+            if marker_action == "start":
+                # The marker names the parent rule. Children that follow
+                # should be attached under this open parent frame.
+                frame_idx = find_frame_from_top(self.rule_stack, marker_rule_id)
+                if frame_idx is not None:
+                    self.marker_stack.append(self.rule_stack[frame_idx])
+            else:
+                # End marker closes the current parent scope, but does not
+                # complete the parent rule. The following Result line does.
+                for marker_idx in range(len(self.marker_stack) - 1, -1, -1):
+                    if self.marker_stack[marker_idx].get("rule_id") == marker_rule_id:
+                        self.marker_stack.pop(marker_idx)
+                        break
+
+        # RULE line. Start/End referenced-by markers provide explicit parent
+        # scope for nested logs.
+        rule_line = RULE_LINE_RE.search(line)
+        if rule_line:
+            rule_id = rule_line.group(1).strip()
+            test_index = (rule_line.group(2) or "").strip() or "-"
+            desc = (rule_line.group(3) or "").strip()
+            suite = self.current_suite or ""
+            inline_result = RESULT_RE.search(desc)
+            status_text = ""
+            if inline_result:
+                # Compact logs may print "RULE : idx : desc Result: PASS".
+                # Split it so Result is not stored as part of description.
+                status_text = extract_status_text(inline_result.group(1))
+                desc = desc[:inline_result.start()].strip()
+
+            parent = self.marker_stack[-1] if self.marker_stack else None
+            if parent is None and self.rule_stack:
+                # A new top-level rule should only appear after the previous
+                # top-level result. If a malformed log leaves frames open,
+                # clear them instead of guessing a parent from whitespace.
+                self.rule_stack.clear()
+                self.marker_stack.clear()
+
+            frame = make_rule_frame(
+                suite, rule_id, test_index, desc, parent, self.current_source
+            )
+            if inline_result:
                 formatted_result, summary_category = classify_status(status_text)
                 complete_rule_frame(
                     frame,
                     formatted_result,
                     summary_category,
-                    testcases_per_suite,
-                    suite_summaries,
-                    total_summary
+                    self.testcases_per_suite,
+                    self.suite_summaries,
+                    self.total_summary
                 )
-                continue
-            # -------------- End new log format support --------------
-
-            #   START <suite_or_dash> <RULE_ID> <index_or_dash> : <description...>
-            # Old-format START/END logs use the same stack. Flat old logs stay
-            # flat unless explicit referenced-rule markers provide parent scope.
-            start_match = re.search(
-                r'\bSTART\s+([^\s:]+)\s+([A-Za-z0-9_]+)\s+([^\s:]+)\s*:\s*(.*)$',
-                line
+            else:
+                self.rule_stack.append(frame)
+            return
+
+        # In the new log format, Result closes the most recently opened rule.
+        # That rule is either emitted as a testcase or attached to its parent.
+        result_match = RESULT_RE.search(line)
+        if result_match:
+            status_text = extract_status_text(result_match.group(1))
+            if not self.rule_stack:
+                return
+
+            frame = self.rule_stack.pop()
+            remove_marker_frame(self.marker_stack, frame)
+            formatted_result, summary_category = classify_status(status_text)
+            complete_rule_frame(
+                frame,
+                formatted_result,
+                summary_category,
+                self.testcases_per_suite,
+                self.suite_summaries,
+                self.total_summary
             )
-            if start_match:
-                suite_tok = start_match.group(1).strip()
-                rule_id = start_match.group(2).strip()
-                index_tok = start_match.group(3).strip()
-                desc = (start_match.group(4) or "").strip()
-
-                # Update current suite unless '-'
-                if suite_tok != "-":
-                    current_suite = suite_tok
-
-                if not current_suite:
-                    # Leave empty if genuinely unknown, but usually logs set it.
-                    current_suite = ""
-
-                # Normalize index
-                test_index = index_tok if index_tok != "" else "-"
-
-                parent = marker_stack[-1] if marker_stack else None
-                if parent is None and rule_stack:
-                    rule_stack.clear()
-                    marker_stack.clear()
-
-                rule_stack.append(
-                    make_rule_frame(current_suite, rule_id, test_index, desc, parent, current_source)
-                )
-                continue
-
-            # END line:
-            #   END <RULE_ID> <status text...>
-            end_match = re.search(r'\bEND\s+([A-Za-z0-9_]+)\s+(.*)$', line)
-            if end_match:
-                rule_id = end_match.group(1).strip()
-                status_text = extract_status_text(end_match.group(2))
-
-                formatted_result, summary_category = classify_status(status_text)
-
-                # END names the rule being closed. Search from the top of the
-                # stack so repeated rule IDs close the nearest matching instance.
-                frame_idx = find_frame_from_top(rule_stack, rule_id)
-                if frame_idx is None:
+            return
+        # -------------- End new log format support --------------
+
+        #   START <suite_or_dash> <RULE_ID> <index_or_dash> : <description...>
+        # Old-format START/END logs use the same stack. Flat old logs stay
+        # flat unless explicit referenced-rule markers provide parent scope.
+        start_match = re.search(
+            r'\bSTART\s+([^\s:]+)\s+([A-Za-z0-9_]+)\s+([^\s:]+)\s*:\s*(.*)$',
+            line
+        )
+        if start_match:
+            suite_tok = start_match.group(1).strip()
+            rule_id = start_match.group(2).strip()
+            index_tok = start_match.group(3).strip()
+            desc = (start_match.group(4) or "").strip()
+
+            # Update current suite unless '-'
+            if suite_tok != "-":
+                self.current_suite = suite_tok
+
+            if not self.current_suite:
+                # Leave empty if genuinely unknown, but usually logs set it.
+                self.current_suite = ""
+
+            # Normalize index
+            test_index = index_tok if index_tok != "" else "-"
+
+            parent = self.marker_stack[-1] if self.marker_stack else None
+            if parent is None and self.rule_stack:
+                self.rule_stack.clear()
+                self.marker_stack.clear()
+
+            self.rule_stack.append(
+                make_rule_frame(self.current_suite, rule_id, test_index, desc, parent, self.current_source)
+            )
+            return
+
+        # END line:
+        #   END <RULE_ID> <status text...>
+        end_match = re.search(r'\bEND\s+([A-Za-z0-9_]+)\s+(.*)$', line)
+        if end_match:
+            rule_id = end_match.group(1).strip()
+            status_text = extract_status_text(end_match.group(2))
+
+            formatted_result, summary_category = classify_status(status_text)
+
+            # END names the rule being closed. Search from the top of the
+            # stack so repeated rule IDs close the nearest matching instance.
+            frame_idx = find_frame_from_top(self.rule_stack, rule_id)
+            if frame_idx is None:
+                return
+
+            frame = self.rule_stack.pop(frame_idx)
+            remove_marker_frame(self.marker_stack, frame)
+            complete_rule_frame(
+                frame,
+                formatted_result,
+                summary_category,
+                self.testcases_per_suite,
+                self.suite_summaries,
+                self.total_summary
+            )
+            return
+
+    def build_output(self, consume=False):
+        # Post-processing pops/overrides fields, so work on a copy and keep
+        # the accumulated testcases intact for further feed_line() calls.
+        # A one-shot run that builds once passes consume=True and skips it.
+        if consume:
+            testcases_per_suite = self.testcases_per_suite
+        else:
+            testcases_per_suite = copy.deepcopy(self.testcases_per_suite)
+
+        # Post-process UEFI/Linux duplicates per testcase
+        processed_testcases = defaultdict(list)
+        for suite_name, tcs in testcases_per_suite.items():
+            seen = defaultdict(list)
+            for tc in tcs:
+                key = tc.get("Test_case")
+                src = tc.pop("_source", "unknown")
+
+                # Only merge duplicates when they are the known UEFI/Linux pair.
+                # Other same-key entries are independent runs and must stay visible.
+                existing = None
+                for candidate in seen.get(key, []):
+                    if {candidate["source"], src} == {"uefi", "linux"}:
+                        existing = candidate
+                        break
+
+                if existing is None:
+                    seen[key].append({"source": src, "index": len(processed_testcases[suite_name])})
+                    processed_testcases[suite_name].append(tc)
                     continue
 
-                frame = rule_stack.pop(frame_idx)
-                remove_marker_frame(marker_stack, frame)
-                complete_rule_frame(
-                    frame,
-                    formatted_result,
-                    summary_category,
-                    testcases_per_suite,
-                    suite_summaries,
-                    total_summary
-                )
-                continue
+                # Keep UEFI as the base testcase; only override matching fields from Linux.
+                existing_tc = processed_testcases[suite_name][existing["index"]]
+                existing_src = existing["source"]
 
-            # Ignore all other lines (debug, informational, etc.)
-            continue
-
-    # Post-process UEFI/Linux duplicates per testcase
-    processed_testcases = defaultdict(list)
-    for suite_name, tcs in testcases_per_suite.items():
-        seen = defaultdict(list)
-        for tc in tcs:
-            key = tc.get("Test_case")
-            src = tc.pop("_source", "unknown")
-
-            # Only merge duplicates when they are the known UEFI/Linux pair.
-            # Other same-key entries are independent runs and must stay visible.
-            existing = None
-            for candidate in seen.get(key, []):
-                if {candidate["source"], src} == {"uefi", "linux"}:
-                    existing = candidate
-                    break
-
-            if existing is None:
-                seen[key].append({"source": src, "index": len(processed_testcases[suite_name])})
-                processed_testcases[suite_name].append(tc)
+                # Ensure UEFI testcase is the base.
+                if src == "uefi" and existing_src != "uefi":
+                    linux_tc = existing_tc
+                    existing_tc = tc
+                    processed_testcases[suite_name][existing["index"]] = existing_tc
+                    existing["source"] = src
+                else:
+                    linux_tc = tc if src == "linux" else None
+
+                if linux_tc:
+                    # For B_PER_08, keep UEFI testcase result. For other duplicate
+                    # testcases, Linux has the final testcase-level result.
+                    if key != "B_PER_08 : -":
+                        existing_tc["Test_result"] = linux_tc.get("Test_result")
+                        existing_tc["Test_case_summary"] = linux_tc.get("Test_case_summary")
+
+                    # Override only matching subtests. Linux-only subtests are not
+                    # appended because the UEFI tree is the report structure.
+                    merge_matching_subtests(
+                        existing_tc.get("subtests", []),
+                        linux_tc.get("subtests", []) or []
+                    )
                 continue
 
-            # Keep UEFI as the base testcase; only override matching fields from Linux.
-            existing_tc = processed_testcases[suite_name][existing["index"]]
-            existing_src = existing["source"]
+        testcases_per_suite = processed_testcases
+
+        # Recompute summaries from processed testcases
+        suite_summaries = defaultdict(init_summary)
+        total_summary = init_summary()
+        for suite_name, tcs in testcases_per_suite.items():
+            for tc in tcs:
+                formatted_result, summary_category = classify_status(tc.get("Test_result"))
+                update_summary_counts(suite_summaries[suite_name], summary_category, formatted_result)
+                update_summary_counts(total_summary, summary_category, formatted_result)
+
+        # Build final JSON structure
+        output = {
+            "test_results": [],
+            "suite_summary": total_summary
+        }
 
-            # Ensure UEFI testcase is the base.
-            if src == "uefi" and existing_src != "uefi":
-                linux_tc = existing_tc
-                existing_tc = tc
-                processed_testcases[suite_name][existing["index"]] = existing_tc
-                existing["source"] = src
-            else:
-                linux_tc = tc if src == "linux" else None
-
-            if linux_tc:
-                # For B_PER_08, keep UEFI testcase result. For other duplicate
-                # testcases, Linux has the final testcase-level result.
-                if key != "B_PER_08 : -":
-                    existing_tc["Test_result"] = linux_tc.get("Test_result")
-                    existing_tc["Test_case_summary"] = linux_tc.get("Test_case_summary")
-
-                # Override only matching subtests. Linux-only subtests are not
-                # appended because the UEFI tree is the report structure.
-                merge_matching_subtests(
-                    existing_tc.get("subtests", []),
-                    linux_tc.get("subtests", []) or []
-                )
-            continue
-
-    testcases_per_suite = processed_testcases
-
-    # Recompute summaries from processed testcases
-    suite_summaries = defaultdict(init_summary)
-    total_summary = init_summary()
-    for suite_name, tcs in testcases_per_suite.items():
-        for tc in tcs:
-            formatted_result, summary_category = classify_status(tc.get("Test_result"))
-            update_summary_counts(suite_summaries[suite_name], summary_category, formatted_result)
-            update_summary_counts(total_summary, summary_category, formatted_result)
-
-    # Build final JSON structure
-    output = {
-        "test_results": [],
-        "suite_summary": total_summary
-    }
+        # Deterministic ordering by suite name
+        for suite_name in sorted(testcases_per_suite.keys()):
+            suite_obj = {
+                "Test_suite": suite_name,
+                "testcases": testcases_per_suite[suite_name],
+                "test_suite_summary": suite_summaries[suite_name]
+            }
+            output["test_results"].append(suite_obj)
 
-    # Deterministic ordering by suite name
-    for suite_name in sorted(testcases_per_suite.keys()):
-        suite_obj = {
-            "Test_suite": suite_name,
-            "testcases": testcases_per_suite[suite_name],
-            "test_suite_summary": suite_summaries[suite_name]
-        }
-        output["test_results"].append(suite_obj)
+        return output
+
+def main(input_files, output_file):
+    parser = BsaLogParser()
+    for input_file in input_files:
+        if input_file == "-":
+            parser.parse_stream(sys.stdin)
+        else:
+            parser.parse_file(input_file)
+    output = parser.build_output(consume=True)
 
-    acs_run_true = total_summary.get("Total Rules Run", 0) > 0
+    acs_run_true = output["suite_summary"].get("Total Rules Run", 0) > 0
     if not acs_run_true:
         sys.exit(1)
 
@@ -579,7 +619,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Parse BSA ACS log files and save results to a JSON file."
     )
-    parser.add_argument("input_files", nargs="+", help="Input log files")
+    parser.add_argument("input_files", nargs="+",
+                        help="Input log files; '-' reads a live kernel log stream from stdin")
     parser.add_argument("output_file", help="Output JSON file")
 
     args = parser.parse_args()
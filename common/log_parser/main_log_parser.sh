@@ -25,9 +25,27 @@ BASE_DIR=$(dirname "$(realpath "$0")")
 # Determine paths
 SCRIPTS_PATH="$BASE_DIR"
 
+# Optional per-stage profiling (see pipeline_profile.py). Enabled with
+# ACS_PIPELINE_PROFILE=1 or --profile; --profile-trace (or
+# ACS_PIPELINE_TRACE=1) also writes a Chrome trace. Flags may appear anywhere.
+PIPELINE_PROFILE="${ACS_PIPELINE_PROFILE:-0}"
+PIPELINE_TRACE="${ACS_PIPELINE_TRACE:-0}"
+POSITIONAL_ARGS=()
+for arg in "$@"; do
+    case "$arg" in
+        --profile) PIPELINE_PROFILE=1 ;;
+        --profile-trace) PIPELINE_PROFILE=1; PIPELINE_TRACE=1 ;;
+        *) POSITIONAL_ARGS+=("$arg") ;;
+    esac
+done
+set -- "${POSITIONAL_ARGS[@]}"
+if [ "$PIPELINE_TRACE" = "1" ]; then
+    PIPELINE_PROFILE=1
+fi
+
 # Check for required arguments
 if [ $# -lt 1 ]; then
-    echo "Usage: $0 <acs_results_directory> [acs_config.txt] [system_config.txt] [waiver.json]"
+    echo "Usage: $0 <acs_results_directory> [acs_config.txt] [system_config.txt] [waiver.json] [--profile] [--profile-trace]"
     exit 1
 fi
 
@@ -80,10 +98,31 @@ JSONS_DIR="$ACS_SUMMARY_DIR/acs_jsons"
 mkdir -p "$ACS_SUMMARY_DIR"
 mkdir -p "$JSONS_DIR"
 
+PROFILE_EVENTS="$ACS_SUMMARY_DIR/pipeline_profile.events.jsonl"
+if [ "$PIPELINE_PROFILE" = "1" ]; then
+    rm -f "$PROFILE_EVENTS"
+fi
+
+# Run one python3 stage: run_stage <suite> <stage> <script.py|-c code> [args...]
+# Without profiling this is a plain python3 call. ACS_PARSER_PROFILE
+# (cprofile,tracemalloc) dumps profiles next to each stage's JSON.
+run_stage() {
+    local suite="$1"
+    local stage="$2"
+    shift 2
+    if [ "$PIPELINE_PROFILE" = "1" ]; then
+        python3 "$SCRIPTS_PATH/pipeline_profile.py" record "$PROFILE_EVENTS" "$suite" "$stage" "$@"
+    elif [ -n "$ACS_PARSER_PROFILE" ]; then
+        python3 "$SCRIPTS_PATH/parser_profile.py" "$@"
+    else
+        python3 "$@"
+    fi
+}
+
 #echo "Gathering ACS info into acs_info.txt and acs_info.json..."
 IPMITOOL_LOG="$LOGS_PATH/linux_dump/ipmitool.txt"
 PSCI_KERNEL_LOG="$LOGS_PATH/linux_tools/psci/psci_kernel.log"
-python3 "$SCRIPTS_PATH/acs_info.py" \
+run_stage ACS_INFO info "$SCRIPTS_PATH/acs_info.py" \
     --acs_config_path "$ACS_CONFIG_PATH" \
     --system_config_path "$SYSTEM_CONFIG_PATH" \
     --uefi_version_log "$LOGS_PATH/uefi_dump/uefi_version.log" \
@@ -141,7 +180,7 @@ apply_waivers() {
     local json_file="$2"
 
     if [ "$WAIVERS_APPLIED" -eq 1 ]; then
-        python3 "$SCRIPTS_PATH/apply_waivers.py" "$suite_name" "$json_file" "$WAIVER_JSON" "$test_category" --quiet
+        run_stage "$suite_name" waive "$SCRIPTS_PATH/apply_waivers.py" "$suite_name" "$json_file" "$WAIVER_JSON" "$test_category" --quiet
     fi
 }
 
@@ -196,13 +235,13 @@ fi
 
 if [ ${#BSA_LOGS[@]} -gt 0 ]; then
     BSA_PROCESSED=1
-    python3 "$SCRIPTS_PATH/bsa/logs_to_json.py" "${BSA_LOGS[@]}" "$BSA_JSON"
+    run_stage BSA parse "$SCRIPTS_PATH/bsa/logs_to_json.py" "${BSA_LOGS[@]}" "$BSA_JSON"
     if [ $? -ne 0 ]; then
         BSA_PROCESSED=0
         echo -e "${RED}ERROR: BSA logs parsing to json failed.${NC}"
     else
         apply_waivers "BSA" "$BSA_JSON"
-        python3 "$SCRIPTS_PATH/bsa/json_to_html.py" "$BSA_JSON" "$HTMLS_DIR/bsa_detailed.html" "$HTMLS_DIR/bsa_summary.html"
+        run_stage BSA render "$SCRIPTS_PATH/bsa/json_to_html.py" "$BSA_JSON" "$HTMLS_DIR/bsa_detailed.html" "$HTMLS_DIR/bsa_summary.html"
     fi
 fi
 
@@ -235,13 +274,13 @@ if [ $YOCTO_FLAG_PRESENT -eq 0 ]; then
 
     if [ ${#SBSA_LOGS[@]} -gt 0 ]; then
         SBSA_PROCESSED=1
-        python3 "$SCRIPTS_PATH/bsa/logs_to_json.py" "${SBSA_LOGS[@]}" "$SBSA_JSON"
+        run_stage SBSA parse "$SCRIPTS_PATH/bsa/logs_to_json.py" "${SBSA_LOGS[@]}" "$SBSA_JSON"
         if [ $? -ne 0 ]; then
             SBSA_PROCESSED=0
             echo -e "${RED}ERROR: SBSA logs parsing to json failed.${NC}"
         else
             apply_waivers "SBSA" "$SBSA_JSON"
-            python3 "$SCRIPTS_PATH/bsa/json_to_html.py" "$SBSA_JSON" "$HTMLS_DIR/sbsa_detailed.html" "$HTMLS_DIR/sbsa_summary.html"
+            run_stage SBSA render "$SCRIPTS_PATH/bsa/json_to_html.py" "$SBSA_JSON" "$HTMLS_DIR/sbsa_detailed.html" "$HTMLS_DIR/sbsa_summary.html"
         fi
     fi
 fi
@@ -253,13 +292,13 @@ FWTS_LOG="$LOGS_PATH/fwts/FWTSResults.log"
 FWTS_JSON="$JSONS_DIR/fwts.json"
 if check_file "$FWTS_LOG" "M"; then
     FWTS_PROCESSED=1
-    python3 "$SCRIPTS_PATH/bbr/fwts/logs_to_json.py" "$FWTS_LOG" "$FWTS_JSON"
+    run_stage FWTS parse "$SCRIPTS_PATH/bbr/fwts/logs_to_json.py" "$FWTS_LOG" "$FWTS_JSON"
     if [ $? -ne 0 ]; then
         FWTS_PROCESSED=0
         echo -e "${RED}ERROR: FWTS logs parsing to json failed.${NC}"
     else
         apply_waivers "FWTS" "$FWTS_JSON"
-        python3 "$SCRIPTS_PATH/bbr/fwts/json_to_html.py" "$FWTS_JSON" "$HTMLS_DIR/fwts_detailed.html" "$HTMLS_DIR/fwts_summary.html"
+        run_stage FWTS render "$SCRIPTS_PATH/bbr/fwts/json_to_html.py" "$FWTS_JSON" "$HTMLS_DIR/fwts_detailed.html" "$HTMLS_DIR/fwts_summary.html"
     fi
 fi
 
@@ -275,15 +314,15 @@ if check_file "$SCT_LOG" "M"; then
     SCT_PROCESSED=1
     # EDK2 Log Parsing: Process the edk2-test-parser.log
     if check_file "$EDK2_PARSER_LOG"; then
-        python3 "$SCRIPTS_PATH/bbr/sct/logs_to_json_edk2.py" "$EDK2_PARSER_LOG" "$EDK2_PARSER_JSON"
+        run_stage SCT parse "$SCRIPTS_PATH/bbr/sct/logs_to_json_edk2.py" "$EDK2_PARSER_LOG" "$EDK2_PARSER_JSON"
     fi
-    python3 "$SCRIPTS_PATH/bbr/sct/logs_to_json.py" "$SCT_LOG" "$SCT_JSON"
+    run_stage SCT parse "$SCRIPTS_PATH/bbr/sct/logs_to_json.py" "$SCT_LOG" "$SCT_JSON"
     if [ $? -ne 0 ]; then
         SCT_PROCESSED=0
         echo -e "${RED}ERROR: SCT logs parsing to json failed.${NC}"
     else
         apply_waivers "SCT" "$SCT_JSON"
-        python3 "$SCRIPTS_PATH/bbr/sct/json_to_html.py" "$SCT_JSON" "$HTMLS_DIR/sct_detailed.html" "$HTMLS_DIR/sct_summary.html"
+        run_stage SCT render "$SCRIPTS_PATH/bbr/sct/json_to_html.py" "$SCT_JSON" "$HTMLS_DIR/sct_detailed.html" "$HTMLS_DIR/sct_summary.html"
     fi
 fi
 
@@ -294,9 +333,9 @@ BBSR_FWTS_LOG="$LOGS_PATH/bbsr/fwts/FWTSResults.log"
 BBSR_FWTS_JSON="$JSONS_DIR/bbsr_fwts.json"
 if check_file "$BBSR_FWTS_LOG"; then
     BBSR_FWTS_PROCESSED=1
-    python3 "$SCRIPTS_PATH/bbr/fwts/logs_to_json.py" "$BBSR_FWTS_LOG" "$BBSR_FWTS_JSON"
+    run_stage BBSR-FWTS parse "$SCRIPTS_PATH/bbr/fwts/logs_to_json.py" "$BBSR_FWTS_LOG" "$BBSR_FWTS_JSON"
     apply_waivers "BBSR-FWTS" "$BBSR_FWTS_JSON"
-    python3 "$SCRIPTS_PATH/bbr/fwts/json_to_html.py" "$BBSR_FWTS_JSON" "$HTMLS_DIR/bbsr_fwts_detailed.html" "$HTMLS_DIR/bbsr_fwts_summary.html"
+    run_stage BBSR-FWTS render "$SCRIPTS_PATH/bbr/fwts/json_to_html.py" "$BBSR_FWTS_JSON" "$HTMLS_DIR/bbsr_fwts_detailed.html" "$HTMLS_DIR/bbsr_fwts_summary.html"
 fi
 
 ################################################################################
@@ -315,12 +354,12 @@ if check_file "$BBSR_SCT_LOG"; then
 
         # EDK2 Log Parsing: Process the edk2-test-parser.log
         if check_file "$BBSR_EDK2_PARSER_LOG"; then
-            python3 "$SCRIPTS_PATH/bbr/sct/logs_to_json_edk2.py" "$BBSR_EDK2_PARSER_LOG" "$BBSR_EDK2_PARSER_JSON"
+            run_stage BBSR-SCT parse "$SCRIPTS_PATH/bbr/sct/logs_to_json_edk2.py" "$BBSR_EDK2_PARSER_LOG" "$BBSR_EDK2_PARSER_JSON"
         fi
     fi
-    python3 "$SCRIPTS_PATH/bbr/sct/logs_to_json.py" "$BBSR_SCT_LOG" "$BBSR_SCT_JSON"
+    run_stage BBSR-SCT parse "$SCRIPTS_PATH/bbr/sct/logs_to_json.py" "$BBSR_SCT_LOG" "$BBSR_SCT_JSON"
     apply_waivers "BBSR-SCT" "$BBSR_SCT_JSON"
-    python3 "$SCRIPTS_PATH/bbr/sct/json_to_html.py" "$BBSR_SCT_JSON" "$HTMLS_DIR/bbsr_sct_detailed.html" "$HTMLS_DIR/bbsr_sct_summary.html"
+    run_stage BBSR-SCT render "$SCRIPTS_PATH/bbr/sct/json_to_html.py" "$BBSR_SCT_JSON" "$HTMLS_DIR/bbsr_sct_detailed.html" "$HTMLS_DIR/bbsr_sct_summary.html"
 fi
 
 ################################################################################
@@ -330,9 +369,9 @@ BBSR_TPM_LOG="$LOGS_PATH/bbsr/tpm2/verify_tpm_measurements.log"
 BBSR_TPM_JSON="$JSONS_DIR/bbsr_tpm.json"
 if check_file "$BBSR_TPM_LOG"; then
     BBSR_TPM_PROCESSED=1
-    python3 "$SCRIPTS_PATH/bbr/tpm/logs_to_json.py" "$BBSR_TPM_LOG" "$BBSR_TPM_JSON"
+    run_stage BBSR-TPM parse "$SCRIPTS_PATH/bbr/tpm/logs_to_json.py" "$BBSR_TPM_LOG" "$BBSR_TPM_JSON"
     apply_waivers "BBSR-TPM" "$BBSR_TPM_JSON"
-    python3 "$SCRIPTS_PATH/bbr/tpm/json_to_html.py" "$BBSR_TPM_JSON" "$HTMLS_DIR/bbsr_tpm_detailed.html" "$HTMLS_DIR/bbsr_tpm_summary.html"
+    run_stage BBSR-TPM render "$SCRIPTS_PATH/bbr/tpm/json_to_html.py" "$BBSR_TPM_JSON" "$HTMLS_DIR/bbsr_tpm_detailed.html" "$HTMLS_DIR/bbsr_tpm_summary.html"
 fi
 
 ################################################################################
@@ -345,11 +384,11 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
 
     if check_file "$PFDI_LOG" "CM"; then
         PFDI_PROCESSED=1
-        if python3 "$SCRIPTS_PATH/bsa/logs_to_json.py" \
+        if run_stage PFDI parse "$SCRIPTS_PATH/bsa/logs_to_json.py" \
                 "$PFDI_LOG" \
                 "$PFDI_JSON"; then
             apply_waivers "PFDI" "$PFDI_JSON"
-            python3 "$SCRIPTS_PATH/bsa/json_to_html.py" \
+            run_stage PFDI render "$SCRIPTS_PATH/bsa/json_to_html.py" \
                     "$PFDI_JSON" \
                     "$HTMLS_DIR/pfdi_detailed.html" \
                     "$HTMLS_DIR/pfdi_summary.html"
@@ -375,9 +414,9 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
 
     if check_file "$SCMI_LOG"; then
         SCMI_PROCESSED=1
-        if python3 "$SCRIPTS_PATH/scmi/logs_to_json.py" "$SCMI_LOG" "$SCMI_JSON"; then
+        if run_stage SCMI parse "$SCRIPTS_PATH/scmi/logs_to_json.py" "$SCMI_LOG" "$SCMI_JSON"; then
             apply_waivers "SCMI" "$SCMI_JSON"
-            python3 "$SCRIPTS_PATH/scmi/json_to_html.py" \
+            run_stage SCMI render "$SCRIPTS_PATH/scmi/json_to_html.py" \
                 "$SCMI_JSON" \
                 "$HTMLS_DIR/scmi_detailed.html" \
                 "$HTMLS_DIR/scmi_summary.html"
@@ -416,7 +455,7 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
     # Parse IB
     if check_file "$SBMR_IB_XML" "M"; then
         SBMR_IB_PROCESSED=1
-        python3 "$SCRIPTS_PATH/sbmr/logs_to_json.py" "$SBMR_IB_XML" "$SBMR_IB_JSON"
+        run_stage SBMR-IB parse "$SCRIPTS_PATH/sbmr/logs_to_json.py" "$SBMR_IB_XML" "$SBMR_IB_JSON"
         if [ $? -ne 0 ]; then
             SBMR_IB_PROCESSED=0
             echo -e "${RED}ERROR: SBMR IB logs parsing to json failed.${NC}"
@@ -428,7 +467,7 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
     # Parse OOB
     if check_file "$SBMR_OOB_XML" "M"; then
         SBMR_OOB_PROCESSED=1
-        python3 "$SCRIPTS_PATH/sbmr/logs_to_json.py" "$SBMR_OOB_XML" "$SBMR_OOB_JSON"
+        run_stage SBMR-OOB parse "$SCRIPTS_PATH/sbmr/logs_to_json.py" "$SBMR_OOB_XML" "$SBMR_OOB_JSON"
         if [ $? -ne 0 ]; then
             SBMR_OOB_PROCESSED=0
             echo -e "${RED}ERROR: SBMR OOB logs parsing to json failed.${NC}"
@@ -439,7 +478,7 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
 
     # Generate separate HTMLs per band
     if [ $SBMR_IB_PROCESSED -eq 1 ]; then
-        python3 "$SCRIPTS_PATH/sbmr/json_to_html.py" \
+        run_stage SBMR-IB render "$SCRIPTS_PATH/sbmr/json_to_html.py" \
             "$SBMR_IB_JSON" \
             "$HTMLS_DIR/sbmr_ib_detailed.html" \
             "$HTMLS_DIR/sbmr_ib_summary.html" \
@@ -447,7 +486,7 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
     fi
 
     if [ $SBMR_OOB_PROCESSED -eq 1 ]; then
-        python3 "$SCRIPTS_PATH/sbmr/json_to_html.py" \
+        run_stage SBMR-OOB render "$SCRIPTS_PATH/sbmr/json_to_html.py" \
             "$SBMR_OOB_JSON" \
             "$HTMLS_DIR/sbmr_oob_detailed.html" \
             "$HTMLS_DIR/sbmr_oob_summary.html" \
@@ -464,7 +503,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     # Attempt to parse post-script.log if it exists
     if check_file "$POST_SCRIPT_LOG" "M"; then
         POST_SCRIPT_PROCESSED=1
-        python3 "$SCRIPTS_PATH/post_script/logs_to_json.py" "$POST_SCRIPT_LOG" "$POST_SCRIPT_JSON"
+        run_stage POST_SCRIPT parse "$SCRIPTS_PATH/post_script/logs_to_json.py" "$POST_SCRIPT_LOG" "$POST_SCRIPT_JSON"
         if [ $? -ne 0 ]; then
             POST_SCRIPT_PROCESSED=0
             echo -e "${RED}ERROR: post-script logs parsing to json failed.${NC}"
@@ -473,7 +512,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             apply_waivers "POST_SCRIPT" "$POST_SCRIPT_JSON"
 
             # Generate the HTML (detailed + summary)
-            python3 "$SCRIPTS_PATH/post_script/json_to_html.py" \
+            run_stage POST_SCRIPT render "$SCRIPTS_PATH/post_script/json_to_html.py" \
                 "$POST_SCRIPT_JSON" \
                 "$HTMLS_DIR/post_script_detailed.html" \
                 "$HTMLS_DIR/post_script_summary.html"
@@ -491,7 +530,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     DT_KSELFTEST_LOG="$LINUX_TOOLS_LOGS_PATH/dt_kselftest.log"
     DT_KSELFTEST_JSON="$JSONS_DIR/dt_kselftest.json"
     if check_file "$DT_KSELFTEST_LOG"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage DT_KSELFTEST parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$DT_KSELFTEST_LOG" \
             "$DT_KSELFTEST_JSON"
         Standalone_JSONS+=("$DT_KSELFTEST_JSON")
@@ -502,7 +541,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     DT_VALIDATE_LOG="$LINUX_TOOLS_LOGS_PATH/dt-validate-parser.log"
     DT_VALIDATE_JSON="$JSONS_DIR/dt_validate.json"
     if check_file "$DT_VALIDATE_LOG" "M"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage DT_VALIDATE parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$DT_VALIDATE_LOG" \
             "$DT_VALIDATE_JSON"
         Standalone_JSONS+=("$DT_VALIDATE_JSON")
@@ -513,7 +552,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     ETHTOOL_TEST_LOG="$LINUX_TOOLS_LOGS_PATH/ethtool-test.log"
     ETHTOOL_TEST_JSON="$JSONS_DIR/ethtool_test.json"
     if check_file "$ETHTOOL_TEST_LOG" "M"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage ETHTOOL_TEST parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$ETHTOOL_TEST_LOG" \
             "$ETHTOOL_TEST_JSON"
         Standalone_JSONS+=("$ETHTOOL_TEST_JSON")
@@ -524,7 +563,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     READ_WRITE_CHECK_LOG="$LINUX_TOOLS_LOGS_PATH/read_write_check_blk_devices.log"
     READ_WRITE_CHECK_JSON="$JSONS_DIR/read_write_check_blk_devices.json"
     if check_file "$READ_WRITE_CHECK_LOG" "M"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage READ_WRITE_CHECK parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$READ_WRITE_CHECK_LOG" \
             "$READ_WRITE_CHECK_JSON"
         Standalone_JSONS+=("$READ_WRITE_CHECK_JSON")
@@ -539,7 +578,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
 
 #    if check_file "$CAPSULE_UPDATE_LOG" "M" && check_file "$CAPSULE_ON_DISK_LOG" "M" && check_file "$CAPSULE_TEST_RESULTS_LOG" "M"; then
     if check_file "$CAPSULE_TEST_RESULTS_LOG" "M"; then
-            python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+            run_stage CAPSULE_UPDATE parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             capsule_update \
             "$CAPSULE_UPDATE_LOG" \
             "$CAPSULE_ON_DISK_LOG" \
@@ -559,7 +598,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     PSCI_LOG="$LINUX_TOOLS_LOGS_PATH/psci/psci_kernel.log"
     PSCI_JSON="$JSONS_DIR/psci.json"
     if check_file "$PSCI_LOG"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" psci_check "$PSCI_LOG" "$PSCI_JSON"
+        run_stage PSCI parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" psci_check "$PSCI_LOG" "$PSCI_JSON"
         if [ $? -ne 0 ]; then
             echo -e "${RED}ERROR: PSCI log parsing to json failed.${NC}"
         else
@@ -574,7 +613,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
 
     if check_file "$SMBIOS_LOG" "M"; then
         # Use correct full path to standalone SMBIOS parser
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage SMBIOS parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$SMBIOS_LOG" \
             "$SMBIOS_JSON"
         # If parser succeeded, include in Standalone reports
@@ -592,7 +631,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     NETWORK_BOOT_LOG="$LOGS_PATH/network_boot/network_boot_results.log"
     NETWORK_BOOT_JSON="$JSONS_DIR/network_boot.json"
     if check_file "$NETWORK_BOOT_LOG" "M"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage NETWORK_BOOT parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$NETWORK_BOOT_LOG" \
             "$NETWORK_BOOT_JSON"
         if [ $? -eq 0 ]; then
@@ -607,7 +646,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     RUNTIME_DEV_MAP_LOG="$LINUX_TOOLS_LOGS_PATH/runtime_device_mapping_conflict_test.log"
     RUNTIME_DEV_MAP_JSON="$JSONS_DIR/runtime_dev_map.json"
     if check_file "$RUNTIME_DEV_MAP_LOG" "M"; then
-        python3 "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
+        run_stage RUNTIME_DEV_MAP parse "$SCRIPTS_PATH/standalone_tests/logs_to_json.py" \
             "$RUNTIME_DEV_MAP_LOG" \
             "$RUNTIME_DEV_MAP_JSON"
         if [ $? -eq 0 ]; then
@@ -624,7 +663,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
         Standalone_DETAILED_HTML="$HTMLS_DIR/standalone_tests_detailed.html"
         Standalone_SUMMARY_HTML="$HTMLS_DIR/standalone_tests_summary.html"
 
-        python3 "$SCRIPTS_PATH/standalone_tests/json_to_html.py" \
+        run_stage Standalone render "$SCRIPTS_PATH/standalone_tests/json_to_html.py" \
             "${Standalone_JSONS[@]}" \
             "$Standalone_DETAILED_HTML" \
             "$Standalone_SUMMARY_HTML" \
@@ -642,6 +681,8 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     mkdir -p "$OS_JSONS_DIR"
     OS_JSONS=()
     BOOT_SOURCES_PATHS=()
+    OS_PIDS=()
+    OS_STAGE_LOGS=()
 
     if [ -d "$OS_LOGS_PATH" ] && [ "$(ls -A "$OS_LOGS_PATH")" ]; then
         for OS_DIR in "$OS_LOGS_PATH"/linux*; do
@@ -652,12 +693,19 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
 
                 if [ -f "$ETH_TOOL_LOG" ]; then
                     OUTPUT_JSON="$OS_JSONS_DIR/ethtool_test_${OS_NAME}.json"
-                    python3 "$SCRIPTS_PATH/os_tests/logs_to_json.py" \
-                        "$ETH_TOOL_LOG" \
-                        "$OUTPUT_JSON" \
-                        "$OS_NAME"
+                    # Each OS is parsed and waived in the background; output
+                    # is buffered per OS and printed in order below.
+                    OS_STAGE_LOG="$OS_JSONS_DIR/.ethtool_test_${OS_NAME}.log"
+                    (
+                        run_stage "$OS_NAME" parse "$SCRIPTS_PATH/os_tests/logs_to_json.py" \
+                            "$ETH_TOOL_LOG" \
+                            "$OUTPUT_JSON" \
+                            "$OS_NAME"
+                        apply_waivers "os Tests" "$OUTPUT_JSON"
+                    ) > "$OS_STAGE_LOG" 2>&1 &
+                    OS_PIDS+=($!)
+                    OS_STAGE_LOGS+=("$OS_STAGE_LOG")
                     OS_JSONS+=("$OUTPUT_JSON")
-                    apply_waivers "os Tests" "$OUTPUT_JSON"
                     OS_TESTS_PROCESSED=1
 
                     if [ -f "$BOOT_SOURCES_LOG" ]; then
@@ -674,10 +722,16 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
         echo -e "${RED}ERROR: No os-logs found in os-logs directory at $OS_LOGS_PATH${NC}"
     fi
 
+    for i in "${!OS_PIDS[@]}"; do
+        wait "${OS_PIDS[$i]}"
+        cat "${OS_STAGE_LOGS[$i]}"
+        rm -f "${OS_STAGE_LOGS[$i]}"
+    done
+
     if [ ${#OS_JSONS[@]} -gt 0 ]; then
         OS_DETAILED_HTML="$HTMLS_DIR/os_tests_detailed.html"
         OS_SUMMARY_HTML="$HTMLS_DIR/os_tests_summary.html"
-        python3 "$SCRIPTS_PATH/os_tests/json_to_html.py" \
+        run_stage OS_TESTS render "$SCRIPTS_PATH/os_tests/json_to_html.py" \
             "${OS_JSONS[@]}" \
             "$OS_DETAILED_HTML" \
             "$OS_SUMMARY_HTML" \
@@ -694,7 +748,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 0 ]; then
 
     # SR band OS logs and post-script checks
     SR_OS_LOGS_JSON="$OS_JSONS_DIR/os_test.json"
-    python3 "$SCRIPTS_PATH/os_tests/sr_logs_to_json.py" \
+    run_stage OS_TESTS parse "$SCRIPTS_PATH/os_tests/sr_logs_to_json.py" \
         "$OS_LOGS_PATH" \
         "$POST_SCRIPT_LOG" \
         "$SR_OS_LOGS_JSON"
@@ -709,7 +763,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 0 ]; then
     if [ ${#OS_JSONS[@]} -gt 0 ]; then
         OS_DETAILED_HTML="$HTMLS_DIR/os_tests_detailed.html"
         OS_SUMMARY_HTML="$HTMLS_DIR/os_tests_summary.html"
-        python3 "$SCRIPTS_PATH/os_tests/json_to_html.py" \
+        run_stage OS_TESTS render "$SCRIPTS_PATH/os_tests/json_to_html.py" \
             "${OS_JSONS[@]}" \
             "$OS_DETAILED_HTML" \
             "$OS_SUMMARY_HTML" \
@@ -842,7 +896,7 @@ else
 fi
 
 if [ ${#JSON_FILES[@]} -gt 0 ]; then
-    python3 "$SCRIPTS_PATH/merge_jsons.py" "$MERGED_JSON" "${JSON_FILES[@]}"
+    run_stage ACS merge "$SCRIPTS_PATH/merge_jsons.py" "$MERGED_JSON" "${JSON_FILES[@]}"
     echo "ACS Merged JSON: $MERGED_JSON"
 else
     echo "No JSON files to merge."
@@ -855,7 +909,7 @@ echo ""
 ################################################################################
 ACS_SUMMARY_HTML="$HTMLS_DIR/acs_summary.html"
 ACS_SUMMARY_PDF="$ACS_SUMMARY_DIR/acs_summary.pdf"
-GENERATE_ACS_SUMMARY_CMD="python3 \"$SCRIPTS_PATH/generate_acs_summary.py\""
+GENERATE_ACS_SUMMARY_CMD="run_stage ACS summary \"$SCRIPTS_PATH/generate_acs_summary.py\""
 
 # 1) BSA
 if [ $BSA_PROCESSED -eq 1 ]; then
@@ -1080,9 +1134,17 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     echo " Converting ACS HTML Summary to PDF"
     # Convert ACS Summary HTML to PDF
     if [ -f "$ACS_SUMMARY_HTML" ]; then
-        python3 -c "from weasyprint import HTML, CSS; HTML('$ACS_SUMMARY_HTML').write_pdf('$ACS_SUMMARY_PDF', stylesheets=[CSS(string='@page { margin: 0; }')])"
+        run_stage ACS pdf -c "from weasyprint import HTML, CSS; HTML('$ACS_SUMMARY_HTML').write_pdf('$ACS_SUMMARY_PDF', stylesheets=[CSS(string='@page { margin: 0; }')])"
         echo "ACS PDF Summary : $ACS_SUMMARY_PDF"
     fi
 fi
 
+if [ "$PIPELINE_PROFILE" = "1" ]; then
+    PROFILE_ARGS=(report "$PROFILE_EVENTS" "$ACS_SUMMARY_DIR/pipeline_profile.json")
+    if [ "$PIPELINE_TRACE" = "1" ]; then
+        PROFILE_ARGS+=(--chrome-trace "$ACS_SUMMARY_DIR/pipeline_trace.json")
+    fi
+    python3 "$SCRIPTS_PATH/pipeline_profile.py" "${PROFILE_ARGS[@]}"
+fi
+
 echo ""
@@ -16,10 +16,15 @@
 
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 OS_RELEASE_FILE_NAME = "cat-etc-os-release.txt"
 
+# OS directories are scanned concurrently; labs install 6-10 distros per board.
+MAX_SCAN_WORKERS = 8
+
 def create_subtest(subtest_number, description, status, reason=""):
     result = {
         "sub_Test_Number": str(subtest_number),
@@ -52,13 +57,30 @@ def update_suite_summary(suite_summary, status):
     if status in key_map:
         suite_summary[key_map[status]] += 1
 
+def _walk_release_files(path):
+    release_files = []
+    for root, _, files in os.walk(path):
+        if OS_RELEASE_FILE_NAME in files:
+            release_files.append(os.path.join(root, OS_RELEASE_FILE_NAME))
+    return release_files
+
 def collect_os_release_files(os_logs_path):
     release_files = []
     if not os.path.isdir(os_logs_path):
         return release_files
-    for root, _, files in os.walk(os_logs_path):
-        if OS_RELEASE_FILE_NAME in files:
-            release_files.append(os.path.join(root, OS_RELEASE_FILE_NAME))
+    os_dirs = []
+    with os.scandir(os_logs_path) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_dir():
+                os_dirs.append(entry.path)
+            elif entry.name == OS_RELEASE_FILE_NAME:
+                release_files.append(entry.path)
+    if not os_dirs:
+        return release_files
+    # Each OS directory is walked in its own thread; results keep name order.
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(os_dirs))) as pool:
+        for files in pool.map(_walk_release_files, os_dirs):
+            release_files.extend(files)
     return release_files
 
 def os_dir_from_release_path(os_logs_path, release_path):
@@ -100,6 +122,35 @@ def parse_post_script_errors(log_path, tokens):
                 errors.append(line.strip())
     return errors
 
+class PostScriptErrorIndex:
+    """ERROR lines of post-script.log, read once and indexed by the OS directories they name.
+
+    A directory is named when it appears as a whole word, e.g. in
+    "os-logs/linux-rhel: ..." or "`os-logs/linux-rhel`", but not as part of
+    a longer name such as "linux-rhel9".
+    """
+
+    def __init__(self, log_path, tokens, os_dirs):
+        self.errors = parse_post_script_errors(log_path, tokens)
+        self.by_os_dir = {}
+        names = sorted({d.lower() for d in os_dirs if d}, key=len, reverse=True)
+        if not names:
+            return
+        # one pass per line; longer names first so a prefix does not shadow them
+        pattern = re.compile(r"(?<![\w.-])(%s)(?![\w-])" % "|".join(map(re.escape, names)),
+                             re.IGNORECASE)
+        for index, line in enumerate(self.errors):
+            for match in pattern.finditer(line):
+                self.by_os_dir.setdefault(match.group(1).lower(), set()).add(index)
+
+    def mentioning(self, os_dirs):
+        """Return the indexes of the error lines that mention any of os_dirs."""
+        found = set()
+        for os_dir in os_dirs:
+            if os_dir:
+                found |= self.by_os_dir.get(os_dir.lower(), set())
+        return found
+
 def build_results(os_logs_path, post_script_log):
     suite_summary = {
         "total_passed": 0,
@@ -125,8 +176,14 @@ def build_results(os_logs_path, post_script_log):
     sle_info = None
     all_os_dirs = set()
 
-    for release_path in collect_os_release_files(os_logs_path):
-        name, version_id = parse_os_release(release_path)
+    release_files = collect_os_release_files(os_logs_path)
+    if release_files:
+        with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(release_files))) as pool:
+            releases = list(pool.map(parse_os_release, release_files))
+    else:
+        releases = []
+
+    for release_path, (name, version_id) in zip(release_files, releases):
         if not name or not version_id:
             continue
         os_dir = os_dir_from_release_path(os_logs_path, release_path)
@@ -137,8 +194,6 @@ def build_results(os_logs_path, post_script_log):
             rhel_info = (name, version_id, release_path, os_dir)
         if sle_info is None and ("sles" in name_lower or "suse" in name_lower):
             sle_info = (name, version_id, release_path, os_dir)
-        if rhel_info and sle_info:
-            break
 
     def add_presence_subtest(label, os_info):
         nonlocal subtest_number
@@ -156,7 +211,8 @@ def build_results(os_logs_path, post_script_log):
     add_presence_subtest("RHEL", rhel_info)
     add_presence_subtest("SLE", sle_info)
 
-    errors = parse_post_script_errors(post_script_log, ["os-logs"])
+    error_index = PostScriptErrorIndex(post_script_log, ["os-logs"], all_os_dirs)
+    errors = error_index.errors
     if not os.path.isfile(post_script_log):
         desc = f"post-script.log not found at {post_script_log}"
         sub = create_subtest(subtest_number, desc, "FAILED", "post-script.log missing")
@@ -167,7 +223,9 @@ def build_results(os_logs_path, post_script_log):
         rhel_dir = rhel_info[3] if rhel_info else None
         sle_dir = sle_info[3] if sle_info else None
         other_dirs = {d for d in all_os_dirs if d and d not in {rhel_dir, sle_dir}}
-        for error_line in errors:
+        required_errors = error_index.mentioning([rhel_dir, sle_dir])
+        other_errors = error_index.mentioning(other_dirs)
+        for error_number, error_line in enumerate(errors):
             cleaned = error_line.strip()
             if cleaned.startswith("ERROR"):
                 cleaned = cleaned[len("ERROR"):].strip()
@@ -178,10 +236,9 @@ def build_results(os_logs_path, post_script_log):
                 reason = reason_part.strip()
             else:
                 desc = f"post-script checks:{cleaned}"
-            lower_line = error_line.lower()
-            if (rhel_dir and rhel_dir.lower() in lower_line) or (sle_dir and sle_dir.lower() in lower_line):
+            if error_number in required_errors:
                 status = "FAILED"
-            elif any(d.lower() in lower_line for d in other_dirs):
+            elif error_number in other_errors:
                 status = "WARNINGS"
             else:
                 status = "WARNINGS"
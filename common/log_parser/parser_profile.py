@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Common entry wrapper for log_parser CLIs with optional profiling.
+#
+# Runs any log_parser script unchanged as __main__. ACS_PARSER_PROFILE selects
+# the profilers (comma separated):
+#   cprofile     -> <stem>.<script>.prof (load with pstats or snakeviz)
+#   tracemalloc  -> <stem>.<script>.tracemalloc (tracemalloc.Snapshot.load)
+#                   and <stem>.<script>.tracemalloc.txt (top allocation sites)
+# <stem> is the first .json argument of the stage (the JSON it writes or
+# reads), and dumps are written next to it unless ACS_PARSER_PROFILE_DIR is
+# set. Stages without a JSON argument dump <script>.* into their last
+# directory argument, else the current directory. main_log_parser.sh routes
+# every stage through here when the variable is set, so profiles can be
+# collected from a customer bundle as-is.
+#
+# Usage: parser_profile.py <script.py|-c code> [args...]
+
+import cProfile
+import os
+import runpy
+import sys
+import traceback
+import tracemalloc
+
+PROFILE_ENV = "ACS_PARSER_PROFILE"
+PROFILE_DIR_ENV = "ACS_PARSER_PROFILE_DIR"
+MODES = ("cprofile", "tracemalloc")
+
+# Stack depth kept per allocation and number of sites in the text summary.
+TRACEMALLOC_FRAMES = 10
+TRACEMALLOC_TOP = 25
+
+
+def requested_modes():
+    """Return the profilers named in ACS_PARSER_PROFILE."""
+    value = os.environ.get(PROFILE_ENV, "")
+    modes = []
+    for mode in value.lower().replace(" ", "").split(","):
+        if not mode:
+            continue
+        if mode in MODES:
+            modes.append(mode)
+        else:
+            print(f"WARNING: ignoring unknown {PROFILE_ENV} mode '{mode}' "
+                  f"(expected {', '.join(MODES)})", file=sys.stderr)
+    return modes
+
+
+def dump_prefix(target, args):
+    """Return the path prefix for profile dumps of one stage."""
+    script = "inline" if target == "-c" else os.path.splitext(os.path.basename(target))[0]
+    json_args = [arg for arg in args if arg.lower().endswith(".json")]
+    out_dir = os.environ.get(PROFILE_DIR_ENV)
+    if json_args:
+        stem = os.path.splitext(os.path.basename(json_args[0]))[0]
+        out_dir = out_dir or os.path.dirname(os.path.abspath(json_args[0]))
+        return os.path.join(out_dir, f"{stem}.{script}")
+    # No JSON argument (acs_info.py): use its output directory if one is given.
+    dir_args = [arg for arg in args if os.path.isdir(arg)]
+    return os.path.join(out_dir or (dir_args[-1] if dir_args else os.getcwd()), script)
+
+
+def run_script(target, args):
+    """Run a script (or -c code) as __main__ and return its exit code."""
+    try:
+        if target == "-c":
+            sys.argv = ["-c", *args[1:]]
+            exec(compile(args[0], "<string>", "exec"), {"__name__": "__main__"})  # pylint: disable=exec-used
+        else:
+            sys.argv = [target, *args]
+            sys.path[0] = os.path.dirname(os.path.abspath(target))
+            runpy.run_path(target, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        if isinstance(exc.code, int):
+            return exc.code
+        print(exc.code, file=sys.stderr)
+        return 1
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def write_tracemalloc(prefix, snapshot, peak):
+    """Dump a tracemalloc snapshot and a short text summary of it."""
+    snapshot.dump(prefix + ".tracemalloc")
+    stats = snapshot.statistics("lineno")
+    with open(prefix + ".tracemalloc.txt", "w", encoding="utf-8") as out:
+        out.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n")
+        out.write(f"Top {TRACEMALLOC_TOP} allocation sites still live at exit:\n")
+        for stat in stats[:TRACEMALLOC_TOP]:
+            out.write(f"{stat}\n")
+
+
+def run_target(target, args):
+    """Run one stage, profiled as requested by ACS_PARSER_PROFILE."""
+    modes = requested_modes()
+    if not modes:
+        return run_script(target, args)
+
+    prefix = dump_prefix(target, args)
+    profiler = cProfile.Profile() if "cprofile" in modes else None
+    if "tracemalloc" in modes:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    if profiler:
+        profiler.enable()
+    try:
+        exit_code = run_script(target, args)
+    finally:
+        if profiler:
+            profiler.disable()
+        sys.stdout.flush()
+
+    try:
+        os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        if profiler:
+            profiler.dump_stats(prefix + ".prof")
+            print(f"cProfile stats written to {prefix}.prof", file=sys.stderr)
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            write_tracemalloc(prefix, snapshot, peak)
+            print(f"tracemalloc snapshot written to {prefix}.tracemalloc", file=sys.stderr)
+    except OSError as err:
+        print(f"WARNING: could not write profile for {target}: {err}", file=sys.stderr)
+    return exit_code
+
+
+def main():
+    # Script options are forwarded untouched, so arguments are parsed by hand.
+    if len(sys.argv) < 2:
+        print("Usage: parser_profile.py <script.py|-c code> [args...]")
+        sys.exit(1)
+    sys.exit(run_target(sys.argv[1], sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
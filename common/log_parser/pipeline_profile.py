@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Per-stage timing and memory instrumentation for the log_parser pipeline.
+#
+# main_log_parser.sh calls every python3 stage through run_stage(). When
+# profiling is enabled (ACS_PIPELINE_PROFILE=1 or --profile) run_stage()
+# goes through "record" below, which runs the stage script in this same
+# process and appends one JSON line per stage to an events file. "report"
+# turns that file into acs_summary/pipeline_profile.json and, optionally, a
+# Chrome trace (chrome://tracing or https://ui.perfetto.dev). Stages are run
+# through parser_profile.run_target, so ACS_PARSER_PROFILE still applies.
+#
+# Usage:
+#   pipeline_profile.py record <events.jsonl> <suite> <stage> <script.py|-c code> [args...]
+#   pipeline_profile.py report <events.jsonl> <pipeline_profile.json> [--chrome-trace <trace.json>]
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from parser_profile import run_target
+
+# Keys that mark one test record in any suite JSON (BSA/SCMI testcases,
+# FWTS/SCT/SBMR subtests, edk2 parser entries).
+RESULT_KEYS = ("Test_result", "test_result", "sub_test_result", "result")
+
+
+def read_peak_rss_kb():
+    """Return this process' peak RSS in KiB (VmHWM, falling back to ru_maxrss)."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def path_size(path):
+    """Return the size of a file, or of all files below a directory."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+def count_records(data):
+    """Count test records in a parsed suite JSON structure."""
+    count = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if any(key in item for key in RESULT_KEYS):
+                count += 1
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return count
+
+
+def snapshot_paths(args):
+    """Map every existing path argument to its mtime before the stage runs."""
+    paths = {}
+    for arg in args:
+        if arg.startswith("-") or not os.path.exists(arg):
+            continue
+        try:
+            paths[arg] = os.stat(arg).st_mtime_ns
+        except OSError:
+            continue
+    return paths
+
+
+def records_for_stage(args, before):
+    """Count records in the JSON files the stage wrote, else in the ones it read."""
+    json_args = [arg for arg in args if arg.lower().endswith(".json") and os.path.isfile(arg)]
+    written = [arg for arg in json_args
+               if arg not in before or os.stat(arg).st_mtime_ns != before[arg]]
+    total = 0
+    for path in written or json_args:
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                total += count_records(json.load(handle))
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+def record(events_path, suite, stage, target, args):
+    """Run one stage in-process and append its measurements to events_path."""
+    path_args = args if target == "-c" else [target, *args]
+    before = snapshot_paths(path_args)
+    input_bytes = sum(path_size(path) for path in before)
+
+    start_ts = time.time()
+    start_wall = time.perf_counter()
+    start_usage = resource.getrusage(resource.RUSAGE_SELF)
+    exit_code = run_target(target, args)
+    end_usage = resource.getrusage(resource.RUSAGE_SELF)
+    wall = time.perf_counter() - start_wall
+    sys.stdout.flush()
+
+    event = OrderedDict([
+        ("suite", suite),
+        ("stage", stage),
+        ("script", "-c" if target == "-c" else os.path.relpath(target, os.path.dirname(os.path.abspath(__file__)))),
+        ("start_ts", round(start_ts, 6)),
+        ("wall_time_s", round(wall, 6)),
+        ("cpu_time_s", round((end_usage.ru_utime - start_usage.ru_utime)
+                             + (end_usage.ru_stime - start_usage.ru_stime), 6)),
+        ("peak_rss_kb", read_peak_rss_kb()),
+        ("input_bytes", input_bytes),
+        ("records", records_for_stage(path_args, before)),
+        ("exit_code", exit_code),
+    ])
+    try:
+        with open(events_path, "a", encoding="utf-8") as events:
+            events.write(json.dumps(event) + "\n")
+    except OSError as err:
+        print(f"WARNING: could not record pipeline profile event: {err}", file=sys.stderr)
+    return exit_code
+
+
+def load_events(events_path):
+    """Read every event line, skipping partial lines from interrupted stages."""
+    events = []
+    with open(events_path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def aggregate(events, key):
+    """Sum wall/CPU time, bytes and records and take max RSS per key value."""
+    totals = OrderedDict()
+    for event in events:
+        entry = totals.setdefault(event[key], OrderedDict([
+            ("count", 0),
+            ("wall_time_s", 0.0),
+            ("cpu_time_s", 0.0),
+            ("peak_rss_kb", 0),
+            ("input_bytes", 0),
+            ("records", 0),
+            ("failures", 0),
+        ]))
+        entry["count"] += 1
+        entry["wall_time_s"] = round(entry["wall_time_s"] + event["wall_time_s"], 6)
+        entry["cpu_time_s"] = round(entry["cpu_time_s"] + event["cpu_time_s"], 6)
+        entry["peak_rss_kb"] = max(entry["peak_rss_kb"], event["peak_rss_kb"])
+        entry["input_bytes"] += event["input_bytes"]
+        entry["records"] += event["records"]
+        if event["exit_code"] != 0:
+            entry["failures"] += 1
+    return totals
+
+
+def build_chrome_trace(events):
+    """Return a Chrome trace-event document with one complete event per stage."""
+    origin = min((event["start_ts"] for event in events), default=0.0)
+    trace_events = []
+    for event in events:
+        trace_events.append({
+            "name": f"{event['suite']} {event['stage']}",
+            "cat": event["stage"],
+            "ph": "X",
+            "ts": int((event["start_ts"] - origin) * 1e6),
+            "dur": int(event["wall_time_s"] * 1e6),
+            "pid": 1,
+            "tid": 1,
+            "args": {
+                "script": event["script"],
+                "cpu_time_s": event["cpu_time_s"],
+                "peak_rss_kb": event["peak_rss_kb"],
+                "input_bytes": event["input_bytes"],
+                "records": event["records"],
+                "exit_code": event["exit_code"],
+            },
+        })
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def report(events_path, output_path, chrome_trace_path=None):
+    """Write pipeline_profile.json (and an optional Chrome trace) from events."""
+    events = load_events(events_path) if os.path.isfile(events_path) else []
+    events.sort(key=lambda event: event["start_ts"])
+
+    profile = OrderedDict([
+        ("generated_at", datetime.now().isoformat(timespec="seconds")),
+        ("stage_count", len(events)),
+        ("total_wall_time_s", round(sum(event["wall_time_s"] for event in events), 6)),
+        ("total_cpu_time_s", round(sum(event["cpu_time_s"] for event in events), 6)),
+        ("peak_rss_kb", max((event["peak_rss_kb"] for event in events), default=0)),
+        ("by_stage", aggregate(events, "stage")),
+        ("by_suite", aggregate(events, "suite")),
+        ("stages", events),
+    ])
+    with open(output_path, "w", encoding="utf-8") as out:
+        json.dump(profile, out, indent=2)
+    print(f"Pipeline profile : {output_path}")
+
+    if chrome_trace_path:
+        with open(chrome_trace_path, "w", encoding="utf-8") as out:
+            json.dump(build_chrome_trace(events), out)
+        print(f"Pipeline trace   : {chrome_trace_path}")
+
+    # The events file is only scratch space for the shell pipeline.
+    if os.path.isfile(events_path):
+        os.remove(events_path)
+
+
+def main():
+    # "record" forwards arbitrary script options, so it is parsed by hand.
+    if len(sys.argv) >= 2 and sys.argv[1] == "record":
+        if len(sys.argv) < 6:
+            print("Usage: pipeline_profile.py record <events.jsonl> <suite> <stage> <script.py|-c code> [args...]")
+            sys.exit(1)
+        events_path, suite, stage, target = sys.argv[2:6]
+        sys.exit(record(events_path, suite, stage, target, sys.argv[6:]))
+
+    parser = argparse.ArgumentParser(description="Summarize log_parser pipeline stage measurements.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("record", help="Run one stage and record its measurements")
+    report_parser = subparsers.add_parser("report", help="Write pipeline_profile.json from recorded events")
+    report_parser.add_argument("events_file", help="Events file written by 'record'")
+    report_parser.add_argument("output_file", help="Output pipeline_profile.json")
+    report_parser.add_argument("--chrome-trace", help="Also write a Chrome trace-event JSON file")
+    args = parser.parse_args()
+    report(args.events_file, args.output_file, args.chrome_trace)
+
+
+if __name__ == "__main__":
+    main()
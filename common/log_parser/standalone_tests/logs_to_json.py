@@ -381,6 +381,32 @@ def parse_ethtool_test_log(log_data):
     }
 
 
+def parse_write_check_results(log_data, i, stop_prefixes):
+    """Collect the write check results up to the next stop line.
+
+    --write-samples N prints one "write check passed/failed" line per sample;
+    the check fails if any sample failed. Returns (status or None, reason, i).
+    """
+    passed, failed = [], []
+    while i < len(log_data):
+        w_line = log_data[i].strip()
+        if w_line.startswith(stop_prefixes):
+            break
+        if "INFO: write check passed on" in w_line:
+            passed.append(w_line)
+        elif "INFO: write check failed on" in w_line:
+            failed.append(w_line)
+        i += 1
+
+    samples = len(passed) + len(failed)
+    if not samples:
+        return None, "No explicit write-check result found", i
+    status = "FAILED" if failed else "PASSED"
+    reason = failed[0] if failed else passed[-1]
+    if samples > 1:
+        reason += f" ({len(failed)} of {samples} samples failed)"
+    return status, reason, i
+
 def parse_read_write_check_blk_devices_log(log_data):
     test_suite_key = "read_write_check_blk_devices"
     mapping = test_suite_mapping[test_suite_key]
@@ -476,23 +502,8 @@ def parse_read_write_check_blk_devices_log(log_data):
                             prompt_line = log_data[i].strip()
                             if "yes" in prompt_line.lower():
                                 i += 1
-                                ws = None
-                                wr = "No explicit write-check result found"
-                                while i < len(log_data):
-                                    w_line = log_data[i].strip()
-                                    if w_line.startswith("INFO: Block device :") or w_line.startswith("****************************************************************"):
-                                        break
-                                    if "INFO: write check passed on" in w_line:
-                                        ws = "PASSED"
-                                        wr = w_line
-                                        i += 1
-                                        break
-                                    if "INFO: write check failed on" in w_line:
-                                        ws = "FAILED"
-                                        wr = w_line
-                                        i += 1
-                                        break
-                                    i += 1
+                                ws, wr, i = parse_write_check_results(
+                                    log_data, i, ("INFO: Block device :", "****************************************************************"))
 
                                 # no user input for yes/no for write check:
                                 if not ws:
@@ -617,25 +628,9 @@ def parse_read_write_check_blk_devices_log(log_data):
                                 prompt_line = log_data[i].strip()
                                 if "yes" in prompt_line.lower():
                                     i += 1
-                                    ws = None
-                                    wr = "No explicit write-check result found"
-                                    while i < len(log_data):
-                                        w_line = log_data[i].strip()
-                                        if (w_line.startswith("INFO: Partition :")
-                                            or w_line.startswith("INFO: Block device :")
-                                            or w_line.startswith("****************************************************************")):
-                                            break
-                                        if "INFO: write check passed on" in w_line:
-                                            ws = "PASSED"
-                                            wr = w_line
-                                            i += 1
-                                            break
-                                        if "INFO: write check failed on" in w_line:
-                                            ws = "FAILED"
-                                            wr = w_line
-                                            i += 1
-                                            break
-                                        i += 1
+                                    ws, wr, i = parse_write_check_results(
+                                        log_data, i, ("INFO: Partition :", "INFO: Block device :",
+                                                      "****************************************************************"))
 
                                     if not ws:
                                         ws = "SKIPPED"
@@ -671,6 +666,51 @@ def parse_read_write_check_blk_devices_log(log_data):
         else:
             i += 1
 
+    # Read benchmark results (--benchmark) follow the write check of each
+    # device; add them as subtests with the measurements as structured fields.
+    bench_regex = re.compile(
+        r'INFO: Read benchmark (\w+) on (\S+): (\d+) KiB blocks, queue depth (\d+), '
+        r'(\d+) reads in ([\d.]+) s, ([\d.]+) MB/s, ([\d.]+) IOPS, latency ms (.*)'
+    )
+    bench_fail_regex = re.compile(r'WARNING: Read benchmark (?:(\w+) )?on (\S+) failed: (.*)')
+    for raw_line in log_data:
+        line = raw_line.strip()
+        bench_match = bench_regex.match(line)
+        bench_fail_match = bench_fail_regex.match(line)
+        if bench_match:
+            pattern, device = bench_match.group(1), bench_match.group(2)
+            latency_values = bench_match.group(9).split()
+            benchmark = {
+                "pattern": pattern,
+                "device": device,
+                "block_size_kib": int(bench_match.group(3)),
+                "queue_depth": int(bench_match.group(4)),
+                "reads": int(bench_match.group(5)),
+                "duration_s": float(bench_match.group(6)),
+                "mb_per_s": float(bench_match.group(7)),
+                "iops": float(bench_match.group(8)),
+                "latency_ms": {
+                    name: float(value)
+                    for name, value in zip(latency_values[::2], latency_values[1::2])
+                },
+            }
+            status = "PASSED"
+        elif bench_fail_match:
+            pattern = bench_fail_match.group(1) or "sequential/random"
+            device = bench_fail_match.group(2)
+            benchmark = None
+            status = "WARNINGS"
+        else:
+            continue
+
+        sub = create_subtest(subtest_number, f"Read benchmark ({pattern}) on {device}", status, reason=line)
+        if benchmark:
+            sub["benchmark"] = benchmark
+        current_test["subtests"].append(sub)
+        update_suite_summary(current_test["test_suite_summary"], status)
+        suite_summary[f"total_{status.lower()}"] += 1
+        subtest_number += 1
+
     # >>> REMOVE EMPTY REASON ARRAYS <<<
     for subtest in current_test["subtests"]:
         subres = subtest["sub_test_result"]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Live view of BSA/SBSA results while an ACS run is still writing its logs.
+#
+# Each log is polled for growth and only the new bytes are decoded and fed to
+# bsa/logs_to_json.py's BsaLogParser, so nothing is re-parsed from offset
+# zero. Every --render-interval seconds the accumulated results are written to
+# <output_dir>/<suite>.json and rendered with bsa/json_to_html.py. Failures are
+# printed as soon as their Result line is seen. The final reports still come
+# from main_log_parser.sh once the run completes.
+#
+# Usage: watch_results.py <acs_results_directory> [--suites bsa sbsa] [--once]
+
+import argparse
+import codecs
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+
+import chardet
+
+SCRIPTS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# Logs per suite, relative to acs_results, in the order main_log_parser.sh
+# passes them to the parser (UEFI first, then Linux). A tuple lists
+# alternatives; only the first one that exists is read, as in
+# main_log_parser.sh.
+SUITE_LOGS = {
+    "bsa": [
+        "uefi/BsaResults.log",
+        ("linux_acs/bsa_acs_app/BsaResultsKernel.log", "linux/BsaResultsKernel.log"),
+    ],
+    "sbsa": [
+        "uefi/SbsaResults.log",
+        "linux/SbsaResultsKernel.log",
+    ],
+}
+
+
+def load_bsa_parser():
+    """Import bsa/logs_to_json.py by path (log_parser has no packages)."""
+    path = os.path.join(SCRIPTS_PATH, "bsa", "logs_to_json.py")
+    spec = importlib.util.spec_from_file_location("bsa_logs_to_json", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def guess_encoding(raw):
+    """Return the encoding of a log from its first bytes."""
+    if raw.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    encoding = chardet.detect(raw)["encoding"] or "utf-8"
+    # The first lines are usually plain ASCII; later bytes may not be.
+    return "utf-8" if encoding.lower() == "ascii" else encoding
+
+
+class LogTail:
+    """Incrementally read complete lines appended to a growing log file."""
+
+    def __init__(self, path, *fallbacks):
+        self.candidates = (path,) + fallbacks
+        self.path = path
+        self.reset()
+
+    def resolve(self):
+        """Follow the first candidate that exists; return True if that changed."""
+        path = next((p for p in self.candidates if os.path.exists(p)), self.candidates[0])
+        switched = path != self.path
+        self.path = path
+        return switched
+
+    def reset(self):
+        self.offset = 0
+        self.decoder = None
+        self.partial = ""
+
+    def read_lines(self, final=False):
+        """Return (lines, truncated) for the data appended since the last call.
+
+        truncated is True if the file shrank (rewritten from the start) or a
+        preferred alternative appeared; the caller must then discard what it
+        parsed from this file.
+        """
+        if self.resolve():
+            self.reset()
+            lines, _ = self.read_lines(final)
+            return lines, True
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return [], False
+        truncated = size < self.offset
+        if truncated:
+            self.reset()
+        if size == self.offset and not final:
+            return [], truncated
+
+        with open(self.path, "rb") as handle:
+            handle.seek(self.offset)
+            data = handle.read(size - self.offset)
+        self.offset += len(data)
+
+        if self.decoder is None:
+            encoding = guess_encoding(data)
+            self.decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+
+        text = self.partial + self.decoder.decode(data, final=final)
+        lines = text.splitlines()
+        # Keep an unterminated last line until the rest of it is written.
+        if lines and not final and not text.endswith(("\n", "\r")):
+            self.partial = lines.pop()
+        else:
+            self.partial = ""
+        return lines, truncated
+
+
+class SuiteWatch:
+    """One suite: a BsaLogParser and LogTail per log, plus its output files."""
+
+    def __init__(self, bsa, suite, results_dir, output_dir):
+        self.bsa = bsa
+        self.suite = suite
+        self.json_path = os.path.join(output_dir, f"{suite}.json")
+        self.detailed_html = os.path.join(output_dir, f"{suite}_detailed.html")
+        self.summary_html = os.path.join(output_dir, f"{suite}_summary.html")
+        self.tails = [
+            LogTail(*(os.path.join(results_dir, alt)
+                      for alt in (rel if isinstance(rel, tuple) else (rel,))))
+            for rel in SUITE_LOGS[suite]
+        ]
+        self.parsers = [self.new_parser(tail) for tail in self.tails]
+        self.dirty = False
+
+    def new_parser(self, tail):
+        parser = self.bsa.BsaLogParser()
+        parser.start_file(tail.path)
+        return parser
+
+    def poll(self, final=False):
+        """Feed new lines of every log; return the testcases completed meanwhile."""
+        completed = []
+        for index, tail in enumerate(self.tails):
+            lines, truncated = tail.read_lines(final)
+            if truncated:
+                self.parsers[index] = self.new_parser(tail)
+                self.dirty = True
+            parser = self.parsers[index]
+            before = {name: len(tcs) for name, tcs in parser.testcases_per_suite.items()}
+            for line in lines:
+                parser.feed_line(line)
+            for name, tcs in parser.testcases_per_suite.items():
+                completed.extend(tcs[before.get(name, 0):])
+        if completed:
+            self.dirty = True
+        return completed
+
+    def snapshot(self):
+        """Return the suite JSON for everything parsed so far."""
+        combined = self.bsa.BsaLogParser()
+        for parser in self.parsers:
+            for name, tcs in parser.testcases_per_suite.items():
+                combined.testcases_per_suite[name].extend(tcs)
+        return combined.build_output()
+
+    def write(self, render):
+        """Write the snapshot JSON (atomically) and optionally render HTML."""
+        output = self.snapshot()
+        tmp_path = self.json_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            json.dump(output, out, indent=2)
+        os.replace(tmp_path, self.json_path)
+        self.dirty = False
+
+        summary = output["suite_summary"]
+        print(f"[{time.strftime('%H:%M:%S')}] {self.suite.upper()}: "
+              f"{summary['Total Rules Run']} rules, {summary['Passed']} passed, "
+              f"{summary['Failed']} failed, {summary['Skipped']} skipped -> {self.json_path}")
+        if render and summary["Total Rules Run"] > 0:
+            result = subprocess.run(
+                [sys.executable, os.path.join(SCRIPTS_PATH, "bsa", "json_to_html.py"),
+                 self.json_path, self.detailed_html, self.summary_html],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+            )
+            if result.returncode != 0:
+                errors = result.stderr.strip().splitlines()
+                reason = errors[-1] if errors else f"exit code {result.returncode}"
+                print(f"WARNING: {self.suite.upper()} HTML render failed: {reason}")
+
+
+def report_failures(suite, testcases):
+    for testcase in testcases:
+        if "FAILED" in str(testcase.get("Test_result", "")).upper():
+            print(f"{suite.upper()} FAILED: {testcase.get('Test_case')} "
+                  f"{testcase.get('Test_case_description', '')}".rstrip())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Watch BSA/SBSA logs during an ACS run and refresh their JSON/HTML summaries."
+    )
+    parser.add_argument("results_dir", help="acs_results directory being written by the ACS run")
+    parser.add_argument("--suites", nargs="+", choices=sorted(SUITE_LOGS), default=sorted(SUITE_LOGS),
+                        help="Suites to watch (default: all)")
+    parser.add_argument("--output-dir", help="Where to write live JSON/HTML (default: <results_dir>/acs_summary/live)")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between log polls (default: 2)")
+    parser.add_argument("--render-interval", type=float, default=30.0,
+                        help="Minimum seconds between JSON/HTML refreshes (default: 30)")
+    parser.add_argument("--no-html", action="store_true", help="Only refresh the JSON files")
+    parser.add_argument("--timeout", type=float, default=0,
+                        help="Stop after this many seconds (default: run until interrupted)")
+    parser.add_argument("--once", action="store_true", help="Parse what is there now, write the outputs and exit")
+    args = parser.parse_args()
+
+    if args.interval <= 0 or args.render_interval < 0:
+        print("ERROR: --interval must be positive and --render-interval non-negative")
+        sys.exit(1)
+    if not os.path.isdir(args.results_dir):
+        print(f"ERROR: results directory not found: {args.results_dir}")
+        sys.exit(1)
+
+    output_dir = args.output_dir or os.path.join(args.results_dir, "acs_summary", "live")
+    os.makedirs(output_dir, exist_ok=True)
+
+    bsa = load_bsa_parser()
+    watches = [SuiteWatch(bsa, suite, args.results_dir, output_dir) for suite in args.suites]
+    render = not args.no_html
+    start = time.monotonic()
+    last_write = None
+
+    try:
+        while True:
+            for watch in watches:
+                report_failures(watch.suite, watch.poll(final=args.once))
+            now = time.monotonic()
+            if last_write is None or now - last_write >= args.render_interval:
+                for watch in watches:
+                    if watch.dirty or last_write is None:
+                        watch.write(render)
+                last_write = now
+            if args.once or (args.timeout and now - start >= args.timeout):
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("Stopping watch.")
+
+    # Flush whatever arrived since the last refresh.
+    if not args.once:
+        for watch in watches:
+            report_failures(watch.suite, watch.poll(final=True))
+            if watch.dirty:
+                watch.write(render)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,9 @@
 
 import configparser
 import argparse
+import os
+import shlex
+import sys
 
 def read_config(config_file):
     try:
@@ -23,12 +26,14 @@ def read_config(config_file):
         config.read(config_file)
         return config
     except Exception as e:
-        print(f"Error reading configuration file: {e}")
+        # on stderr, so a shell evaluating --export-shell never runs it
+        print(f"Error reading configuration file: {e}", file=sys.stderr)
         return None
 
-def process_bsa(config):
+def process_bsa(config, quiet=False):
     if not config.getboolean('BSA', 'automation_bsa_run', fallback=False):
-        print("BSA section is disabled or missing.")
+        if not quiet:
+            print("BSA section is disabled or missing.")
         return []
 
     cmd = ['/bin/bsa']
@@ -49,9 +54,10 @@ def process_bsa(config):
 
     return cmd
 
-def process_sbsa(config):
+def process_sbsa(config, quiet=False):
     if not config.getboolean('SBSA', 'automation_sbsa_run', fallback=False):
-        print("SBSA section is disabled or missing.")
+        if not quiet:
+            print("SBSA section is disabled or missing.")
         return []
 
     cmd = ['/bin/sbsa']
@@ -72,9 +78,10 @@ def process_sbsa(config):
 
     return cmd
 
-def process_fwts(config):
+def process_fwts(config, quiet=False):
     if not config.getboolean('FWTS', 'automation_fwts_run', fallback=False):
-        print("FWTS section is disabled or missing.")
+        if not quiet:
+            print("FWTS section is disabled or missing.")
         return []
 
     cmd = ['fwts']
@@ -85,18 +92,85 @@ def process_fwts(config):
 
     return cmd
 
-def check_section_enable(config, section, enabled_key):
+def check_section_enable(config, section, enabled_key, quiet=False):
     if not config:
-        print("Configuration not loaded properly.")
+        if not quiet:
+            print("Configuration not loaded properly.")
         return None
 
     if section not in config:
-        print(f"Section {section} is missing in the configuration file.")
+        if not quiet:
+            print(f"Section {section} is missing in the configuration file.")
         return False
 
     enabled = config.getboolean(section, enabled_key, fallback=False)
     return enabled
 
+# Shell variable -> (section, key) for every enablement flag the boot scripts read
+SHELL_ENABLE_FLAGS = [
+    ('automation_enabled', 'AUTOMATION', 'config_enabled_for_automation_run'),
+    ('bsa_enabled', 'BSA', 'automation_bsa_run'),
+    ('sbsa_enabled', 'SBSA', 'automation_sbsa_run'),
+    ('fwts_enabled', 'FWTS', 'automation_fwts_run'),
+    ('bbsr_fwts_enabled', 'BBSR_FWTS', 'automation_bbsr_fwts_run'),
+    ('bbsr_tpm_enabled', 'BBSR_TPM', 'automation_bbsr_tpm_run'),
+    ('sbmr_enabled', 'SBMR', 'automation_sbmr_in_band_run'),
+]
+
+def export_shell(config):
+    # Same values the single-setting flags print, as sourceable assignments
+    values = {}
+    for name, section, key in SHELL_ENABLE_FLAGS:
+        values[name] = str(check_section_enable(config, section, key, quiet=True))
+    values['bsa_command'] = ' '.join(process_bsa(config, quiet=True))
+    values['sbsa_command'] = ' '.join(process_sbsa(config, quiet=True))
+    values['fwts_command'] = ' '.join(process_fwts(config, quiet=True))
+    values['sbmr_level'] = config.get('SBMR', 'sbmr_level', fallback='')
+    values['settle_seconds'] = config.get('AUTOMATION', 'settle_seconds', fallback='0')
+    values['rerun_steps'] = config.get('AUTOMATION', 'rerun_steps', fallback='')
+    return ''.join(f"{name}={shlex.quote(value)}\n" for name, value in values.items())
+
+def cache_key(config_file):
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        return None
+    return f"# {os.path.abspath(config_file)} mtime_ns={st.st_mtime_ns} size={st.st_size}\n"
+
+def read_cache(cache_file, key):
+    try:
+        with open(cache_file, 'r') as f:
+            if f.readline() == key:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+def write_cache(cache_file, key, text):
+    # write-then-rename so an interrupted boot never leaves a torn cache
+    tmp_file = f"{cache_file}.tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            f.write(key + text)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"# Warning: could not write config cache {cache_file}: {e}")
+
+def exported_shell(config_file, cache_file=None):
+    key = cache_key(config_file) if cache_file else None
+    if key:
+        text = read_cache(cache_file, key)
+        if text is not None:
+            return text
+
+    config = read_config(config_file)
+    if not config:
+        return None
+    text = export_shell(config)
+    if key:
+        write_cache(cache_file, key, text)
+    return text
+
 def main():
     parser = argparse.ArgumentParser(description='Config parser')
     parser.add_argument('-bsa', action='store_true', help='Process BSA section')
@@ -112,9 +186,19 @@ def main():
     parser.add_argument('--config', default='/mnt/acs_tests/config/acs_run_config.ini', help='Path to the config file')
     parser.add_argument('-automation_sbmr_in_band_run', action='store_true', help='Check if SBMR is enabled')
     parser.add_argument('-sbmr_level', action='store_true', help='Get SBMR ACS level')
+    parser.add_argument('--export-shell', action='store_true',
+                        help='Print every setting as sourceable shell variables')
+    parser.add_argument('--cache', default=None,
+                        help='Reuse --export-shell output cached here while the config is unchanged')
 
     args = parser.parse_args()
 
+    if args.export_shell:
+        text = exported_shell(args.config, args.cache)
+        if text:
+            print(text, end='')
+        return
+
     config = read_config(args.config)
     if not config:
         return